@@ -0,0 +1,268 @@
+"""
+Answer-scoring engine for Interview Practice.  An answer is compared with the
+question's sample answer by TF-IDF cosine similarity, checked separately for
+each STAR section (Situation, Task, Action, Result) and for length, and the
+three are combined into a 0-100 score according to a ``Rubric``.
+
+Term weights are fitted per question list (the behavioural list or one
+role's technical list): the first answer scored against a list builds a
+matrix of unit reference vectors over that list's vocabulary only, so
+scoring never decodes the rest of the compiled bank.
+``AnswerScorer.score_batch`` groups answers by list and scores each group
+with array operations, so historical answers can be re-graded whenever the
+rubric changes:
+
+    python answer_scoring.py answers.csv --out graded.csv
+
+The input CSV needs ``question_id`` and ``answer`` columns.
+"""
+
+import argparse
+import csv
+import functools
+import math
+import re
+import sys
+import threading
+from dataclasses import dataclass
+
+import numpy as np
+
+from question_bank import get_bank
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Words that signal each STAR section of a behavioural answer.
+STAR_CUES = {
+    "Situation": ("situation", "context", "background", "scenario", "setting"),
+    "Task": ("task", "goal", "objective", "responsible", "responsibility", "needed", "challenge"),
+    "Action": ("action", "actions", "implemented", "decided", "organised", "organized",
+               "created", "built", "led", "approached", "steps"),
+    "Result": ("result", "results", "outcome", "achieved", "improved", "reduced",
+               "increased", "impact", "learned", "delivered"),
+}
+SECTIONS = tuple(STAR_CUES)
+_CUES = [frozenset(cues) for cues in STAR_CUES.values()]
+_ALL_CUES = frozenset().union(*_CUES)
+CACHED_CORPORA = 8
+# Answers vectorised at once; bounds the dense count matrix of a group.
+CHUNK_ANSWERS = 1024
+
+
+@dataclass(frozen=True)
+class Rubric:
+    min_words: int = 50
+    similarity_weight: float = 0.6
+    structure_weight: float = 0.3
+    length_weight: float = 0.1
+    # Below this cosine similarity the answer is flagged as off-topic; at
+    # ``full_similarity`` the content component earns full marks.
+    low_similarity: float = 0.15
+    full_similarity: float = 0.5
+
+
+@dataclass(frozen=True)
+class AnswerScore:
+    score: float
+    similarity: float
+    word_count: int
+    sections: dict
+    feedback: tuple
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _unit_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+class _Corpus:
+    """IDF weights and unit reference vectors of one question list.
+
+    Columns are the tokens of the list's sample answers plus the STAR cues,
+    so cue detection reads the same count matrix as the similarity.
+    """
+
+    def __init__(self, questions):
+        self.rows = {qid: i for i, qid in enumerate(questions)}
+        docs = [tokenize(entry["answer"]) for entry in questions.values()]
+        self.vocab = {}
+        for tokens in docs:
+            for token in tokens:
+                self.vocab.setdefault(token, len(self.vocab))
+        sampled = len(self.vocab)
+        # STAR cues count towards an answer's vector even if no sample uses them.
+        for cue in sorted(_ALL_CUES):
+            self.vocab.setdefault(cue, len(self.vocab))
+        self.cues = [np.array([self.vocab[c] for c in sorted(cues)]) for cues in _CUES]
+
+        counts = self.counts(docs)
+        df = np.count_nonzero(counts, axis=0)
+        n = len(docs)
+        self.idf = np.log((1 + n) / (1 + df)) + 1
+        self.idf[sampled:] = math.log(1 + n) + 1
+        self.refs = _unit_rows(counts * self.idf)
+
+    def counts(self, token_lists):
+        """Term-count matrix of ``token_lists`` over this list's vocabulary."""
+        vocab = self.vocab
+        flat = [i * len(vocab) + vocab[t]
+                for i, tokens in enumerate(token_lists) for t in tokens if t in vocab]
+        return np.bincount(np.asarray(flat, dtype=np.int64),
+                           minlength=len(token_lists) * len(vocab)
+                           ).reshape(len(token_lists), len(vocab)).astype(float)
+
+    def score(self, token_lists, qids):
+        """Return cosine similarities to the ``qids`` samples and STAR cue flags."""
+        counts = self.counts(token_lists)
+        vectors = _unit_rows(counts * self.idf)
+        refs = self.refs[[self.rows[qid] for qid in qids]]
+        similarity = np.einsum("ij,ij->i", vectors, refs)
+        sections = np.stack([counts[:, cols].any(axis=1) for cols in self.cues], axis=1)
+        return similarity, sections
+
+
+class AnswerScorer:
+    """TF-IDF scorer with reference vectors built per question list."""
+
+    def __init__(self, questions=None, rubric=Rubric()):
+        """``questions`` maps ID → entry and is scored as one list; by
+        default each question is scored within its list of the compiled bank."""
+        self.rubric = rubric
+        self._questions = questions
+        self._corpus = functools.lru_cache(maxsize=CACHED_CORPORA)(self._build_corpus)
+
+    def _build_corpus(self, name):
+        if self._questions is not None:
+            return _Corpus(self._questions)
+        return _Corpus(get_bank().section(name))
+
+    def _list_of(self, qid):
+        # Only the ID prefix is read here; an unknown ID within a known
+        # list raises KeyError once its group is scored.
+        return None if self._questions is not None else get_bank().section_of(qid)
+
+    def known(self, qid):
+        """Whether ``qid`` has a sample answer to score against."""
+        if self._questions is not None:
+            return qid in self._questions
+        try:
+            return qid in get_bank().section(get_bank().section_of(qid))
+        except KeyError:
+            return False
+
+    def score_batch(self, answers, qids, behavioural=None):
+        """Grade ``answers`` against the sample answers of ``qids``.
+
+        ``behavioural`` is a boolean per answer (default: IDs starting with
+        "beh-").  Returns a dict of NumPy arrays: ``score``, ``similarity``,
+        ``word_count`` and ``sections`` (n x 4 booleans in ``SECTIONS``
+        order).  Raises ``KeyError`` for an unknown question ID.
+        """
+        if behavioural is None:
+            behavioural = [qid.startswith("beh-") for qid in qids]
+        behavioural = np.asarray(behavioural, dtype=bool)
+        similarity = np.zeros(len(answers))
+        sections = np.zeros((len(answers), len(SECTIONS)), dtype=bool)
+        groups = {}
+        for i, qid in enumerate(qids):
+            groups.setdefault(self._list_of(qid), []).append(i)
+        for name, indices in groups.items():
+            corpus = self._corpus(name)
+            for start in range(0, len(indices), CHUNK_ANSWERS):
+                chunk = indices[start:start + CHUNK_ANSWERS]
+                similarity[chunk], sections[chunk] = corpus.score(
+                    [tokenize(answers[i]) for i in chunk], [qids[i] for i in chunk])
+        words = np.array([len(a.split()) for a in answers], dtype=np.int64)
+
+        r = self.rubric
+        length = np.minimum(words / r.min_words, 1.0)
+        structure = np.where(behavioural, sections.mean(axis=1), 1.0)
+        score = 100 * (r.similarity_weight * np.minimum(similarity / r.full_similarity, 1.0)
+                       + r.structure_weight * structure
+                       + r.length_weight * length)
+        return {"score": score, "similarity": similarity, "word_count": words, "sections": sections}
+
+    def score(self, answer, qid, behavioural=None):
+        """Grade one answer and return an ``AnswerScore`` with feedback."""
+        behavioural = qid.startswith("beh-") if behavioural is None else behavioural
+        result = self.score_batch([answer], [qid], [behavioural])
+        sections = dict(zip(SECTIONS, map(bool, result["sections"][0])))
+        similarity = float(result["similarity"][0])
+        words = int(result["word_count"][0])
+
+        feedback = []
+        if words < self.rubric.min_words:
+            feedback.append("Your answer seems short; try elaborating more.")
+        if behavioural:
+            missing = [name for name, present in sections.items() if not present]
+            if missing:
+                feedback.append(
+                    "Consider using the STAR structure: describe the "
+                    + _join_names(missing) + " explicitly."
+                )
+        if similarity < self.rubric.low_similarity:
+            feedback.append(
+                "Your answer covers few of the points in the sample answer; "
+                "compare it with the guideline above."
+            )
+        if not feedback:
+            feedback.append("Great job! Your answer covers the key points.")
+        return AnswerScore(float(result["score"][0]), similarity, words, sections, tuple(feedback))
+
+
+def _join_names(names):
+    return names[0] if len(names) == 1 else ", ".join(names[:-1]) + " and " + names[-1]
+
+
+_scorer = None
+_scorer_lock = threading.Lock()
+
+
+def get_scorer():
+    """Return the process-wide scorer; reference vectors are built per list on use."""
+    global _scorer
+    with _scorer_lock:
+        if _scorer is None:
+            _scorer = AnswerScorer()
+        return _scorer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Re-grade stored interview answers.")
+    parser.add_argument("answers", help="CSV with question_id and answer columns")
+    parser.add_argument("--out", default="-", help="output CSV (default: stdout)")
+    parser.add_argument("--min-words", type=int, default=Rubric.min_words)
+    args = parser.parse_args(argv)
+
+    with open(args.answers, newline="", encoding="utf-8") as fh:
+        rows = list(csv.DictReader(fh))
+    if rows and not {"question_id", "answer"} <= set(rows[0]):
+        parser.error(f"{args.answers}: needs question_id and answer columns")
+    scorer = AnswerScorer(rubric=Rubric(min_words=args.min_words))
+    unknown = sorted({r["question_id"] for r in rows if not scorer.known(r["question_id"])})
+    if unknown:
+        parser.error(f"{args.answers}: unknown question_id {', '.join(unknown[:10])}"
+                     + (f" and {len(unknown) - 10} more" if len(unknown) > 10 else ""))
+    result = scorer.score_batch([r["answer"] for r in rows], [r["question_id"] for r in rows])
+
+    out = sys.stdout if args.out == "-" else open(args.out, "w", newline="", encoding="utf-8")
+    fields = list(rows[0]) if rows else ["question_id", "answer"]
+    writer = csv.DictWriter(out, fieldnames=fields + ["score", "similarity", "word_count",
+                                                      *(s.lower() for s in SECTIONS)])
+    writer.writeheader()
+    for i, row in enumerate(rows):
+        row.update(score=f"{result['score'][i]:.1f}", similarity=f"{result['similarity'][i]:.3f}",
+                   word_count=int(result["word_count"][i]))
+        row.update({s.lower(): bool(result["sections"][i][j]) for j, s in enumerate(SECTIONS)})
+        writer.writerow(row)
+    if out is not sys.stdout:
+        out.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Bounded per-session storage of interview practice answers.  Answers used to
+live in ``st.session_state`` as a plain dict for the whole session, so memory
+grew with every answer of every long-lived session.  ``SessionAnswers`` keeps
+at most ``max_bytes`` of answer text in memory per session, in
+least-recently-used order; older answers are compressed into a process-wide
+SQLite ``AnswerSpill`` and read back on demand.  The answer text held in
+memory by all sessions and the number of live sessions are published as the
+``answer_memory_bytes`` and ``answer_sessions`` gauges, and a session's
+spilled answers are deleted when Streamlit drops it.
+"""
+
+import collections
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+import zlib
+
+import rerun_metrics
+
+DEFAULT_PATH = "answer_spill.db"
+DEFAULT_MAX_BYTES = 64 * 1024
+STALE_AFTER = 7 * 86400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    session TEXT NOT NULL,
+    role TEXT NOT NULL,
+    question_id TEXT NOT NULL,
+    body BLOB NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (session, role, question_id)
+) WITHOUT ROWID;
+"""
+
+
+class AnswerSpill:
+    """Disk store for answers evicted from session memory."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # Sessions of a crashed process never release their rows.
+        self.purge(STALE_AFTER)
+
+    def put(self, session, role, question_id, text):
+        body = zlib.compress(text.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?)",
+                (session, role, question_id, body, time.time()))
+
+    def get(self, session, role, question_id):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM answers WHERE session = ? AND role = ? AND question_id = ?",
+                (session, role, question_id)).fetchone()
+        return None if row is None else zlib.decompress(row[0]).decode("utf-8")
+
+    def delete(self, session, role=None, question_id=None):
+        with self._lock:
+            if role is None:
+                self._conn.execute("DELETE FROM answers WHERE session = ?", (session,))
+            else:
+                self._conn.execute(
+                    "DELETE FROM answers WHERE session = ? AND role = ? AND question_id = ?",
+                    (session, role, question_id))
+
+    def purge(self, older_than):
+        """Delete answers not written for ``older_than`` seconds."""
+        with self._lock:
+            self._conn.execute("DELETE FROM answers WHERE updated_at < ?", (time.time() - older_than,))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_totals_lock = threading.Lock()
+_totals = {"bytes": 0, "sessions": 0}
+
+
+def _track(memory_bytes=0, sessions=0):
+    """Adjust the process-wide answer gauges by the given deltas."""
+    with _totals_lock:
+        _totals["bytes"] += memory_bytes
+        _totals["sessions"] += sessions
+        rerun_metrics.set_gauge("answer_memory_bytes", _totals["bytes"])
+        rerun_metrics.set_gauge("answer_sessions", _totals["sessions"])
+
+
+def _release(spill, session, published):
+    _track(-published[0], -1)
+    try:
+        spill.delete(session)
+    except sqlite3.ProgrammingError:
+        # The spill was closed at interpreter shutdown.
+        pass
+
+
+class SessionAnswers:
+    """One session's answers by (role, question ID), capped in memory."""
+
+    def __init__(self, spill, max_bytes=DEFAULT_MAX_BYTES):
+        self.session = uuid.uuid4().hex[:12]
+        self._spill = spill
+        self._max_bytes = max_bytes
+        self._memory = collections.OrderedDict()
+        self._spilled = set()
+        self._answered = collections.defaultdict(set)
+        self.memory_bytes = 0
+        # Bytes last added to the process-wide gauge, shared with the finalizer.
+        self._published = [0]
+        _track(sessions=1)
+        weakref.finalize(self, _release, spill, self.session, self._published)
+
+    @staticmethod
+    def _size(text):
+        return len(text.encode("utf-8"))
+
+    def put(self, role, question_id, text):
+        key = (role, question_id)
+        if key in self._memory:
+            self.memory_bytes -= self._size(self._memory.pop(key))
+        elif key in self._spilled:
+            self._spilled.discard(key)
+            self._spill.delete(self.session, role, question_id)
+        self._memory[key] = text
+        self.memory_bytes += self._size(text)
+        self._answered[role].add(question_id)
+        self._evict()
+
+    def get(self, role, question_id, default=None):
+        key = (role, question_id)
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if key not in self._spilled:
+            return default
+        text = self._spill.get(self.session, role, question_id)
+        if text is None:
+            return default
+        self.put(role, question_id, text)
+        return text
+
+    def answered(self, role):
+        """Number of distinct questions answered for ``role``."""
+        return len(self._answered.get(role, ()))
+
+    def _evict(self):
+        # The newest answer always stays in memory, even above the cap.
+        while self.memory_bytes > self._max_bytes and len(self._memory) > 1:
+            (role, question_id), text = self._memory.popitem(last=False)
+            self._spill.put(self.session, role, question_id, text)
+            self._spilled.add((role, question_id))
+            self.memory_bytes -= self._size(text)
+            rerun_metrics.inc("answer_evictions_total")
+        _track(self.memory_bytes - self._published[0])
+        self._published[0] = self.memory_bytes
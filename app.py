@@ -1,14 +1,14 @@
-
 import streamlit as st
-import pandas as pd
+import atexit
+import functools
 import json
-from oauth2client.service_account import ServiceAccountCredentials
-import gspread
-from datetime import datetime
+from collections.abc import Mapping
 
-# Import comprehensive interview question data for each role. This module
-# provides 50 behavioural and 50 technical interview questions per role.
-from interview_questions_data import interview_questions
+from progress_log import ProgressRecord
+from render_cache import RenderCache
+from role_catalog import CATALOG, count
+from rerun_metrics import span
+import rerun_metrics
 
 st.set_page_config(page_title="Brainyscout Skill Gap Tracker", layout="wide")
 
@@ -71,95 +71,144 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-# Google Sheets Integration
-scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
-creds_dict = json.loads(st.secrets["GCP_CREDENTIALS"])
-creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, scope)
-client = gspread.authorize(creds)
-sheet = client.open_by_url("https://docs.google.com/spreadsheets/d/13W17_W3rSIvWCSuYDLo-RX__y365UA7SECB5vOTZ9xs/edit?usp=sharing").sheet1
-
-# Role → Skills → Course links
-roles = {
-    "QA Analyst": {
-        "skills": {
-            "Test case design": "https://imp.i384100.net/EEdv6e",
-            "Manual testing": "https://www.udemy.com/course/learn-manual-software-testing-with-live-project-jira-tool/?couponCode=MT80825B",
-            "Bug reporting (JIRA)": "https://www.udemy.com/course/learn-manual-software-testing-with-live-project-jira-tool/?couponCode=MT80825B",
-            "SQL for data validation": "https://imp.i384100.net/APMX1K",
-            "Functional testing": "https://www.udemy.com/course/functional-software-testing-interview-bootcamp-land-the-job/?couponCode=MT80825B",
-            "Regression testing": "https://www.youtube.com/watch?v=0wHKVXbsppw&pp=ygUTcmVncmVzc2lvbiB0ZXN0aW5nIA%3D%3D",
-            "SDLC knowledge": "https://www.youtube.com/watch?v=xNwtCtxfSuM",
-            "Communication skills": "https://imp.i384100.net/JKdyNr"
-        }
-    },
-    "QA Automation Engineer": {
-        "skills": {
-            "Python": "https://imp.i384100.net/K0d3v7",
-            "Selenium/WebDriver": "https://www.udemy.com/course/selenium-real-time-examplesinterview-questions/",
-            "API Testing (Postman)": "https://imp.i384100.net/dOJjYK",
-            "TestNG/PyTest": "https://www.udemy.com/course/python-automation-pytest/",
-            "CI/CD with Jenkins": "https://imp.i384100.net/raNoqj",
-            "Version Control (Git)": "https://www.codecademy.com/learn/learn-git",
-            "BDD (Cucumber/Gherkin)": "https://www.udemy.com/course/python-automation-pytest/?couponCode=MT80825B",
-            
-        }
-    },
-    "Software Developer": {
-        "skills": {
-            "Data Structures & Algorithms": "https://imp.i384100.net/e1ZP21",
-            "OOP (Java/Python/C#)": "https://www.youtube.com/watch?v=iLRZi0Gu8Go&pp=ygUUT09QIChKYXZhL1B5dGhvbi9DIyk%3D",
-            "HTML/CSS/JavaScript": "https://www.freecodecamp.org/learn/",
-            "SQL/NoSQL": "https://www.youtube.com/watch?v=sDtnlPdqwWI&pp=ygUcU1FML05vU1FMIHNvZnR3YXJlIGRldmVsb3Blcg%3D%3D",
-            "REST APIs": "https://www.udacity.com/course/api-development-and-documentation--ud805",
-            "Git/GitHub": "https://imp.i384100.net/POdN5Q",
-            "Unit Testing": "https://www.youtube.com/watch?v=vZm0lHciFsQ&pp=ygUUdW5pdCB0ZXN0aW5nIGluIGphdmE%3D",
-            "Agile Development": "https://imp.i384100.net/6yM51Q"
-        }
-    },
-    "Data Engineer": {
-        "skills": {
-            "SQL & NoSQL": "https://mode.com/sql-tutorial/",
-            "ETL pipelines": "https://www.youtube.com/watch?v=T23Bs75F7ZQ&pp=ygUjZXRsLWFuZC1kYXRhLXBpcGVsaW5lcy13aXRoLXB5dGhvbi8%3D",
-            "Python/Scala": "https://imp.i384100.net/2a09e0",
-            "Big Data (Spark, Hadoop)": "https://www.youtube.com/watch?v=ouGO3Up7aWE&pp=ygUYQmlnIERhdGEgKFNwYXJrLCBIYWRvb3Ap",
-            "Data Warehousing": "https://www.youtube.com/watch?v=HKcEyHF1U00&pp=ygUQRGF0YSBXYXJlaG91c2luZw%3D%3D",
-            "Cloud (AWS/GCP/Azure)": "https://www.udemy.com/course/the-complete-introduction-to-cloud-with-aws-azure-and-gcp/?couponCode=MT80825B",
-            "Apache Airflow": "https://www.udemy.com/course/the-complete-hands-on-course-to-master-apache-airflow/",
-            "Data Modeling": "https://www.udemy.com/course/data-warehouse-the-ultimate-guide/"
-        }
-    },
-    "Data Analyst": {
-        "skills": {
-            "SQL": "https://www.udemy.com/course/sql-for-data-analytics/",
-            "Excel & Google Sheets": "https://imp.i384100.net/xL6Dvx",
-            "Tableau/Power BI": "https://imp.i384100.net/9LdaZ4",
-            "Python (Pandas, Numpy)": "https://imp.i384100.net/550P0b",
-            "A/B Testing": "https://www.youtube.com/watch?v=KZe0C0Qq4p0&pp=ygULQS9CIFRlc3RpbmfSBwkJrQkBhyohjO8%3D",
-            "Statistics": "https://www.youtube.com/watch?v=npgbI8KYvN8&pp=ygUXc3RhdGlzdGljcyBkYXRhIGFuYWx5c3Q%3D",
-            "Business Communication": "https://imp.i384100.net/kO2G20"
-        }
-    },
-    "Product Manager": {
-        "skills": {
-            "Strategic thinking": "https://imp.i384100.net/Dydzdb",
-            "Market research": "https://imp.i384100.net/9LdadE",
-            "User-centric design": "https://imp.i384100.net/raNoND",
-            "Technical documentation": "https://www.udemy.com/course/technical-writing/",
-            "Data analysis": "https://imp.i384100.net/550P0b",
-            "Agile product development": "https://www.youtube.com/watch?v=bQdwNN6i8aA&pp=ygUpQWdpbGUgcHJvZHVjdCBkZXZlbG9wbWVudCBwcm9kdWN0IG1hbmFnZXI%3D"
-        }
-    },
-    "Project Manager": {
-        "skills": {
-            "Project planning": "https://imp.i384100.net/aOGQGY",
-            "Agile methodology": "https://imp.i384100.net/GKd3d2",
-            "Risk management": "https://imp.i384100.net/Z6j3jz",
-            "Team communication": "https://www.youtube.com/watch?v=CJr1e2Lp5dI&pp=ygUiVGVhbSBjb21tdW5pY2F0aW9uIHByb2plY3QgbWFuYWdlcg%3D%3D",
-            "Budgeting and cost control": "https://www.youtube.com/watch?v=2H59thd0W2k&pp=ygUfL3Byb2plY3QtYnVkZ2V0aW5nLWNvc3QtY29udHJvbA%3D%3D",
-            "Project scheduling tools": "https://www.youtube.com/watch?v=nIFEaS2xmvg"
-        }
-    }
-}
+# Google Sheets Integration.  The authorised client and worksheet handle are
+# cached for the lifetime of the server process and shared by all sessions,
+# so reruns no longer pay for an OAuth exchange and a spreadsheet lookup.
+# Setting ``SHEETS_EMULATOR`` swaps in the in-process fake from
+# ``fake_sheets`` for offline benchmarking; a table value configures its
+# latency, quota and error injection.  Requests are paced to the per-minute
+# ``SHEETS_READ_QUOTA`` and ``SHEETS_WRITE_QUOTA`` and retried on 429s.
+@st.cache_resource
+def get_sheets_connection():
+    from quota_client import QuotaClient
+    from sheets_connection import SheetsConnection
+
+    quota = QuotaClient(read_quota=st.secrets.get("SHEETS_READ_QUOTA", 60),
+                        write_quota=st.secrets.get("SHEETS_WRITE_QUOTA", 60))
+    emulator = st.secrets.get("SHEETS_EMULATOR", False)
+    if emulator:
+        import fake_sheets
+
+        if isinstance(emulator, Mapping):
+            fake_sheets.default_server().configure(**emulator)
+        return SheetsConnection({}, authorize=fake_sheets.authorize, quota=quota)
+    return SheetsConnection(json.loads(st.secrets["GCP_CREDENTIALS"]), quota=quota)
+
+
+# Progress rows are written behind the render path: reruns hand records to a
+# shared background writer that drops records which would not change the
+# user's saved state, appends the rest to a durable local outbox and replays
+# the outbox to the sheet in ``append_rows`` batches.  Rows queued during an
+# outage or before a restart are sent once the sheet is reachable again.
+# Processes on one host share the outbox file; only the process holding its
+# replay lock drains it, and sent rows are purged after a week.
+# When several app processes share a host, ``PROGRESS_AGGREGATOR`` names the
+# ``write_aggregator`` daemon that batches and rate-limits for all of them;
+# the local writer then only takes events while the daemon is unreachable.
+# Either way nothing connects to Sheets until the first progress write,
+# unless the outbox still holds rows an earlier process left unsent; those
+# start the local writer at once so they are replayed without a new write.
+def _local_progress_writer():
+    from progress_outbox import Outbox, OutboxReplayer
+    from progress_writer import ProgressWriter
+    from quota_client import BACKGROUND
+
+    sheets = get_sheets_connection()
+    outbox = Outbox(_outbox_path())
+    replay_run = functools.partial(sheets.run, priority=BACKGROUND)
+    return ProgressWriter(outbox, OutboxReplayer(outbox, replay_run))
+
+
+def _outbox_path() -> str:
+    return st.secrets.get("PROGRESS_OUTBOX_PATH", "progress_outbox.db")
+
+
+@st.cache_resource
+def get_progress_writer():
+    from progress_writer import LazyProgressWriter
+
+    local = LazyProgressWriter(_local_progress_writer, _outbox_path())
+    aggregator = st.secrets.get("PROGRESS_AGGREGATOR")
+    if aggregator:
+        from write_aggregator import AggregatorClient
+
+        return AggregatorClient(aggregator, fallback=lambda: local)
+    return local
+
+
+# Progress storage backend.  ``PROGRESS_BACKEND`` selects where progress
+# lives: "sqlite" (the default) keeps an indexed local log and mirrors new
+# records to Google Sheets in the background unless
+# ``PROGRESS_MIRROR_TO_SHEETS`` is false; "sheets" keeps the worksheet as the
+# only store and serves reads from a Parquet copy of the log under
+# ``PROGRESS_CACHE_DIR`` that a background thread syncs incrementally, so a
+# login never waits on the sheet, with each user's latest
+# state indexed by email in ``PROGRESS_LATEST_PATH``.
+@st.cache_resource
+def get_progress_store():
+    from progress_store import BACKENDS, SheetsProgressStore, SQLiteProgressStore
+
+    backend = st.secrets.get("PROGRESS_BACKEND", "sqlite")
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown PROGRESS_BACKEND {backend!r}; expected one of {BACKENDS}")
+    if backend == "sheets":
+        from latest_state import LatestStateIndex
+        from quota_client import BACKGROUND
+        from sheet_sync import SheetSync
+
+        sheets = get_sheets_connection()
+        # Synced by the store's background thread, behind interactive requests.
+        sync = SheetSync(functools.partial(sheets.run, priority=BACKGROUND),
+                         st.secrets.get("PROGRESS_CACHE_DIR", "progress_cache"))
+        index = LatestStateIndex(st.secrets.get("PROGRESS_LATEST_PATH", "latest_state.db"))
+        store = SheetsProgressStore(sheets, get_progress_writer(), sync=sync, index=index)
+    else:
+        mirror = get_progress_writer() if st.secrets.get("PROGRESS_MIRROR_TO_SHEETS", True) else None
+        store = SQLiteProgressStore(st.secrets.get("PROGRESS_DB_PATH", "progress.db"), mirror=mirror)
+    atexit.register(store.close)
+    return store
+
+
+# Metrics export.  Section timings and storage counters are served in the
+# Prometheus text format on ``METRICS_PORT`` and/or written to
+# ``METRICS_FILE`` every few seconds.  The endpoint listens on localhost
+# unless ``METRICS_HOST`` names another interface, e.g. "0.0.0.0".
+@st.cache_resource
+def start_metrics_export() -> None:
+    port = st.secrets.get("METRICS_PORT")
+    if port:
+        rerun_metrics.serve(int(port), host=st.secrets.get("METRICS_HOST", rerun_metrics.DEFAULT_HOST))
+    path = st.secrets.get("METRICS_FILE")
+    if path:
+        rerun_metrics.dump_periodically(path)
+
+
+start_metrics_export()
+
+
+# Cohort analytics for operators, aggregated over the whole progress log.
+# Results are cached for ``COHORT_TTL_SECONDS`` and refreshed incrementally.
+@st.cache_resource
+def get_cohort_analytics():
+    from cohort_analytics import CohortAnalytics
+
+    return CohortAnalytics(get_progress_store(), ttl=float(st.secrets.get("COHORT_TTL_SECONDS", 300)))
+
+# Rendered gap lists and course tables, shared by all sessions.  Course links
+# that ``link_checker`` recorded as dead in ``LINK_STATUS_PATH`` are flagged
+# or, with ``DEAD_LINKS = "hide"``, shown without their URL.
+@st.cache_resource
+def get_fragments() -> RenderCache:
+    from link_checker import LinkStatus
+
+    links = LinkStatus(st.secrets.get("LINK_STATUS_PATH", "link_status.json"),
+                       mode=st.secrets.get("DEAD_LINKS", "flag"))
+    return RenderCache(links=links)
+
+# Role → Skills → Course links.  The catalog lives in ``roles_data`` and is
+# compiled once per process by ``role_catalog`` into skill IDs and per-role
+# bitmasks, so gap and progress calculations below are bit operations.
+catalog = CATALOG
 
 # -----------------------------------------------------------------------------
 # Interview practice questions and sample answers.  Behavioural questions use
@@ -167,9 +216,9 @@ roles = {
 # Technical questions cover general topics across roles.  Users can practise
 # answering these questions, view a sample guideline, and receive simple
 # feedback based on answer length and structure.
-# The old placeholder interview_questions dictionary has been removed. The
-# comprehensive per-role interview question data is imported from
-# interview_questions_data.
+# The per-role questions come from the compiled bank built from
+# interview_questions_data (see ``question_bank``); only the sections of the
+# roles actually practised are decoded.
 
 # -----------------------------------------------------------------------------
 # Main page title and description
@@ -203,11 +252,29 @@ if not email:
     # will render until the user supplies an email.
     st.stop()
 
+# Storage is only opened once there is a user to read and write progress for,
+# so the email prompt paints without it.
+with span("storage_setup"):
+    progress_store = get_progress_store()
+
+# Restore the user's saved progress once per email.  ``latest`` is an indexed
+# lookup in every backend, so this stays cheap however long the log grows.
+if st.session_state.get("restored_email") != email:
+    with span("restore_progress"):
+        st.session_state["saved_progress"] = {
+            role: list(rec.completed) for role, rec in progress_store.latest(email).items()
+        }
+    st.session_state["restored_email"] = email
+    # Drop checkbox state left over from a previous email in this session.
+    for key in [k for k in st.session_state if k.startswith(("sidebar_known_", "prog_"))]:
+        del st.session_state[key]
+    st.session_state.pop("role", None)
+
 # Role selection in sidebar.  Use a placeholder option so that no role is
 # pre-selected by default.  The list begins with a prompt followed by
 # all available roles.  When the placeholder is chosen, the rest of the
 # application will not proceed until the user selects a real role.
-role_options = ["Select Role"] + list(roles.keys())
+role_options = ["Select Role"] + list(catalog.role_names)
 selected_role = st.sidebar.selectbox("Select Role", role_options, index=0)
 
 # If the user has not selected a real role yet (i.e. the placeholder is
@@ -217,11 +284,13 @@ if selected_role == "Select Role":
     st.sidebar.warning("Please select a role to continue.")
     st.stop()
 
-all_skills = list(roles[selected_role]["skills"].keys())
+all_skills = catalog.skill_names(selected_role)
 
-# Initialise session state for completed skills when the role changes
+# Initialise session state for completed skills when the role changes, starting
+# from the user's saved progress for that role.
 if "completed_skills" not in st.session_state or st.session_state.get("role") != selected_role:
-    st.session_state["completed_skills"] = []
+    st.session_state["completed_skills"] = list(
+        st.session_state["saved_progress"].get(selected_role, []))
     st.session_state["role"] = selected_role
 
 # -----------------------------------------------------------------------------
@@ -233,26 +302,32 @@ if "completed_skills" not in st.session_state or st.session_state.get("role") !=
 
 # Build a list of known skills based on checkbox selections in the sidebar.
 checkbox_known_skills: list[str] = []
-for skill in all_skills:
-    # Use a unique key per role and skill to preserve individual checkbox state
-    chk_key = f"sidebar_known_{selected_role}_{skill}"
-    checked = st.sidebar.checkbox(
-        label=skill,
-        value=(skill in st.session_state.get("completed_skills", [])),
-        key=chk_key
-    )
-    if checked:
-        checkbox_known_skills.append(skill)
+saved_mask = catalog.mask_of(st.session_state.get("completed_skills", []), selected_role)
+with span("sidebar_skills"):
+    for skill in all_skills:
+        # Use a unique key per role and skill to preserve individual checkbox state
+        chk_key = f"sidebar_known_{selected_role}_{skill}"
+        checked = st.sidebar.checkbox(
+            label=skill,
+            value=catalog.has(saved_mask, skill),
+            key=chk_key
+        )
+        if checked:
+            checkbox_known_skills.append(skill)
 
 # Update session state when the selections differ
 if set(checkbox_known_skills) != set(st.session_state.get("completed_skills", [])):
     st.session_state["completed_skills"] = checkbox_known_skills
+st.session_state["saved_progress"][selected_role] = list(st.session_state["completed_skills"])
 
-# Determine missing skills based on current completed skills
-missing_skills_list = [s for s in all_skills if s not in st.session_state["completed_skills"]]
+# Determine missing skills based on current completed skills.  Both sets are
+# bitmasks over the catalog's skill IDs.
+completed_mask = catalog.mask_of(st.session_state["completed_skills"], selected_role)
+missing_mask = catalog.missing_mask(selected_role, completed_mask)
+missing_skills_list = catalog.names_of(selected_role, missing_mask)
 
 # -----------------------------------------------------------------------------
-# Automatically record the user's selections to Google Sheets if they have
+# Automatically record the user's selections to the progress store if they have
 # provided an email address.  This allows progress to persist without
 # requiring the user to explicitly click "Save Progress".  Each record
 # includes a timestamp, the user's email, their selected role, the skills
@@ -265,62 +340,45 @@ if email:
     # only reached when the user has chosen a valid role.  Recording the
     # timestamped progress on each run provides a historical log of
     # selections.
-    try:
-        sheet.append_row([
-            datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+    # The store records the row without waiting on Google Sheets; rows
+    # identical to the last state recorded for this user and role are skipped.
+    with span("auto_record"):
+        progress_store.record(ProgressRecord.now(
             email,
             selected_role,
-            ", ".join(st.session_state["completed_skills"]),
-            ", ".join(missing_skills_list)
-        ])
-    except Exception:
-        # Silently ignore errors to avoid interrupting the UI.  This could
-        # happen if the sheet is temporarily unavailable.  The progress
-        # tracker will still attempt to save changes when the user clicks
-        # "Save Progress".
-        pass
+            st.session_state["completed_skills"],
+            missing_skills_list
+        ))
 
 # -----------------------------------------------------------------------------
-# Define dashboard tabs including Interview Practice
-tab_skill_checker, tab_learning_plan, tab_progress, tab_analytics, tab_interview = st.tabs(
-    ["Skill Checker", "Learning Plan", "Progress Tracker", "Analytics", "Interview Practice"]
-)
+# Dashboard views.  Each view is a function so that only the views actually
+# shown are executed and sent to the browser; see the dispatch below.
 
 # ----------------------- Skill Checker Tab ------------------------------
-with tab_skill_checker:
+def render_skill_checker():
     st.subheader("Missing Skills & Recommended Courses")
     if missing_skills_list:
-        # Build a list for missing skills and courses
-        for skill in missing_skills_list:
-            link = roles[selected_role]["skills"][skill]
-            st.markdown(f"- **{skill}** -> [Course Link]({link})")
+        # The list of missing skills and courses is shared by every session
+        # with the same gap; see ``render_cache``.
+        st.markdown(get_fragments().skill_gaps(selected_role, completed_mask))
     else:
         st.success("You have all the skills for this role!")
 
 # ----------------------- Learning Plan Tab -----------------------------
-with tab_learning_plan:
+def render_learning_plan():
     st.subheader("Full Learning Plan for Selected Role")
-    # Construct a markdown table of all skills and their courses for the role
-    lp_rows = ""
-    for skill, link in roles[selected_role]["skills"].items():
-        lp_rows += f"| {skill} | [Link]({link}) |\n"
-    lp_table = "| Skill | Course |\n| --- | --- |\n" + lp_rows
-    st.markdown(lp_table, unsafe_allow_html=True)
+    # Markdown table of all skills and their courses for the role
+    st.markdown(get_fragments().learning_plan(selected_role), unsafe_allow_html=True)
 
     # Personalised learning path based on missing skills
     st.subheader("Personalised Learning Path")
     if missing_skills_list:
-        path_rows = ""
-        for idx, skill in enumerate(missing_skills_list, start=1):
-            link = roles[selected_role]["skills"][skill]
-            path_rows += f"| Step {idx} | {skill} | [Link]({link}) |\n"
-        path_table = "| Step | Skill | Course |\n| --- | --- | --- |\n" + path_rows
-        st.markdown(path_table, unsafe_allow_html=True)
+        st.markdown(get_fragments().learning_path(selected_role, completed_mask), unsafe_allow_html=True)
     else:
         st.success("No missing skills – you're all set!")
 
 # ----------------------- Progress Tracker Tab ---------------------------
-with tab_progress:
+def render_progress_tracker():
     st.subheader("Skill Progress Tracker")
     st.markdown(
         "Use the checkboxes below to mark skills as completed. "
@@ -329,60 +387,98 @@ with tab_progress:
     # Collect new completed skills based on checkboxes
     new_completed = []
     for skill in all_skills:
-        checked = st.checkbox(
-            label=skill,
-            value=(skill in st.session_state["completed_skills"]),
-            key=f"prog_{selected_role}_{skill}"
-        )
+        prog_key = f"prog_{selected_role}_{skill}"
+        # Once the checkbox has state of its own (kept across view switches
+        # below), let that state win instead of passing a default value.
+        default = {} if prog_key in st.session_state else {
+            "value": catalog.has(completed_mask, skill)
+        }
+        checked = st.checkbox(label=skill, key=prog_key, **default)
         if checked:
             new_completed.append(skill)
     # Save progress button
     if st.button("Save Progress"):
         # Update session state
         st.session_state["completed_skills"] = new_completed
+        st.session_state["saved_progress"][selected_role] = list(new_completed)
         # Recalculate missing skills after update
-        missing_skills_list = [s for s in all_skills if s not in new_completed]
-        # Append progress to Google Sheets if email is provided
+        new_mask = catalog.mask_of(new_completed, selected_role)
+        missing_after_save = catalog.names_of(selected_role, catalog.missing_mask(selected_role, new_mask))
+        # Record progress in the configured store if email is provided
         if email:
-            sheet.append_row([
-                datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            progress_store.record(ProgressRecord.now(
                 email,
                 selected_role,
-                ", ".join(new_completed),
-                ", ".join(missing_skills_list)
-            ])
+                new_completed,
+                missing_after_save
+            ))
         st.success("Progress saved.")
-    # Display completed vs pending skills as a table
-    progress_rows = ""
-    for skill in all_skills:
-        status = "Completed" if skill in st.session_state["completed_skills"] else "Pending"
-        progress_rows += f"| {skill} | {status} |\n"
-    progress_table = "| Skill | Status |\n| --- | --- |\n" + progress_rows
-    st.markdown(progress_table, unsafe_allow_html=True)
+    # Display completed vs pending skills as a table.  The mask is rebuilt
+    # here because "Save Progress" may just have changed the completed set.
+    saved = catalog.mask_of(st.session_state["completed_skills"], selected_role)
+    st.markdown(get_fragments().progress_table(selected_role, saved), unsafe_allow_html=True)
     # Display summary counts
     st.markdown(
-        f"**Summary:** {len(st.session_state['completed_skills'])} completed, "
-        f"{len([s for s in all_skills if s not in st.session_state['completed_skills']])} pending"
+        f"**Summary:** {count(saved)} completed, "
+        f"{count(catalog.missing_mask(selected_role, saved))} pending"
     )
 
 # ----------------------- Analytics Tab --------------------------------
-with tab_analytics:
+def render_analytics():
     st.subheader("Learning Analytics")
     st.markdown(
         "Visualise your progress: compare the number of completed skills "
         "with those still pending."
     )
     # Prepare data for bar chart
-    completed_count = len(st.session_state.get("completed_skills", []))
-    pending_count = len(all_skills) - completed_count
+    completed_count = count(completed_mask)
+    pending_count = count(missing_mask)
+    import pandas as pd
+
     analytics_df = pd.DataFrame({
         "Status": ["Completed", "Pending"],
         "Count": [completed_count, pending_count]
     }).set_index("Status")
     st.bar_chart(analytics_df)
 
+    # Operators listed in ``OPERATOR_EMAILS`` also see cohort-wide gaps.
+    if email in st.secrets.get("OPERATOR_EMAILS", []):
+        render_cohort_analytics()
+
+
+def render_cohort_analytics():
+    summary = get_cohort_analytics().summary()
+    st.subheader("Cohort Skill Gaps")
+    st.markdown(f"Latest state of **{summary.users}** users across all roles.")
+    st.markdown("**Share of users missing each skill (%)**")
+    st.dataframe(summary.heatmap.mul(100).round(1).dropna(axis=1, how="all"))
+    st.markdown("**Completion distribution (users per bucket)**")
+    st.bar_chart(summary.distribution)
+    st.markdown("**Completion percentiles per role**")
+    st.dataframe(summary.percentiles.mul(100).round(1))
+
 # ----------------------- Interview Practice Tab ---------------------------
-with tab_interview:
+# Interview answers are held per session up to ``ANSWER_MEMORY_BYTES``; the
+# least recently used ones are compressed into ``ANSWER_SPILL_PATH``.
+@st.cache_resource
+def get_answer_spill():
+    from answer_store import AnswerSpill
+
+    spill = AnswerSpill(st.secrets.get("ANSWER_SPILL_PATH", "answer_spill.db"))
+    atexit.register(spill.close)
+    return spill
+
+
+def get_session_answers():
+    if "session_answers" not in st.session_state:
+        from answer_store import DEFAULT_MAX_BYTES, SessionAnswers
+
+        st.session_state["session_answers"] = SessionAnswers(
+            get_answer_spill(), st.secrets.get("ANSWER_MEMORY_BYTES", DEFAULT_MAX_BYTES))
+    return st.session_state["session_answers"]
+
+
+def render_interview_practice():
     st.subheader("Interview Practice")
     st.markdown(
         "Select a type of question (behavioural or technical), practise your "
@@ -390,59 +486,76 @@ with tab_interview:
         "structured using the STAR method (Situation, Task, Action, Result) as "
         "recommended for interview responses【892174856631884†L139-L159】."
     )
+    from question_bank import get_bank as get_question_bank
+
+    question_bank = get_question_bank()
 
     # Allow the user to choose behavioural or technical questions
     # Allow the user to choose between behavioural and technical questions.
     # Categories are consistent across roles and align with the imported data structure.
     categories = ["Behavioral", "Technical"]
-    category = st.selectbox("Interview Question Type", categories)
-    # Retrieve the list of question dictionaries for the selected role and category
-    questions = interview_questions[selected_role][category]
-    question_texts = [q["question"] for q in questions]
-    selected_question = st.selectbox("Select a question to practise", question_texts)
+    category = st.selectbox("Interview Question Type", categories, key="interview_category")
+    # Optional full-text search narrows the questions offered below to the
+    # best BM25 matches for this role and category.
+    search_query = st.text_input(
+        "Search questions", "", key="interview_search",
+        placeholder="e.g. SQL joins, conflict, deadline"
+    )
+    if search_query.strip():
+        from question_search import get_index as get_question_index
+
+        question_options = get_question_index().search(
+            search_query, role=selected_role, category=category, limit=50
+        )
+        if not question_options:
+            st.info("No questions match your search; showing all questions.")
+            question_options = list(question_bank.ids(selected_role, category))
+    else:
+        question_options = list(question_bank.ids(selected_role, category))
+
+    # The selectbox works on stable question IDs from the prebuilt per-role,
+    # per-category index; the question text is only used for display.
+    selected_id = st.selectbox(
+        "Select a question to practise", question_options,
+        format_func=lambda qid: question_bank.get(qid)["question"],
+        key=f"interview_question_{selected_role}_{category}"
+    )
     # Retrieve the selected question and sample answer
-    question_obj = next(q for q in questions if q["question"] == selected_question)
-    st.markdown(f"**Question:** {selected_question}")
+    question_obj = question_bank.get(selected_id)
+    st.markdown(f"**Question:** {question_obj['question']}")
     st.markdown(f"**Sample Answer (Guideline):** {question_obj['answer']}")
 
     # Text area for the user's answer
-    user_answer = st.text_area("Your Answer", "", height=150)
+    user_answer = st.text_area("Your Answer", "", height=150, key="interview_answer")
 
     # Container for feedback messages
     if st.button("Submit Answer"):
-        # Basic evaluation criteria: length and use of STAR keywords for behavioural questions
-        feedback_messages = []
-        word_count = len(user_answer.split())
-        if word_count < 50:
-            feedback_messages.append("Your answer seems short; try elaborating more.")
-        # Check for STAR method keywords in behavioural answers
-        if category == "Behavioral":
-            star_keywords = ["situation", "task", "action", "result"]
-            star_used = any(k in user_answer.lower() for k in star_keywords)
-            if not star_used:
-                feedback_messages.append(
-                    "Consider using the STAR structure: describe the Situation, "
-                    "Task, Action and Result explicitly."
-                )
-        if not feedback_messages:
-            feedback_messages.append("Great job! Your answer covers the key points.")
+        with span("interview_feedback"):
+            from answer_scoring import get_scorer as get_answer_scorer
+
+            # Score the answer against the sample answer (TF-IDF similarity),
+            # each STAR section for behavioural questions, and length.
+            result = get_answer_scorer().score(
+                user_answer, selected_id, behavioural=(category == "Behavioral")
+            )
         # Display feedback
-        for msg in feedback_messages:
+        st.metric("Answer score", f"{result.score:.0f} / 100")
+        for msg in result.feedback:
             st.success(msg)
-        # Save the user's answer in session state for progress tracking
-        # Save the user's answer in session state for progress tracking
-        st.session_state.setdefault("interview_answers", {})
-        # Ensure answers are stored per role
-        st.session_state["interview_answers"].setdefault(selected_role, {})
-        st.session_state["interview_answers"][selected_role][selected_question] = user_answer
+        # Save the user's answer for progress tracking.  Answers are keyed by
+        # role and question ID so they survive rewording; older answers move
+        # to disk once the session's memory cap is reached.
+        get_session_answers().put(selected_role, selected_id, user_answer)
 
     # Display progress summary for interview practice
     # Compute progress for the selected role. Total questions is the sum of behavioural
     # and technical questions for that role.
-    total_questions = len(interview_questions[selected_role]["Behavioral"]) + len(interview_questions[selected_role]["Technical"])
-    answered_count = len(st.session_state.get("interview_answers", {}).get(selected_role, {}))
+    total_questions = question_bank.count(selected_role, "Behavioral") + question_bank.count(selected_role, "Technical")
+    answered_count = get_session_answers().answered(selected_role)
     st.markdown(f"You have answered {answered_count} out of {total_questions} interview questions for the {selected_role} role.")
     # Simple bar chart to visualise interview practice progress
+    import pandas as pd
+
     interview_prog_df = pd.DataFrame({
         "Status": ["Answered", "Unanswered"],
         "Count": [answered_count, total_questions - answered_count]
@@ -450,6 +563,42 @@ with tab_interview:
     st.bar_chart(interview_prog_df)
 
 
+# -----------------------------------------------------------------------------
+# View dispatch.  By default (``TAB_MODE = "active"``) a horizontal selector
+# replaces ``st.tabs`` and only the selected view runs, so per-rerun work and
+# websocket payload scale with the visible view rather than the whole app.
+# ``TAB_MODE = "all"`` restores classic tabs, which execute every body.
+VIEWS = {
+    "Skill Checker": ("tab_skill_checker", render_skill_checker),
+    "Learning Plan": ("tab_learning_plan", render_learning_plan),
+    "Progress Tracker": ("tab_progress", render_progress_tracker),
+    "Analytics": ("tab_analytics", render_analytics),
+    "Interview Practice": ("tab_interview", render_interview_practice),
+}
+
+# Streamlit drops the state of widgets that are not rendered in a rerun.
+# Re-assigning the state of view widgets marks it as user state, so unsaved
+# checkbox changes, the chosen question and answer drafts survive switching
+# to another view and back.
+VIEW_WIDGET_PREFIXES = (
+    "prog_", "interview_category", "interview_question_", "interview_answer", "interview_search"
+)
+for widget_key in list(st.session_state.keys()):
+    if widget_key.startswith(VIEW_WIDGET_PREFIXES):
+        st.session_state[widget_key] = st.session_state[widget_key]
+
+if st.secrets.get("TAB_MODE", "active") == "all":
+    for container, (section, render) in zip(st.tabs(list(VIEWS)), VIEWS.values()):
+        with container, span(section):
+            render()
+else:
+    active_view = st.radio(
+        "View", list(VIEWS), horizontal=True, key="active_view", label_visibility="collapsed"
+    )
+    section, render = VIEWS[active_view]
+    with span(section):
+        render()
+
 # -----------------------------------------------------------------------------
 # Footer branding
 st.markdown("---")
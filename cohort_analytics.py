@@ -0,0 +1,132 @@
+"""
+Cohort skill-gap analytics over the whole progress log.  Every row the app
+records carries (timestamp, email, role, completed, missing); the newest row
+per (email, role) is that user's current state for the role.
+``CohortAnalytics`` keeps those latest states as a boolean skill matrix in
+pandas and derives, with vectorised operations:
+
+* ``heatmap``: per role, the share of users missing each skill;
+* ``distribution``: how many users fall in each completion bucket per role;
+* ``percentiles``: completion percentiles per role.
+
+Results are cached for ``ttl`` seconds.  A refresh only pulls rows appended
+to the store since the previous refresh (``ProgressStore.tail``) and merges
+them into the latest-state matrix, so opening the dashboard never re-reads
+or re-aggregates the whole log.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from role_catalog import CATALOG
+
+PERCENTILES = (0.25, 0.5, 0.75, 0.9)
+BUCKETS = np.linspace(0, 1, 11)
+
+
+@dataclass(frozen=True)
+class CohortSummary:
+    users: int
+    heatmap: pd.DataFrame        # role x skill, share of users missing the skill
+    distribution: pd.DataFrame   # completion bucket x role, user counts
+    percentiles: pd.DataFrame    # role x percentile, completion ratio
+    refreshed_at: float
+
+
+class CohortAnalytics:
+    """Incrementally maintained cohort aggregates over a ``ProgressStore``."""
+
+    def __init__(self, store, catalog=CATALOG, ttl=300.0, batch_size=5000, clock=time.time):
+        self._store = store
+        self._catalog = catalog
+        self._ttl = ttl
+        self._batch_size = batch_size
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cursor = 0
+        self._skill_columns = list(catalog.skills)
+        self._latest = pd.DataFrame(
+            columns=["email", "role", "timestamp"] + self._skill_columns
+        ).set_index(["email", "role"])
+        self._summary = None
+
+    def summary(self):
+        """Return the cached ``CohortSummary``, refreshing it once ``ttl`` expires."""
+        with self._lock:
+            if self._summary is None or self._clock() - self._summary.refreshed_at >= self._ttl:
+                self._ingest()
+                self._summary = self._aggregate()
+            return self._summary
+
+    def _ingest(self):
+        while True:
+            records, cursor = self._store.tail(self._cursor, self._batch_size)
+            self._cursor = cursor
+            if records:
+                self._merge(records)
+            if len(records) < self._batch_size:
+                return
+
+    def _merge(self, records):
+        known = [r for r in records if r.role in self._catalog.roles]
+        if not known:
+            return
+        frame = pd.DataFrame({
+            "email": [r.email for r in known],
+            "role": [r.role for r in known],
+            "timestamp": [r.timestamp for r in known],
+        })
+        ids = self._catalog.skill_ids
+        completed = np.zeros((len(known), len(self._skill_columns)), dtype=bool)
+        for row, record in enumerate(known):
+            completed[row, [ids[s] for s in record.completed if s in ids]] = True
+        frame = pd.concat([frame, pd.DataFrame(completed, columns=self._skill_columns)], axis=1)
+        frame = (frame.sort_values("timestamp", kind="stable")
+                 .drop_duplicates(["email", "role"], keep="last")
+                 .set_index(["email", "role"]))
+        kept = self._latest[~self._latest.index.isin(frame.index)]
+        self._latest = pd.concat([kept, frame]) if len(kept) else frame
+
+    def _aggregate(self):
+        latest = self._latest
+        roles = list(self._catalog.role_names)
+        role_level = latest.index.get_level_values("role")
+        completed = latest[self._skill_columns].to_numpy(dtype=bool)
+
+        # Role membership matrix aligned with the skill columns.
+        required = np.zeros((len(roles), len(self._skill_columns)), dtype=bool)
+        for i, role in enumerate(roles):
+            required[i, list(self._catalog.roles[role].skill_ids)] = True
+        role_index = pd.Index(roles).get_indexer(role_level)
+        row_required = required[role_index] if len(latest) else required[:0]
+
+        missing = pd.DataFrame(row_required & ~completed, columns=self._skill_columns)
+        missing["role"] = role_level
+        heatmap = missing.groupby("role").mean().reindex(roles)
+        heatmap = heatmap.where(required)
+
+        done = (row_required & completed).sum(axis=1)
+        ratio = pd.Series(done / np.maximum(row_required.sum(axis=1), 1), index=role_level)
+        buckets = pd.cut(ratio, BUCKETS, include_lowest=True,
+                         labels=[f"{round(lo * 100)}-{round(hi * 100)}%" for lo, hi in zip(BUCKETS, BUCKETS[1:])])
+        distribution = (pd.crosstab(buckets, ratio.index, dropna=False)
+                        .reindex(columns=roles, fill_value=0) if len(ratio) else
+                        pd.DataFrame(0, index=buckets.cat.categories, columns=roles))
+        percentiles = (ratio.groupby(level=0).quantile(list(PERCENTILES)).unstack()
+                       .reindex(roles) if len(ratio) else
+                       pd.DataFrame(index=roles, columns=list(PERCENTILES), dtype=float))
+        percentiles.columns = [f"p{int(p * 100)}" for p in PERCENTILES]
+        distribution.index.name = "completion"
+        distribution.columns.name = "role"
+
+        return CohortSummary(
+            users=latest.index.get_level_values("email").nunique(),
+            heatmap=heatmap,
+            distribution=distribution,
+            percentiles=percentiles,
+            refreshed_at=self._clock(),
+        )
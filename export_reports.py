@@ -0,0 +1,369 @@
+"""
+Bulk export of per-user progress reports for coaches.  For every email in
+the progress log the export writes a CSV and a standalone HTML report with
+the user's current gaps per role, the learning path with course links and
+the history of recorded states:
+
+    python export_reports.py --db progress.db --out reports
+    python export_reports.py --cache-dir progress_cache --out reports --jobs 8
+
+The log is read in batches, from the SQLite store (``--db``) or from the
+Parquet cache of the Sheets log (``--cache-dir``), and spooled to
+``--shards`` files partitioned by a hash of the email.  A process pool then
+renders one shard at a time, so memory is bounded by a batch in the parent
+and by one shard in each worker, never by the size of the log.
+
+Each shard keeps a manifest of a fingerprint per user, covering the time,
+role and skills of the user's rows, the catalog with its course links and
+``REPORT_VERSION``.  A rerun renders only
+users whose fingerprint changed and deletes the reports of users no longer
+in the log.  ``index.csv`` lists every user with the path of their reports.
+Changing ``--shards`` starts new manifests, so the next run renders everyone.
+"""
+
+import argparse
+import concurrent.futures
+import csv
+import glob
+import hashlib
+import html
+import io
+import json
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+import urllib.parse
+from datetime import datetime
+
+from progress_log import TIMESTAMP_FORMAT, ProgressRecord, join_skills, split_skills
+from role_catalog import CATALOG
+
+REPORT_VERSION = 1
+DEFAULT_SHARDS = 256
+BATCH_SIZE = 10000
+CSV_FIELDS = ["section", "role", "timestamp", "step", "skill", "status", "course",
+              "completed_count", "skill_count"]
+INDEX_FIELDS = ["email", "roles", "updated", "events", "csv", "html"]
+_MANIFEST_DIR = "_manifest"
+_INDEX_DIR = "_index"
+
+
+def user_key(email):
+    return hashlib.sha1(email.encode("utf-8")).hexdigest()[:20]
+
+
+def shard_of(email, shards):
+    return int(user_key(email)[:8], 16) % shards
+
+
+def report_paths(email):
+    """Report paths of ``email`` relative to the output directory."""
+    key = user_key(email)
+    base = os.path.join(key[:2], key)
+    return base + ".csv", base + ".html"
+
+
+# ------------------------------------------------------------------ sources
+
+def sqlite_rows(path, batch_size=BATCH_SIZE):
+    """Yield raw ``(seq, ts, email, role, completed, missing)`` rows of a
+    ``SQLiteProgressStore`` database in log order.
+
+    Skill cells are left unparsed; workers split them only for the users
+    they render.
+    """
+    conn = sqlite3.connect(f"file:{urllib.parse.quote(os.path.abspath(path))}?mode=ro", uri=True)
+    try:
+        cursor = 0
+        while True:
+            rows = conn.execute(
+                "SELECT seq, ts, email, role, completed, missing FROM progress "
+                "WHERE seq > ? ORDER BY seq LIMIT ?", (cursor, batch_size)).fetchall()
+            if not rows:
+                return
+            yield from rows
+            cursor = rows[-1][0]
+    finally:
+        conn.close()
+
+
+def cache_rows(directory, batch_size=BATCH_SIZE):
+    """Yield ``(row, ts, email, role, completed, missing)`` from a ``SheetSync``
+    Parquet cache, with the skill lists joined back into log cells."""
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(directory)
+    from sheet_sync import SheetSync
+
+    sync = SheetSync(None, directory)
+    columns = ["row", "timestamp", "email", "role", "completed", "missing"]
+    for rows in sync.iter_batches(columns, batch_size):
+        for row in rows:
+            if row["timestamp"] is None or not row["email"]:
+                continue
+            yield (row["row"], row["timestamp"].strftime(TIMESTAMP_FORMAT), row["email"], row["role"],
+                   join_skills(row["completed"] or ()), join_skills(row["missing"] or ()))
+
+
+def spool(rows, directory, shards):
+    """Partition log rows into ``shards`` JSON-lines files; return the row count."""
+    files = [open(os.path.join(directory, f"shard-{i:04d}.jsonl"), "w", encoding="utf-8")
+             for i in range(shards)]
+    count = 0
+    try:
+        for row in rows:
+            line = json.dumps(row, ensure_ascii=False, separators=(",", ":"))
+            files[shard_of(row[2], shards)].write(line + "\n")
+            count += 1
+    finally:
+        for fh in files:
+            fh.close()
+    return count
+
+
+# ---------------------------------------------------------------- rendering
+
+def _current(records):
+    """Newest record per role, in order of first appearance."""
+    latest = {}
+    for record in records:
+        latest[record.role] = record
+    return latest
+
+
+def _role_state(record, catalog):
+    """``[(skill, completed, url)]`` for the role of ``record``.
+
+    Roles no longer in the catalog fall back to the skills stored in the row,
+    without course links.
+    """
+    if record.role in catalog.roles:
+        completed = catalog.mask_of(record.completed, record.role)
+        return [(skill, catalog.has(completed, skill), url)
+                for skill, url in catalog.links(record.role)]
+    return ([(skill, True, None) for skill in record.completed]
+            + [(skill, False, None) for skill in record.missing])
+
+
+def _skill_count(record, catalog):
+    if record.role in catalog.roles:
+        return len(catalog.roles[record.role].skill_ids)
+    return len(record.completed) + len(record.missing)
+
+
+def render_csv(records, catalog=CATALOG):
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+    writer.writeheader()
+    for role, record in _current(records).items():
+        step = 0
+        for skill, done, url in _role_state(record, catalog):
+            if not done:
+                step += 1
+            writer.writerow({
+                "section": "current", "role": role,
+                "timestamp": record.timestamp.strftime(TIMESTAMP_FORMAT),
+                "step": "" if done else step, "skill": skill,
+                "status": "Completed" if done else "Missing", "course": url or "",
+            })
+    for record in records:
+        writer.writerow({
+            "section": "history", "role": record.role,
+            "timestamp": record.timestamp.strftime(TIMESTAMP_FORMAT),
+            "completed_count": len(record.completed),
+            "skill_count": _skill_count(record, catalog),
+        })
+    return out.getvalue()
+
+
+_STYLE = """
+body { font-family: system-ui, sans-serif; margin: 2rem; color: #1f2937; }
+h1 { font-size: 1.4rem; } h2 { font-size: 1.15rem; margin-top: 2rem; }
+table { border-collapse: collapse; margin: 0.5rem 0 1rem; }
+th, td { border: 1px solid #d1d5db; padding: 0.3rem 0.6rem; text-align: left; }
+th { background: #f3f4f6; } .done { color: #047857; } .missing { color: #b91c1c; }
+"""
+
+
+def _table(headers, rows):
+    head = "".join(f"<th>{html.escape(h)}</th>" for h in headers)
+    body = "".join("<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows)
+    return f"<table><tr>{head}</tr>{body}</table>"
+
+
+def _link(url):
+    return f'<a href="{html.escape(url)}">Course</a>' if url else ""
+
+
+def render_html(email, records, catalog=CATALOG, generated=None):
+    e = html.escape
+    parts = [f"<h1>Progress report: {e(email)}</h1>",
+             f"<p>Generated {e(generated or datetime.now().strftime(TIMESTAMP_FORMAT))}.</p>"]
+    for role, record in _current(records).items():
+        state = _role_state(record, catalog)
+        done = sum(1 for _, completed, _ in state if completed)
+        parts.append(f"<h2>{e(role)}</h2><p>{done} of {len(state)} skills completed, "
+                     f"as of {e(record.timestamp.strftime(TIMESTAMP_FORMAT))}.</p>")
+        parts.append(_table(["Skill", "Status"], [
+            (e(skill), '<span class="done">Completed</span>' if completed
+             else '<span class="missing">Missing</span>')
+            for skill, completed, _ in state]))
+        path = [(skill, url) for skill, completed, url in state if not completed]
+        if path:
+            parts.append("<h3>Learning path</h3>")
+            parts.append(_table(["Step", "Skill", "Course"], [
+                (f"Step {step}", e(skill), _link(url)) for step, (skill, url) in enumerate(path, 1)]))
+    parts.append("<h2>History</h2>")
+    parts.append(_table(["Timestamp", "Role", "Completed"], [
+        (e(r.timestamp.strftime(TIMESTAMP_FORMAT)), e(r.role),
+         f"{len(r.completed)} / {_skill_count(r, catalog)}")
+        for r in records]))
+    return ("<!DOCTYPE html>\n<html lang=\"en\"><head><meta charset=\"utf-8\">"
+            f"<title>Progress report: {e(email)}</title><style>{_STYLE}</style></head>"
+            f"<body>{''.join(parts)}</body></html>\n")
+
+
+# ------------------------------------------------------------------ workers
+
+def _write_report(path, text):
+    # Written in place: the shard's manifest is only saved after all of its
+    # reports, so a report cut short by a crash is rendered again next run.
+    try:
+        fh = open(path, "w", encoding="utf-8", newline="")
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fh = open(path, "w", encoding="utf-8", newline="")
+    with fh:
+        fh.write(text)
+
+
+def _write(path, text):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8", newline="") as fh:
+        fh.write(text)
+    os.replace(tmp, path)
+
+
+def _load_json(path):
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def export_shard(spool_path, out_dir, manifest_path, index_path, force=False):
+    """Render the users of one spooled shard; return ``(rendered, unchanged, removed)``."""
+    users = {}
+    with open(spool_path, encoding="utf-8") as fh:
+        for line in fh:
+            row = json.loads(line)
+            users.setdefault(row[2], []).append((row[0], row))
+
+    # Always loaded, so users gone from the log lose their reports even
+    # under ``force``, which only skips the fingerprint comparison.
+    previous = _load_json(manifest_path)
+    manifest, index_rows = {}, []
+    rendered = unchanged = 0
+    generated = datetime.now().strftime(TIMESTAMP_FORMAT)
+    for email, lines in users.items():
+        lines.sort(key=lambda item: item[0])
+        digest = hashlib.sha1(f"{REPORT_VERSION}:{CATALOG.links_version}\n".encode("utf-8"))
+        rows = [row for _, row in lines]
+        for _, ts, _, role, completed, missing in rows:
+            # Only what the report shows; the log position does not count.
+            digest.update(json.dumps([ts, role, completed, missing]).encode("utf-8") + b"\n")
+        fingerprint = manifest[email] = digest.hexdigest()
+        csv_path, html_path = report_paths(email)
+        index_rows.append([email, len({row[3] for row in rows}), rows[-1][1], len(rows),
+                           csv_path, html_path])
+        if (not force and previous.get(email) == fingerprint
+                and os.path.exists(os.path.join(out_dir, html_path))):
+            unchanged += 1
+            continue
+        records = [ProgressRecord(datetime.strptime(ts, TIMESTAMP_FORMAT), email, role,
+                                  split_skills(completed), split_skills(missing))
+                   for _, ts, _, role, completed, missing in rows]
+        _write_report(os.path.join(out_dir, csv_path), render_csv(records))
+        _write_report(os.path.join(out_dir, html_path), render_html(email, records, generated=generated))
+        rendered += 1
+
+    removed = 0
+    for email in previous.keys() - manifest.keys():
+        for path in report_paths(email):
+            try:
+                os.remove(os.path.join(out_dir, path))
+            except FileNotFoundError:
+                pass
+        removed += 1
+    _write(manifest_path, json.dumps(manifest, separators=(",", ":")))
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(index_rows)
+    _write(index_path, buffer.getvalue())
+    return rendered, unchanged, removed
+
+
+def export(rows, out_dir, shards=DEFAULT_SHARDS, jobs=None, force=False):
+    """Export reports for the log ``rows`` into ``out_dir``; return a stats dict."""
+    os.makedirs(out_dir, exist_ok=True)
+    tag = f"of-{shards:04d}"
+    for sub in (_MANIFEST_DIR, _INDEX_DIR):
+        os.makedirs(os.path.join(out_dir, sub), exist_ok=True)
+    stats = {"rows": 0, "rendered": 0, "unchanged": 0, "removed": 0}
+    spool_dir = tempfile.mkdtemp(dir=out_dir, prefix=".spool-")
+    try:
+        stats["rows"] = spool(rows, spool_dir, shards)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(export_shard,
+                            os.path.join(spool_dir, f"shard-{i:04d}.jsonl"), out_dir,
+                            os.path.join(out_dir, _MANIFEST_DIR, f"shard-{i:04d}-{tag}.json"),
+                            os.path.join(out_dir, _INDEX_DIR, f"shard-{i:04d}-{tag}.csv"),
+                            force)
+                for i in range(shards)
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                rendered, unchanged, removed = future.result()
+                stats["rendered"] += rendered
+                stats["unchanged"] += unchanged
+                stats["removed"] += removed
+    finally:
+        shutil.rmtree(spool_dir, ignore_errors=True)
+
+    index_path = os.path.join(out_dir, "index.csv")
+    with open(index_path + ".tmp", "w", encoding="utf-8", newline="") as out:
+        csv.writer(out).writerow(INDEX_FIELDS)
+        for path in sorted(glob.glob(os.path.join(out_dir, _INDEX_DIR, f"shard-*-{tag}.csv"))):
+            with open(path, encoding="utf-8", newline="") as fh:
+                shutil.copyfileobj(fh, out)
+    os.replace(index_path + ".tmp", index_path)
+    stats["users"] = stats["rendered"] + stats["unchanged"]
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export per-user progress reports as CSV and HTML.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--db", help="SQLite progress store (PROGRESS_DB_PATH)")
+    source.add_argument("--cache-dir", help="Parquet cache of the Sheets log (PROGRESS_CACHE_DIR)")
+    parser.add_argument("--out", default="reports", help="output directory")
+    parser.add_argument("--shards", type=int, default=DEFAULT_SHARDS)
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="render every user, changed or not")
+    args = parser.parse_args(argv)
+
+    if args.db and not os.path.exists(args.db):
+        parser.error(f"no such database: {args.db}")
+    rows = sqlite_rows(args.db) if args.db else cache_rows(args.cache_dir)
+    started = time.perf_counter()
+    stats = export(rows, args.out, args.shards, args.jobs, args.force)
+    print(f"{stats['rows']} rows, {stats['users']} users: {stats['rendered']} rendered, "
+          f"{stats['unchanged']} unchanged, {stats['removed']} removed "
+          f"in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Local stub HTTP server for offline tests and benchmarks of ``link_checker``.
+``FakeLinkServer`` answers on 127.0.0.1 by path, so one server covers every
+case the checker distinguishes:
+
+    /ok/<n>            200 with an ETag and Last-Modified; 304 when either
+                       validator is sent back
+    /missing/<n>       404
+    /gone/<n>          410
+    /forbidden/<n>     403
+    /error/<n>         500
+    /slow/<n>          200 after ``slow`` seconds
+    /redirect/<k>/<n>  302 chain of ``k`` hops ending at /ok/<n>
+
+Each server records the requests it served and the most it ever had in
+flight, so the per-host limit can be checked from the outside.
+
+``python fake_links.py`` runs the checker against a few servers, reports
+any link whose result differs from what the stub implies, and times a check
+of several thousand links:
+
+    python fake_links.py --hosts 20 --links 5000
+"""
+
+import argparse
+import asyncio
+import collections
+import sys
+import time
+
+from link_checker import LinkChecker
+
+ETAG = '"stub-v1"'
+LAST_MODIFIED = "Mon, 06 Jan 2025 00:00:00 GMT"
+_REASONS = {200: "OK", 302: "Found", 304: "Not Modified", 403: "Forbidden",
+            404: "Not Found", 410: "Gone", 500: "Internal Server Error"}
+
+
+class FakeLinkServer:
+    """Asyncio HTTP/1.1 server with canned answers per path prefix."""
+
+    def __init__(self, slow=0.5, latency=0.0):
+        self.slow = slow
+        self.latency = latency
+        self.requests = collections.Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.port = None
+        self._server = None
+
+    @property
+    def base(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    def _answer(self, path, headers):
+        kind, _, rest = path.strip("/").partition("/")
+        if kind == "ok":
+            if headers.get("if-none-match") == ETAG or "if-modified-since" in headers:
+                return 304, {}
+            return 200, {"ETag": ETAG, "Last-Modified": LAST_MODIFIED}
+        if kind == "redirect":
+            hops, _, name = rest.partition("/")
+            hops = int(hops)
+            target = f"/redirect/{hops - 1}/{name}" if hops > 1 else f"/ok/{name}"
+            return 302, {"Location": target}
+        return {"missing": 404, "gone": 410, "forbidden": 403, "error": 500,
+                "slow": 200}.get(kind, 404), {}
+
+    async def _handle(self, reader, writer):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            request_line = await reader.readline()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            path = request_line.split()[1].decode("latin-1")
+            self.requests[path] += 1
+            if path.startswith("/slow/"):
+                await asyncio.sleep(self.slow)
+            elif self.latency:
+                await asyncio.sleep(self.latency)
+            status, extra = self._answer(path, headers)
+            lines = [f"HTTP/1.1 {status} {_REASONS[status]}", "Content-Length: 0",
+                     "Connection: close"]
+            lines += [f"{name}: {value}" for name, value in extra.items()]
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+            await writer.drain()
+        except (ConnectionError, IndexError):
+            pass
+        finally:
+            self.in_flight -= 1
+            writer.close()
+
+
+# (path, expected state, expected dead) for a first check of each case.
+CASES = [
+    ("/ok/a", "ok", False),
+    ("/missing/a", "dead", True),
+    ("/gone/a", "dead", True),
+    ("/forbidden/a", "blocked", False),
+    ("/error/a", "error", False),
+    ("/slow/a", "error", False),
+    ("/redirect/3/a", "ok", False),
+    ("/redirect/9/a", "error", False),
+]
+
+
+async def check_cases(per_host=4):
+    """Check each of ``CASES`` twice; return a list of mismatch descriptions."""
+    server = await FakeLinkServer(slow=0.5).start()
+    checker = LinkChecker(per_host=per_host, timeout=0.2, max_redirects=5)
+    urls = [server.base + path for path, _, _ in CASES]
+    problems = []
+    try:
+        first = await checker.check(urls)
+        for (path, state, dead), url in zip(CASES, urls):
+            got = first[url]
+            if (got["state"], got["dead"]) != (state, dead):
+                problems.append(f"{path}: got {got['state']}/{got['dead']}, "
+                                f"expected {state}/{dead}")
+        ok = first[server.base + "/ok/a"]
+        if ok.get("etag") != ETAG or ok.get("last_modified") != LAST_MODIFIED:
+            problems.append(f"/ok/a: validators not recorded: {ok}")
+        redirected = first[server.base + "/redirect/3/a"]
+        if redirected["final_url"] != server.base + "/ok/a":
+            problems.append(f"/redirect/3/a: final_url {redirected['final_url']}")
+
+        second = await checker.check(urls, first)
+        ok = second[server.base + "/ok/a"]
+        if ok["status"] != 304 or ok["state"] != "ok" or ok.get("etag") != ETAG:
+            problems.append(f"/ok/a: conditional recheck gave {ok}")
+        for path in ("/error/a", "/slow/a"):
+            if not second[server.base + path]["dead"]:
+                problems.append(f"{path}: not dead after two failed checks")
+    finally:
+        await server.close()
+    return problems
+
+
+async def check_throughput(hosts, links, per_host, concurrency, latency):
+    """Check ``links`` URLs spread over ``hosts`` servers.
+
+    Returns ``(elapsed, results, servers)``.
+    """
+    servers = [await FakeLinkServer(latency=latency).start() for _ in range(hosts)]
+    urls = [f"{servers[i % hosts].base}/ok/{i}" for i in range(links)]
+    checker = LinkChecker(concurrency=concurrency, per_host=per_host)
+    started = time.perf_counter()
+    try:
+        results = await checker.check(urls)
+    finally:
+        for server in servers:
+            await server.close()
+    return time.perf_counter() - started, results, servers
+
+
+async def _main(args):
+    problems = await check_cases(args.per_host)
+    for line in problems:
+        print("MISMATCH", line)
+    print(f"{len(CASES)} cases checked, {len(problems)} mismatches")
+
+    elapsed, results, servers = await check_throughput(
+        args.hosts, args.links, args.per_host, args.concurrency, args.latency)
+    states = collections.Counter(entry["state"] for entry in results.values())
+    peak = max(server.max_in_flight for server in servers)
+    print(f"checked {len(results)} links on {args.hosts} hosts in {elapsed:.2f}s "
+          f"({len(results) / elapsed:.0f}/s): "
+          + ", ".join(f"{n} {state}" for state, n in sorted(states.items())))
+    print(f"peak requests in flight per host: {peak} (limit {args.per_host})")
+    if peak > args.per_host:
+        problems.append("per-host limit exceeded")
+    if states["ok"] != len(results):
+        problems.append("throughput run had failed links")
+    return 1 if problems else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check link_checker against local stub servers.")
+    parser.add_argument("--hosts", type=int, default=20)
+    parser.add_argument("--links", type=int, default=5000)
+    parser.add_argument("--per-host", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.01,
+                        help="seconds each stub response is delayed")
+    return asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
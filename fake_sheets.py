@@ -0,0 +1,378 @@
+"""
+In-process stand-in for the subset of gspread the app uses, for offline
+benchmarks and tests of the persistence path.  ``FakeClient``,
+``FakeSpreadsheet`` and ``FakeWorksheet`` mirror gspread's ``Client``,
+``Spreadsheet`` and ``Worksheet``: ``open_by_url``/``open_by_key``,
+``sheet1``/``worksheet``/``add_worksheet``, ``append_row(s)``,
+``insert_row(s)``, ``get``, ``batch_get``, ``get_all_values``,
+``col_values``, ``update``, ``batch_update`` and ``delete_rows``.
+
+All spreadsheets live on a ``FakeSheetsServer`` which injects per-call
+latency, enforces Google's per-minute read and write quotas with 429
+``RESOURCE_EXHAUSTED`` errors, injects random 500/503 errors, and counts
+calls and bytes.  Errors are raised as ``gspread.exceptions.APIError`` when
+gspread is installed so callers exercise their real error handling.
+
+Point the app at the emulator by setting ``SHEETS_EMULATOR`` in
+``st.secrets``, either to ``true`` or to a table of ``FakeSheetsServer``
+options such as ``latency = 0.2``.
+"""
+
+import collections
+import json
+import random
+import re
+import threading
+import time
+
+_KEY_RE = re.compile(r"/spreadsheets/d/([a-zA-Z0-9-_]+)")
+_CELL_RE = re.compile(r"^([A-Za-z]*)(\d*)$")
+
+# Google's documented default quotas per user per minute.
+READ_QUOTA_PER_MINUTE = 60
+WRITE_QUOTA_PER_MINUTE = 60
+
+
+class FakeResponse:
+    """Minimal ``requests.Response`` look-alike carried by injected errors."""
+
+    def __init__(self, status_code, status, message):
+        self.status_code = status_code
+        self._payload = {"error": {"code": status_code, "message": message, "status": status}}
+        self.text = json.dumps(self._payload)
+
+    def json(self):
+        return self._payload
+
+
+class FakeAPIError(Exception):
+    """Raised instead of ``gspread.exceptions.APIError`` when gspread is absent."""
+
+    def __init__(self, response):
+        super().__init__(response.json()["error"]["message"])
+        self.response = response
+        self.code = response.status_code
+
+
+def _api_error(status_code, status, message):
+    response = FakeResponse(status_code, status, message)
+    try:
+        from gspread.exceptions import APIError
+    except ImportError:
+        return FakeAPIError(response)
+    return APIError(response)
+
+
+def _size(values):
+    return len(json.dumps(values, default=str))
+
+
+def _column_index(letters):
+    index = 0
+    for ch in letters.upper():
+        index = index * 26 + ord(ch) - ord("A") + 1
+    return index
+
+
+def _parse_range(range_name):
+    """Turn an A1 range into 1-based ``(row0, col0, row1, col1)``; None is open."""
+    if "!" in range_name:
+        range_name = range_name.split("!", 1)[1]
+    start, _, end = range_name.partition(":")
+    end = end or start
+    bounds = []
+    for part in (start, end):
+        match = _CELL_RE.match(part)
+        if not match:
+            raise ValueError(f"Unsupported range {range_name!r}")
+        letters, digits = match.groups()
+        bounds.append((int(digits) if digits else None, _column_index(letters) if letters else None))
+    (row0, col0), (row1, col1) = bounds
+    return row0 or 1, col0 or 1, row1, col1
+
+
+class FakeSheetsServer:
+    """Shared state, fault injection and counters for fake spreadsheets.
+
+    ``latency`` is seconds per call or a callable ``latency(method)``.
+    ``error_rate`` is the probability that a call fails with a 500 or 503.
+    Quotas are sliding windows of ``window`` seconds; rejected calls do not
+    consume quota.
+    """
+
+    def __init__(self, latency=0.0, error_rate=0.0, read_quota=READ_QUOTA_PER_MINUTE,
+                 write_quota=WRITE_QUOTA_PER_MINUTE, window=60.0, seed=None,
+                 clock=time.monotonic, sleep=time.sleep):
+        self._lock = threading.RLock()
+        self.spreadsheets = {}
+        self.clock = clock
+        self.sleep = sleep
+        self._random = random.Random(seed)
+        self._forced = collections.deque()
+        self._calls = {"read": collections.deque(), "write": collections.deque()}
+        self.configure(latency=latency, error_rate=error_rate, read_quota=read_quota,
+                       write_quota=write_quota, window=window)
+        self.reset_stats()
+
+    def configure(self, **options):
+        """Change fault injection settings; unknown names raise TypeError."""
+        allowed = {"latency", "error_rate", "read_quota", "write_quota", "window"}
+        unknown = set(options) - allowed
+        if unknown:
+            raise TypeError(f"Unknown emulator options: {sorted(unknown)}")
+        with self._lock:
+            for name, value in options.items():
+                setattr(self, name, value)
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats = {
+                "calls": collections.Counter(),
+                "reads": 0,
+                "writes": 0,
+                "bytes_sent": 0,
+                "bytes_received": 0,
+                "errors": collections.Counter(),
+            }
+
+    def fail_next(self, status_code=429, count=1):
+        """Make the next ``count`` calls fail with ``status_code``."""
+        with self._lock:
+            self._forced.extend([status_code] * count)
+
+    def spreadsheet(self, key, title=None):
+        with self._lock:
+            if key not in self.spreadsheets:
+                self.spreadsheets[key] = FakeSpreadsheet(self, key, title or key)
+            return self.spreadsheets[key]
+
+    def _error_for(self, kind):
+        if self._forced:
+            code = self._forced.popleft()
+        else:
+            now = self.clock()
+            calls = self._calls[kind]
+            while calls and calls[0] <= now - self.window:
+                calls.popleft()
+            quota = self.read_quota if kind == "read" else self.write_quota
+            if quota is not None and len(calls) >= quota:
+                code = 429
+            elif self.error_rate and self._random.random() < self.error_rate:
+                code = self._random.choice((500, 503))
+            else:
+                calls.append(now)
+                return None
+        if code == 429:
+            label = "Read requests" if kind == "read" else "Write requests"
+            return _api_error(429, "RESOURCE_EXHAUSTED",
+                              f"Quota exceeded for quota metric '{label}' and limit "
+                              f"'{label} per minute per user' of service 'sheets.googleapis.com'")
+        if code == 503:
+            return _api_error(503, "UNAVAILABLE", "The service is currently unavailable.")
+        return _api_error(code, "INTERNAL", "Internal error encountered.")
+
+    def call(self, kind, method, sent, fn):
+        """Run ``fn`` as one API request of ``kind`` ("read" or "write")."""
+        latency = self.latency(method) if callable(self.latency) else self.latency
+        if latency:
+            self.sleep(latency)
+        with self._lock:
+            self.stats["calls"][method] += 1
+            self.stats[kind + "s"] += 1
+            self.stats["bytes_sent"] += _size(sent) if sent is not None else 0
+            error = self._error_for(kind)
+            if error is not None:
+                self.stats["errors"][error.response.status_code] += 1
+                raise error
+            result = fn()
+            self.stats["bytes_received"] += _size(result) if result is not None else 0
+            return result
+
+
+_default_server = None
+_default_lock = threading.Lock()
+
+
+def default_server():
+    """Return the process-wide server used by clients created without one."""
+    global _default_server
+    with _default_lock:
+        if _default_server is None:
+            _default_server = FakeSheetsServer()
+        return _default_server
+
+
+def authorize(creds_dict=None):
+    """Drop-in for ``sheets_connection.authorize`` returning a fake client."""
+    return FakeClient(), None
+
+
+class FakeClient:
+    def __init__(self, server=None):
+        self.server = server or default_server()
+
+    def open_by_key(self, key):
+        return self.server.call("read", "open_by_key", None,
+                                lambda: self.server.spreadsheet(key))
+
+    def open_by_url(self, url):
+        match = _KEY_RE.search(url)
+        if not match:
+            raise ValueError(f"Not a spreadsheet URL: {url}")
+        return self.open_by_key(match.group(1))
+
+
+class FakeSpreadsheet:
+    def __init__(self, server, key, title):
+        self.server = server
+        self.id = key
+        self.title = title
+        self._worksheets = [FakeWorksheet(self, 0, "Sheet1")]
+
+    @property
+    def sheet1(self):
+        return self._worksheets[0]
+
+    def worksheets(self):
+        return self.server.call("read", "worksheets", None, lambda: list(self._worksheets))
+
+    def worksheet(self, title):
+        def find():
+            for ws in self._worksheets:
+                if ws.title == title:
+                    return ws
+            raise _worksheet_not_found(title)
+        return self.server.call("read", "worksheet", None, find)
+
+    def add_worksheet(self, title, rows=1000, cols=26):
+        def add():
+            if any(ws.title == title for ws in self._worksheets):
+                raise _api_error(400, "INVALID_ARGUMENT",
+                                 f'A sheet with the name "{title}" already exists.')
+            ws = FakeWorksheet(self, max(ws.id for ws in self._worksheets) + 1, title)
+            self._worksheets.append(ws)
+            return ws
+        return self.server.call("write", "add_worksheet", title, add)
+
+    def del_worksheet(self, worksheet):
+        return self.server.call("write", "del_worksheet", worksheet.title,
+                                lambda: self._worksheets.remove(worksheet))
+
+    def values_batch_get(self, ranges):
+        def read():
+            value_ranges = []
+            for range_name in ranges:
+                title = range_name.split("!", 1)[0].strip("'") if "!" in range_name else "Sheet1"
+                ws = next(ws for ws in self._worksheets if ws.title == title)
+                value_ranges.append({"range": range_name, "values": ws._read(range_name)})
+            return {"spreadsheetId": self.id, "valueRanges": value_ranges}
+        return self.server.call("read", "values_batch_get", ranges, read)
+
+
+def _worksheet_not_found(title):
+    try:
+        from gspread.exceptions import WorksheetNotFound
+    except ImportError:
+        return KeyError(title)
+    return WorksheetNotFound(title)
+
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, sheet_id, title):
+        self.spreadsheet = spreadsheet
+        self.id = sheet_id
+        self.title = title
+        self._rows = []
+
+    @property
+    def _server(self):
+        return self.spreadsheet.server
+
+    @property
+    def row_count(self):
+        return len(self._rows)
+
+    def _read(self, range_name):
+        row0, col0, row1, col1 = _parse_range(range_name)
+        rows = self._rows[row0 - 1:row1]
+        return [list(row[col0 - 1:col1]) for row in rows]
+
+    def _write(self, range_name, values):
+        row0, col0, _, _ = _parse_range(range_name)
+        for offset, values_row in enumerate(values):
+            index = row0 - 1 + offset
+            while len(self._rows) <= index:
+                self._rows.append([])
+            row = self._rows[index]
+            while len(row) < col0 - 1 + len(values_row):
+                row.append("")
+            row[col0 - 1:col0 - 1 + len(values_row)] = [str(v) for v in values_row]
+
+    def append_row(self, values, value_input_option="RAW", **kwargs):
+        return self.append_rows([values], value_input_option=value_input_option)
+
+    def append_rows(self, values, value_input_option="RAW", **kwargs):
+        def append():
+            start = len(self._rows) + 1
+            self._rows.extend([[str(v) for v in row] for row in values])
+            return {"updates": {"updatedRange": f"{self.title}!A{start}", "updatedRows": len(values)}}
+        return self._server.call("write", "append_rows", values, append)
+
+    def insert_row(self, values, index=1, value_input_option="RAW", **kwargs):
+        return self.insert_rows([values], row=index, value_input_option=value_input_option)
+
+    def insert_rows(self, values, row=1, value_input_option="RAW", **kwargs):
+        def insert():
+            while len(self._rows) < row - 1:
+                self._rows.append([])
+            self._rows[row - 1:row - 1] = [[str(v) for v in values_row] for values_row in values]
+        return self._server.call("write", "insert_rows", values, insert)
+
+    def get_all_values(self):
+        return self._server.call("read", "get_all_values", None,
+                                 lambda: [list(row) for row in self._rows])
+
+    def get(self, range_name=None, **kwargs):
+        if range_name is None:
+            return self.get_all_values()
+        return self._server.call("read", "get", range_name, lambda: self._read(range_name))
+
+    def batch_get(self, ranges, **kwargs):
+        return self._server.call("read", "batch_get", ranges,
+                                 lambda: [self._read(r) for r in ranges])
+
+    def row_values(self, row):
+        def read():
+            return list(self._rows[row - 1]) if row <= len(self._rows) else []
+        return self._server.call("read", "row_values", row, read)
+
+    def col_values(self, col):
+        def read():
+            values = [row[col - 1] if len(row) >= col else "" for row in self._rows]
+            while values and values[-1] == "":
+                values.pop()
+            return values
+        return self._server.call("read", "col_values", col, read)
+
+    def update(self, range_name, values=None, **kwargs):
+        # gspread 6 takes (values, range_name); gspread 5 takes (range_name, values).
+        if not isinstance(range_name, str):
+            range_name, values = values, range_name
+        return self._server.call("write", "update", values,
+                                 lambda: self._write(range_name, values))
+
+    def batch_update(self, data, **kwargs):
+        def write():
+            for item in data:
+                self._write(item["range"], item["values"])
+        return self._server.call("write", "batch_update", data, write)
+
+    def delete_rows(self, start_index, end_index=None):
+        end_index = end_index or start_index
+
+        def delete():
+            del self._rows[start_index - 1:end_index]
+        return self._server.call("write", "delete_rows", [start_index, end_index], delete)
+
+    def clear(self):
+        return self._server.call("write", "clear", None, self._rows.clear)
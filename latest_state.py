@@ -0,0 +1,109 @@
+"""
+Email-keyed index of each user's latest progress per role.  Restoring a
+returning user's state must not scan the progress log, so
+``LatestStateIndex`` keeps one row per (email, role) in an SQLite table
+keyed by email.  It is updated as records are written and caught up with
+rows that other app instances appended to the sheet from the
+``SheetSync`` cache, so a login is a single primary-key range lookup
+however many users the log holds.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+
+from progress_log import TIMESTAMP_FORMAT, ProgressRecord, join_skills, split_skills
+
+DEFAULT_PATH = "latest_state.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS latest_state (
+    email TEXT NOT NULL,
+    role TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    completed TEXT NOT NULL,
+    missing TEXT NOT NULL,
+    PRIMARY KEY (email, role)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# Newer rows replace older ones; a row replayed from the sheet that is older
+# than the indexed state leaves it unchanged.
+_UPSERT = """
+INSERT INTO latest_state (email, role, ts, completed, missing) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (email, role) DO UPDATE SET
+    ts = excluded.ts, completed = excluded.completed, missing = excluded.missing
+WHERE excluded.ts >= latest_state.ts
+"""
+
+
+class LatestStateIndex:
+    """Latest ``ProgressRecord`` per (email, role), looked up by email."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def update(self, records):
+        """Fold ``records`` into the index."""
+        params = [
+            (r.email, r.role, r.timestamp.strftime(TIMESTAMP_FORMAT),
+             join_skills(r.completed), join_skills(r.missing))
+            for r in records
+        ]
+        with self._lock:
+            self._conn.executemany(_UPSERT, params)
+
+    def get(self, email):
+        """Return ``{role: ProgressRecord}`` for ``email``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT role, ts, completed, missing FROM latest_state WHERE email = ?",
+                (email,)).fetchall()
+        return {
+            role: ProgressRecord(datetime.strptime(ts, TIMESTAMP_FORMAT), email, role,
+                                 split_skills(completed), split_skills(missing))
+            for role, ts, completed, missing in rows
+        }
+
+    @property
+    def synced_row(self):
+        """Last sheet row folded in by ``catch_up``."""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'synced_row'").fetchone()
+        return row[0] if row else 0
+
+    def catch_up(self, sync):
+        """Fold in rows the ``SheetSync`` cache holds beyond ``synced_row``."""
+        synced, cursor = self.synced_row, sync.cursor
+        if cursor <= synced:
+            return 0
+        frame = sync.read(filters=[("row", ">", synced), ("row", "<=", cursor)])
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(_UPSERT, zip(
+                    frame["email"], frame["role"],
+                    frame["timestamp"].dt.strftime(TIMESTAMP_FORMAT),
+                    map(join_skills, frame["completed"]), map(join_skills, frame["missing"])))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_row', ?)",
+                    (cursor,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(frame)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,272 @@
+"""
+Health checks for the course links in the role catalog.  The checker runs
+outside the app, on a schedule, and records what it found in a JSON file;
+the app only reads that file (through ``LinkStatus``), so rendering never
+waits on the network:
+
+    python link_checker.py                  # check every catalog link
+    python link_checker.py --max-age 86400  # only links not checked today
+
+Requests go through a small asyncio HTTP/1.1 client with a global
+concurrency limit and a lower limit per host, a timeout per hop, and up to
+``MAX_REDIRECTS`` redirects.  The ``ETag`` and ``Last-Modified`` of the
+previous check are sent back as ``If-None-Match``/``If-Modified-Since`` and a
+304 keeps the link healthy.  Only response headers are read.
+
+A link is dead after a 404 or 410, or after ``DEAD_AFTER`` consecutive
+checks that ended in a 5xx, a timeout or a connection error.  Other 4xx
+answers (401, 403, 429, ...) usually mean the site turns away robots, so
+they are recorded as "blocked" and the link is left alone.
+
+``fake_links`` serves every one of these cases locally; run
+``python fake_links.py`` to check the checker against it.
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import os
+import ssl
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+
+from role_catalog import CATALOG
+
+DEFAULT_PATH = "link_status.json"
+CONCURRENCY = 100
+PER_HOST = 4
+TIMEOUT = 10.0
+MAX_REDIRECTS = 5
+DEAD_AFTER = 2
+USER_AGENT = "BrainyscoutLinkChecker/1.0"
+_MAX_HEADERS = 100
+
+
+def catalog_urls(catalog=CATALOG):
+    """Distinct course URLs of ``catalog`` in first-seen order."""
+    return list(dict.fromkeys(url for entry in catalog.roles.values() for url in entry.urls))
+
+
+def load(path=DEFAULT_PATH):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def save(path, results):
+    """Atomically write ``results`` to ``path``."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".links-")
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=1, sort_keys=True)
+        fh.write("\n")
+    os.replace(tmp, path)
+
+
+async def _fetch(url, headers, timeout):
+    """GET ``url`` and return ``(status, headers)`` without reading the body."""
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"unsupported URL {url!r}")
+    tls = parts.scheme == "https"
+    port = parts.port or (443 if tls else 80)
+    host = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+    target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+    lines = [f"GET {target} HTTP/1.1", f"Host: {host}", f"User-Agent: {USER_AGENT}",
+             "Accept: */*", "Connection: close"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def exchange():
+        reader, writer = await asyncio.open_connection(
+            parts.hostname, port, ssl=ssl.create_default_context() if tls else None)
+        try:
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            fields = status_line.split(None, 2)
+            if len(fields) < 2 or not fields[0].startswith(b"HTTP/"):
+                raise ConnectionError(f"bad status line {status_line[:80]!r}")
+            response = {}
+            for _ in range(_MAX_HEADERS):
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                response[name.strip().lower()] = value.strip()
+            return int(fields[1]), response
+        finally:
+            writer.close()
+
+    return await asyncio.wait_for(exchange(), timeout)
+
+
+class LinkChecker:
+    """Checks URLs concurrently with per-host limits and conditional requests."""
+
+    def __init__(self, concurrency=CONCURRENCY, per_host=PER_HOST, timeout=TIMEOUT,
+                 max_redirects=MAX_REDIRECTS, clock=time.time):
+        self._concurrency = concurrency
+        self._per_host = per_host
+        self._timeout = timeout
+        self._max_redirects = max_redirects
+        self._clock = clock
+
+    async def _request(self, url, headers):
+        host = urllib.parse.urlsplit(url).netloc.lower()
+        # Wait for the host first: a request queued behind a busy host must
+        # not hold a global slot that an idle host could use.
+        async with self._hosts[host], self._limit:
+            return await _fetch(url, headers, self._timeout)
+
+    async def _check(self, url, previous):
+        conditional = {}
+        if previous.get("etag"):
+            conditional["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            conditional["If-Modified-Since"] = previous["last_modified"]
+        result = {"checked_at": self._clock(), "final_url": url}
+        current, headers = url, conditional
+        try:
+            for _ in range(self._max_redirects + 1):
+                status, response = await self._request(current, headers)
+                if status in (301, 302, 303, 307, 308) and "location" in response:
+                    current = urllib.parse.urljoin(current, response["location"])
+                    # Validators belong to the original URL only.
+                    headers = {}
+                    continue
+                break
+            else:
+                raise ConnectionError("too many redirects")
+        except (OSError, asyncio.TimeoutError, ValueError, UnicodeError) as exc:
+            result.update(status=None, state="error", error=f"{type(exc).__name__}: {exc}")
+        else:
+            result.update(status=status, final_url=current)
+            if status < 400:
+                result["state"] = "ok"
+                # A 304 carries no new validators; keep the previous ones.
+                for field, header in (("etag", "etag"), ("last_modified", "last-modified")):
+                    value = response.get(header) or (previous.get(field) if status == 304 else None)
+                    if value:
+                        result[field] = value
+            elif status in (404, 410):
+                result["state"] = "dead"
+            elif status < 500:
+                result["state"] = "blocked"
+            else:
+                result["state"] = "error"
+        failures = previous.get("failures", 0) + 1 if result["state"] == "error" else 0
+        result["failures"] = failures
+        result["dead"] = result["state"] == "dead" or failures >= DEAD_AFTER
+        return url, result
+
+    async def check(self, urls, previous=None):
+        """Return ``{url: result}`` for ``urls``; ``previous`` holds earlier results."""
+        previous = previous or {}
+        self._limit = asyncio.Semaphore(self._concurrency)
+        self._hosts = collections.defaultdict(lambda: asyncio.Semaphore(self._per_host))
+        pairs = await asyncio.gather(*(self._check(url, previous.get(url, {}))
+                                       for url in dict.fromkeys(urls)))
+        return dict(pairs)
+
+
+def run(urls, path=DEFAULT_PATH, max_age=0.0, **options):
+    """Check ``urls`` not checked within ``max_age`` seconds and update ``path``.
+
+    Returns the merged results.  Entries for URLs no longer passed are dropped.
+    """
+    previous = load(path)
+    now = time.time()
+    due = [url for url in dict.fromkeys(urls)
+           if now - previous.get(url, {}).get("checked_at", 0) >= max_age]
+    fresh = asyncio.run(LinkChecker(**options).check(due, previous))
+    results = {url: fresh.get(url, previous.get(url)) for url in dict.fromkeys(urls)}
+    results = {url: entry for url, entry in results.items() if entry is not None}
+    save(path, results)
+    return results
+
+
+class LinkStatus:
+    """Read side of the checker's results for the app.
+
+    The file is re-read when its modification time changes, checked at most
+    every ``recheck`` seconds.  ``mode`` is "flag" to mark dead links, "hide"
+    to drop their URL, or "show" to ignore the results.
+    """
+
+    MODES = ("flag", "hide", "show")
+
+    def __init__(self, path=DEFAULT_PATH, mode="flag", recheck=5.0, clock=time.monotonic):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown dead link mode {mode!r}; expected one of {self.MODES}")
+        self.path = path
+        self.mode = mode
+        self._recheck = recheck
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._checked = None
+        self._dead = frozenset()
+
+    def version(self):
+        """Token that changes whenever the set of dead links may have changed."""
+        with self._lock:
+            now = self._clock()
+            if self._checked is None or now - self._checked >= self._recheck:
+                self._checked = now
+                try:
+                    mtime = os.stat(self.path).st_mtime_ns
+                except OSError:
+                    mtime = None
+                if mtime != self._mtime:
+                    self._mtime = mtime
+                    self._dead = frozenset(
+                        url for url, entry in load(self.path).items() if entry.get("dead"))
+            return self._mtime
+
+    def dead(self, url):
+        return self.mode != "show" and url in self._dead
+
+    def link(self, text, url):
+        """Markdown link to ``url``, flagged or hidden if the link is dead."""
+        if not self.dead(url):
+            return f"[{text}]({url})"
+        if self.mode == "hide":
+            return "Link unavailable"
+        return f"[{text}]({url}) (may be broken)"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the catalog's course links.")
+    parser.add_argument("urls", nargs="*", help="URLs to check (default: every catalog link)")
+    parser.add_argument("--path", default=DEFAULT_PATH, help="results file")
+    parser.add_argument("--max-age", type=float, default=0.0,
+                        help="skip links checked within this many seconds")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--per-host", type=int, default=PER_HOST)
+    parser.add_argument("--timeout", type=float, default=TIMEOUT)
+    args = parser.parse_args(argv)
+
+    urls = args.urls or catalog_urls()
+    started = time.perf_counter()
+    results = run(urls, args.path, args.max_age, concurrency=args.concurrency,
+                  per_host=args.per_host, timeout=args.timeout)
+    elapsed = time.perf_counter() - started
+    states = collections.Counter(entry["state"] for entry in results.values())
+    print(f"checked {len(results)} links in {elapsed:.1f}s: "
+          + ", ".join(f"{n} {state}" for state, n in sorted(states.items())))
+    for url, entry in sorted(results.items()):
+        if entry["dead"]:
+            print(f"dead  {entry['status'] or entry.get('error')}  {url}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
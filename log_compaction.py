@@ -0,0 +1,248 @@
+"""
+Compaction of the append-only progress log.  The app appends a row to the
+hot worksheet (``sheet1``) for every progress event, so left alone it grows
+until it hits the spreadsheet cell limit and every read of it slows down.
+``LogCompactor`` moves rows older than ``keep`` seconds out of the hot sheet:
+
+* raw rows are appended unchanged to monthly worksheets ``log-YYYY-MM``,
+  optionally in a separate archive spreadsheet;
+* the ``snapshots`` worksheet keeps exactly one row per (email, role) with
+  that user's latest state;
+* the ``deltas`` worksheet records, per event that changed a user's state,
+  which skills were added and removed;
+* the moved rows are deleted from the hot sheet.
+
+Row 1 of the hot sheet is a header and is never moved.  Its cell ``H1``
+counts the rows compaction has removed so far, which lets ``SheetSync`` keep
+a stable log position per row, and ``I1`` is set while a compaction is
+deleting rows.  Sheets started before the log had a header hold a record in
+row 1; the first run inserts the header above it, which moves every row down
+one position once.
+Keep ``keep`` well above how long the outbox may retry a row: the replayer
+only looks for already delivered event IDs in the hot sheet.  Run it offline
+or from cron:
+
+    python log_compaction.py --keep-hours 24
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from progress_log import TIMESTAMP_FORMAT, ProgressRecord, join_skills
+
+# Cells of the hot sheet's first row holding the compaction state.
+STATUS_RANGE = "H1:I1"
+# The whole first row: the header in A1:F1 and the compaction state.
+FIRST_ROW_RANGE = "A1:I1"
+SNAPSHOT_SHEET = "snapshots"
+DELTA_SHEET = "deltas"
+ARCHIVE_PREFIX = "log-"
+LOG_HEADER = ["Timestamp", "Email", "Role", "Completed", "Missing", "Event ID"]
+DELTA_HEADER = ["Timestamp", "Email", "Role", "Added", "Removed"]
+
+
+@dataclass(frozen=True)
+class CompactionResult:
+    moved: int
+    archives: tuple   # titles of the monthly worksheets written to
+    snapshots: int    # snapshot rows added or changed
+    deltas: int
+    offset: int       # rows removed from the hot sheet so far
+
+
+def parse_status(values):
+    """Return ``(offset, busy)`` from the ``STATUS_RANGE`` cells."""
+    cells = (values[0] if values else []) + ["", ""]
+    offset = int(cells[0]) if cells[0].strip().isdigit() else 0
+    return offset, bool(cells[1])
+
+
+def _timestamp(row):
+    try:
+        return datetime.strptime(row[0], TIMESTAMP_FORMAT)
+    except (ValueError, IndexError):
+        return None
+
+
+def _worksheet(spreadsheet, title, header):
+    """Return worksheet ``title``, creating it with ``header`` if needed."""
+    if title in {ws.title for ws in spreadsheet.worksheets()}:
+        return spreadsheet.worksheet(title)
+    ws = spreadsheet.add_worksheet(title=title, rows=1000, cols=len(header))
+    ws.append_rows([header])
+    return ws
+
+
+class LogCompactor:
+    """Moves old rows of the hot progress sheet into snapshots and archives."""
+
+    def __init__(self, spreadsheet, archive=None, keep=86400.0, chunk=5000, clock=datetime.now):
+        self._spreadsheet = spreadsheet
+        self._archive = archive if archive is not None else spreadsheet
+        self._keep = keep
+        self._chunk = chunk
+        self._clock = clock
+
+    def _old_rows(self, hot, start=2):
+        """Rows from row ``start`` on that were written before the retention cutoff.
+
+        Unparseable rows inside that prefix are moved along with it.
+        """
+        cutoff = self._clock() - timedelta(seconds=self._keep)
+        rows = []
+        while True:
+            chunk = hot.get(f"A{start}:F{start + self._chunk - 1}")
+            for row in chunk:
+                ts = _timestamp(row)
+                if ts is not None and ts >= cutoff:
+                    return rows
+                rows.append(list(row))
+            if len(chunk) < self._chunk:
+                return rows
+            start += self._chunk
+
+    def run(self, force=False, dry_run=False):
+        hot = self._spreadsheet.sheet1
+        first = (hot.get(FIRST_ROW_RANGE) or [[]])[0]
+        status = first[7:9]
+        offset, busy = parse_status([status])
+        if busy and not force:
+            raise RuntimeError(
+                "A previous compaction did not finish (I1 is set).  Its archive and "
+                "delta rows may be duplicated; re-run with --force to continue.")
+        # A record in row 1 means the sheet has no header yet.
+        headerless = _timestamp(first) is not None
+        rows = self._old_rows(hot, start=1 if headerless else 2)
+        if dry_run:
+            return CompactionResult(len(rows), (), 0, 0, offset)
+        if headerless:
+            # Insert the header with the status cells, so neither the record
+            # in row 1 nor its H/I cells are taken for compaction state.
+            hot.insert_row(LOG_HEADER + ["", str(offset), ""], index=1)
+            if any(status):
+                hot.update(range_name="H2:I2", values=[["", ""]])
+        if not rows:
+            return CompactionResult(0, (), 0, 0, offset)
+
+        # Mark the run first so a crash part-way is visible to the next run.
+        hot.update(range_name=STATUS_RANGE, values=[[str(offset), "compacting"]])
+        archives = self._archive_rows(rows)
+        snapshots, deltas = self._fold(rows)
+        hot.delete_rows(2, len(rows) + 1)
+        offset += len(rows)
+        hot.update(range_name=STATUS_RANGE, values=[[str(offset), ""]])
+        return CompactionResult(len(rows), archives, snapshots, deltas, offset)
+
+    def _archive_rows(self, rows):
+        by_month = {}
+        month = self._clock().strftime("%Y-%m")
+        for row in rows:
+            ts = _timestamp(row)
+            # Unparseable rows go with the row before them.
+            month = ts.strftime("%Y-%m") if ts is not None else month
+            by_month.setdefault(ARCHIVE_PREFIX + month, []).append(row)
+        for title, month_rows in by_month.items():
+            _worksheet(self._archive, title, LOG_HEADER).append_rows(month_rows)
+        return tuple(by_month)
+
+    def _fold(self, rows):
+        """Merge ``rows`` into the snapshot sheet and append their deltas."""
+        sheet = _worksheet(self._spreadsheet, SNAPSHOT_SHEET, LOG_HEADER[:5])
+        position, state = {}, {}
+        for number, row in enumerate(sheet.get_all_values()[1:], start=2):
+            try:
+                record = ProgressRecord.from_row(row)
+            except (ValueError, IndexError):
+                continue
+            position[(record.email, record.role)] = number
+            state[(record.email, record.role)] = record
+
+        deltas, changed = [], {}
+        for row in rows:
+            try:
+                record = ProgressRecord.from_row(row)
+            except (ValueError, IndexError):
+                continue
+            key = (record.email, record.role)
+            previous = state.get(key)
+            if previous is not None and previous.timestamp > record.timestamp:
+                continue
+            # Walk the tuples, not sets, so deltas list skills in the order
+            # they were recorded and repeated compactions write identical rows.
+            before = previous.completed if previous is not None else ()
+            had, has = set(before), set(record.completed)
+            added = [s for s in record.completed if s not in had]
+            removed = [s for s in before if s not in has]
+            if previous is None or added or removed:
+                deltas.append([row[0], record.email, record.role,
+                               join_skills(added), join_skills(removed)])
+            state[key] = record
+            changed[key] = record
+
+        updates, appended = [], []
+        for key, record in changed.items():
+            if key in position:
+                number = position[key]
+                updates.append({"range": f"A{number}:E{number}", "values": [record.to_row()]})
+            else:
+                appended.append(record.to_row())
+        if updates:
+            sheet.batch_update(updates)
+        if appended:
+            sheet.append_rows(appended)
+        if deltas:
+            _worksheet(self._spreadsheet, DELTA_SHEET, DELTA_HEADER).append_rows(deltas)
+        return len(changed), len(deltas)
+
+
+def read_snapshots(spreadsheet):
+    """Return the rows of the snapshot sheet, or [] before the first compaction."""
+    if SNAPSHOT_SHEET not in {ws.title for ws in spreadsheet.worksheets()}:
+        return []
+    return spreadsheet.worksheet(SNAPSHOT_SHEET).get_all_values()[1:]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compact the progress log.")
+    parser.add_argument("--credentials", help="service account JSON file (default: $GCP_CREDENTIALS)")
+    parser.add_argument("--keep-hours", type=float, default=24.0,
+                        help="leave rows newer than this in the hot sheet")
+    parser.add_argument("--archive-url", help="spreadsheet for the monthly logs (default: the same)")
+    parser.add_argument("--chunk", type=int, default=5000)
+    parser.add_argument("--every", type=float, metavar="MINUTES",
+                        help="keep running, compacting every MINUTES")
+    parser.add_argument("--force", action="store_true", help="continue after an interrupted run")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    from sheets_connection import SheetsConnection, load_credentials
+
+    creds = load_credentials(args.credentials)
+    sheets = SheetsConnection(creds)
+    archive = SheetsConnection(creds, url=args.archive_url) if args.archive_url else None
+    while True:
+        try:
+            compactor = LogCompactor(sheets.spreadsheet(),
+                                     archive.spreadsheet() if archive else None,
+                                     keep=args.keep_hours * 3600, chunk=args.chunk)
+            result = compactor.run(force=args.force, dry_run=args.dry_run)
+        except Exception as exc:
+            if not args.every:
+                raise
+            # A 429, a dropped connection or an unfinished run should not end
+            # the schedule; the next run starts from what the sheet holds then.
+            print(f"compaction failed: {exc!r}", file=sys.stderr, flush=True)
+        else:
+            verb = "would move" if args.dry_run else "moved"
+            print(f"{verb} {result.moved} rows; {result.snapshots} snapshots, "
+                  f"{result.deltas} deltas, offset {result.offset}", flush=True)
+        if not args.every:
+            return 0
+        time.sleep(args.every * 60)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
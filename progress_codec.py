@@ -0,0 +1,182 @@
+"""
+Compact encoding of the skill columns of progress rows.  A plain row spells
+out every completed and missing skill name, repeating the role's whole skill
+list on each row.  A compact row instead stores the completed skills as
+
+    c1:<catalog version>:<hex bitmask>
+
+where bit ``i`` of the mask is the role's ``i``-th skill in that catalog
+version, and leaves the missing-skills cell empty: missing skills are the
+rest of the role.  ``ProgressRecord`` decodes both forms transparently.
+
+Decoding a row needs the catalog it was written with, so every catalog
+version that has been used for writes is archived in
+``catalog_versions.json``.  The version covers only the ordered skill names
+of each role, not the course links.  After changing the skills in
+``roles_data`` run
+
+    python progress_codec.py freeze
+
+before deploying; a process whose catalog is not archived writes plain
+rows.  Existing plain rows are rewritten in place with
+
+    python progress_codec.py migrate --chunk 2000
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+
+from role_catalog import CATALOG
+
+PREFIX = "c1"
+VERSIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "catalog_versions.json")
+
+_versions = None
+_versions_lock = threading.Lock()
+
+
+def _load_versions(path=VERSIONS_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _archive():
+    global _versions
+    with _versions_lock:
+        if _versions is None:
+            _versions = _load_versions()
+        return _versions
+
+
+def is_archived(version):
+    """Whether rows written with catalog ``version`` can be decoded elsewhere."""
+    return version in _archive()
+
+
+def _role_skills(version, role):
+    """Skill names of ``role`` in catalog ``version``, in bit order."""
+    if version == CATALOG.version:
+        return CATALOG.skill_names(role)
+    try:
+        return _archive()[version][role]
+    except KeyError:
+        raise ValueError(f"unknown catalog version {version!r} for role {role!r}") from None
+
+
+def is_compact(cell):
+    return cell.startswith(PREFIX + ":")
+
+
+def encode(role, completed, catalog=CATALOG):
+    """Return the compact completed-skills cell, or None if it cannot be encoded.
+
+    Rows for roles or skills missing from ``catalog`` keep the plain form,
+    and so does every row while ``catalog`` is not archived: other processes
+    and later releases could not decode it.
+    """
+    entry = catalog.roles.get(role)
+    if entry is None or not is_archived(catalog.version):
+        return None
+    position = {skill_id: i for i, skill_id in enumerate(entry.skill_ids)}
+    mask = 0
+    for skill in completed:
+        i = position.get(catalog.skill_ids.get(skill))
+        if i is None:
+            return None
+        mask |= 1 << i
+    return f"{PREFIX}:{catalog.version}:{mask:x}"
+
+
+def decode(role, cell):
+    """Return ``(completed, missing)`` name tuples for a compact cell."""
+    prefix, version, mask = cell.split(":")
+    if prefix != PREFIX:
+        raise ValueError(f"unsupported encoding {prefix!r}")
+    mask = int(mask, 16)
+    skills = _role_skills(version, role)
+    completed = tuple(s for i, s in enumerate(skills) if mask >> i & 1)
+    missing = tuple(s for i, s in enumerate(skills) if not mask >> i & 1)
+    return completed, missing
+
+
+def freeze(path=VERSIONS_PATH, catalog=CATALOG):
+    """Archive ``catalog`` in ``path``; return False if it was already there."""
+    versions = _load_versions(path)
+    if catalog.version in versions:
+        return False
+    versions[catalog.version] = {role: catalog.skill_names(role) for role in catalog.role_names}
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump(versions, fh, indent=1, ensure_ascii=False)
+        fh.write("\n")
+    os.replace(tmp, path)
+    global _versions
+    with _versions_lock:
+        _versions = None
+    return True
+
+
+def migrate(run, chunk=2000, dry_run=False):
+    """Rewrite plain rows of the worksheet in compact form.
+
+    Rows are read ``chunk`` at a time with ranged reads and each chunk's
+    changes go out in one ``batch_update``.  Returns ``(scanned, rewritten)``.
+    """
+    # Imported here: progress_log decodes compact rows through this module.
+    from progress_log import split_skills
+
+    scanned = rewritten = 0
+    start = 1
+    while True:
+        rows = run(lambda ws: ws.get(f"A{start}:E{start + chunk - 1}"))
+        updates = []
+        for offset, row in enumerate(rows):
+            row = list(row) + [""] * (5 - len(row))
+            if not row[1] or is_compact(row[3]):
+                continue
+            cell = encode(row[2], split_skills(row[3]))
+            if cell is not None:
+                number = start + offset
+                updates.append({"range": f"D{number}:E{number}", "values": [[cell, ""]]})
+        if updates and not dry_run:
+            run(lambda ws: ws.batch_update(updates))
+        scanned += len(rows)
+        rewritten += len(updates)
+        if len(rows) < chunk:
+            return scanned, rewritten
+        start += chunk
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the compact progress row encoding.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("freeze", help="archive the current catalog version")
+    p_migrate = sub.add_parser("migrate", help="rewrite plain sheet rows in compact form")
+    p_migrate.add_argument("--credentials", help="service account JSON file (default: $GCP_CREDENTIALS)")
+    p_migrate.add_argument("--chunk", type=int, default=2000)
+    p_migrate.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "freeze":
+        added = freeze()
+        print(f"catalog {CATALOG.version} {'archived' if added else 'already archived'}")
+        return 0
+
+    from sheets_connection import SheetsConnection, load_credentials
+
+    if CATALOG.version not in _load_versions():
+        parser.error(f"catalog {CATALOG.version} is not archived; run 'freeze' first")
+    sheets = SheetsConnection(load_credentials(args.credentials))
+    scanned, rewritten = migrate(sheets.run, args.chunk, args.dry_run)
+    verb = "would rewrite" if args.dry_run else "rewrote"
+    print(f"scanned {scanned} rows, {verb} {rewritten}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
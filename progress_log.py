@@ -0,0 +1,91 @@
+"""
+Row format of the progress log.  Every progress event is one worksheet row of
+timestamp, email, role, completed skills and missing skills, where the two
+skill columns hold comma separated skill names, or the compact encoding of
+``progress_codec``.  ``ProgressRecord`` is the parsed form shared by the
+writers and readers of the log.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import progress_codec
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+SKILL_SEPARATOR = ", "
+
+
+def join_skills(skills):
+    return SKILL_SEPARATOR.join(skills)
+
+
+def split_skills(cell):
+    """Split a skill column back into names.
+
+    Skill names may themselves contain ", " inside parentheses, e.g.
+    "Big Data (Spark, Hadoop)", so separators are only honoured at depth 0.
+    """
+    if not cell:
+        return ()
+    if "(" not in cell:
+        return tuple(s.strip() for s in cell.split(SKILL_SEPARATOR) if s.strip())
+    skills, depth, start = [], 0, 0
+    for i, ch in enumerate(cell):
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth = max(depth - 1, 0)
+        elif depth == 0 and cell.startswith(SKILL_SEPARATOR, i):
+            skills.append(cell[start:i])
+            start = i + len(SKILL_SEPARATOR)
+    skills.append(cell[start:])
+    return tuple(s.strip() for s in skills if s.strip())
+
+
+@dataclass(frozen=True)
+class ProgressRecord:
+    timestamp: datetime
+    email: str
+    role: str
+    completed: tuple
+    missing: tuple
+
+    @classmethod
+    def now(cls, email, role, completed, missing):
+        return cls(datetime.now().replace(microsecond=0), email, role,
+                   tuple(completed), tuple(missing))
+
+    @property
+    def state_key(self):
+        """Identity of the progress state, ignoring when it was recorded."""
+        return (self.email, self.role, frozenset(self.completed))
+
+    def to_row(self, compact=True):
+        """Worksheet cells; ``compact`` uses the ``progress_codec`` encoding
+        when the role and all its skills are in the catalog and the catalog
+        version is archived in ``catalog_versions.json``."""
+        cell = progress_codec.encode(self.role, self.completed) if compact else None
+        return [
+            self.timestamp.strftime(TIMESTAMP_FORMAT),
+            self.email,
+            self.role,
+            join_skills(self.completed) if cell is None else cell,
+            join_skills(self.missing) if cell is None else "",
+        ]
+
+    @classmethod
+    def from_row(cls, row):
+        row = list(row) + [""] * (5 - len(row))
+        return cls(
+            datetime.strptime(row[0], TIMESTAMP_FORMAT),
+            row[1],
+            row[2],
+            *decode_skills(row[2], row[3], row[4]),
+        )
+
+
+def decode_skills(role, completed, missing):
+    """``(completed, missing)`` name tuples from the two skill cells."""
+    if progress_codec.is_compact(completed):
+        return progress_codec.decode(role, completed)
+    return split_skills(completed), split_skills(missing)
@@ -0,0 +1,349 @@
+"""
+Durable local outbox for progress rows.  Every progress event is appended to
+an SQLite database in WAL mode before anything is sent to Google Sheets, so a
+quota error, an outage or a process restart no longer loses a user's
+progress.  ``OutboxReplayer`` drains pending events to the sheet in the order
+they were written.
+
+Delivery is at-least-once: each event carries an idempotency key that is
+written as an extra trailing column of its sheet row.  When a batch is
+retried after a failure whose outcome is unknown, keys already present in
+the sheet are marked as sent instead of being appended twice.  The first
+failure records the log position the batch would have been appended at, so
+the retry only reads the keys of rows appended since then.
+
+Several app processes on a host may share one outbox file.  Each appends
+to it, but a replayer only drains it while holding an exclusive lock on
+``<path>.lock``, so two processes never send the same batch.  Delivered
+events are purged once they are ``RETENTION`` seconds old.
+
+Run ``python progress_outbox.py --help`` to inspect or replay pending events
+from the command line.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import urllib.parse
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # Windows: one app process per outbox.
+    fcntl = None
+
+from log_compaction import STATUS_RANGE, parse_status
+
+DEFAULT_PATH = "progress_outbox.db"
+# Sent events are kept this long for inspection, then purged.
+RETENTION = 7 * 86400
+PURGE_INTERVAL = 3600
+
+# 1-based column holding the idempotency key in the progress worksheet.
+EVENT_ID_COLUMN = 6
+# First row number of an A1 range such as "Sheet1!A10:F12".
+_ROW_RE = re.compile(r"^(?:.*!)?[A-Z]*(\d+)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL UNIQUE,
+    row TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    sent_at REAL,
+    check_from INTEGER
+);
+CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (seq) WHERE sent_at IS NULL;
+"""
+
+
+class Outbox:
+    """Append-only, crash-safe queue of progress rows backed by SQLite."""
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL keeps commits durable across process crashes while avoiding
+        # an fsync per event; WAL lets readers run alongside the writer.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(outbox)")}
+        if "check_from" not in columns:
+            # Outboxes written before retries recorded where to look.
+            self._conn.execute("ALTER TABLE outbox ADD COLUMN check_from INTEGER")
+
+    def append(self, row, event_id=None):
+        """Store ``row`` and return its idempotency key.
+
+        ``event_id`` lets a caller that may submit the same event twice
+        pick the key itself; appending a key already stored is a no-op.
+        """
+        event_id = event_id or uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO outbox (event_id, row, created_at) VALUES (?, ?, ?)",
+                (event_id, json.dumps(row), time.time()),
+            )
+        return event_id
+
+    def pending(self, limit=None):
+        """Return unsent events as ``(seq, event_id, row, attempts)``, oldest first."""
+        sql = "SELECT seq, event_id, row, attempts FROM outbox WHERE sent_at IS NULL ORDER BY seq"
+        params = ()
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (limit,)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [(seq, event_id, json.loads(row), attempts) for seq, event_id, row, attempts in rows]
+
+    def pending_count(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE sent_at IS NULL").fetchone()[0]
+
+    def stats(self):
+        """Return counts of pending and sent events and the oldest pending age."""
+        with self._lock:
+            pending, oldest = self._conn.execute(
+                "SELECT COUNT(*), MIN(created_at) FROM outbox WHERE sent_at IS NULL").fetchone()
+            sent = self._conn.execute(
+                "SELECT COUNT(*) FROM outbox WHERE sent_at IS NOT NULL").fetchone()[0]
+        return {
+            "pending": pending,
+            "sent": sent,
+            "oldest_pending_age": None if oldest is None else time.time() - oldest,
+        }
+
+    def mark_sent(self, seqs):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE outbox SET sent_at = ? WHERE seq = ?", [(now, seq) for seq in seqs])
+
+    def mark_failed(self, seqs, error, check_from=None):
+        """Count a failed attempt; the first one records ``check_from``, the
+        log position from which the events may have reached the sheet."""
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE outbox SET attempts = attempts + 1, last_error = ?,"
+                " check_from = CASE WHEN attempts = 0 THEN ? ELSE check_from END WHERE seq = ?",
+                [(error, check_from, seq) for seq in seqs])
+
+    def check_from(self, seqs):
+        """Lowest recorded ``check_from`` of ``seqs``, or None if any is unknown."""
+        with self._lock:
+            unknown, lowest = self._conn.execute(
+                f"SELECT COUNT(*) - COUNT(check_from), MIN(check_from) FROM outbox"
+                f" WHERE attempts > 0 AND seq IN ({','.join('?' * len(seqs))})", seqs).fetchone()
+        return None if unknown else lowest
+
+    def purge(self, older_than):
+        """Delete events sent more than ``older_than`` seconds ago."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM outbox WHERE sent_at IS NOT NULL AND sent_at < ?",
+                (time.time() - older_than,))
+        return cur.rowcount
+
+    @contextlib.contextmanager
+    def drain_lock(self):
+        """Hold the outbox's replay lock; yield False if another process has it."""
+        if fcntl is None:
+            yield True
+            return
+        fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            yield True
+        finally:
+            # Closing the descriptor releases the lock.
+            os.close(fd)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def _column_letter(number):
+    letters = ""
+    while number:
+        number, rest = divmod(number - 1, 26)
+        letters = chr(ord("A") + rest) + letters
+    return letters
+
+
+def has_pending(path=DEFAULT_PATH):
+    """Whether the outbox at ``path`` exists and holds unsent events.
+
+    Opens the file read-only, so probing never creates an outbox.
+    """
+    if not os.path.exists(path):
+        return False
+    try:
+        conn = sqlite3.connect(f"file:{urllib.parse.quote(os.path.abspath(path))}?mode=ro",
+                               uri=True)
+        try:
+            return conn.execute(
+                "SELECT 1 FROM outbox WHERE sent_at IS NULL LIMIT 1").fetchone() is not None
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return False
+
+
+class OutboxReplayer:
+    """Sends pending outbox events to the sheet in order.
+
+    ``run`` is a callable taking ``fn(worksheet)``, such as
+    ``SheetsConnection.run``.  ``replay`` drains the outbox only while it
+    holds the outbox's replay lock, and purges events delivered more than
+    ``retention`` seconds ago at most every ``purge_interval`` seconds.
+    """
+
+    def __init__(self, outbox, run, batch_size=50, retention=RETENTION,
+                 purge_interval=PURGE_INTERVAL, clock=time.monotonic):
+        self._outbox = outbox
+        self._run = run
+        self._batch_size = batch_size
+        self._retention = retention
+        self._purge_interval = purge_interval
+        self._clock = clock
+        self._last_purge = None
+        # Compaction offset last read from the sheet, and a lower bound on
+        # the log position of the last row this replayer appended.  The
+        # bound uses an offset read before the append, and compaction only
+        # raises the offset, so it never overshoots.
+        self._offset = None
+        self._end = None
+
+    def _present(self, seqs):
+        """Event IDs already in the sheet that a failed attempt of ``seqs``
+        may have written."""
+        start = self._outbox.check_from(seqs)
+        if start is None:
+            return set(self._run(lambda ws: ws.col_values(EVENT_ID_COLUMN)))
+        # Rows move up when compaction deletes older ones, so the sheet row
+        # of ``start`` depends on the current offset, which comes back in
+        # the same request; a wrong guess costs a second read.
+        column = _column_letter(EVENT_ID_COLUMN)
+        guess = self._offset or 0
+        status, cells = self._run(lambda ws: ws.batch_get(
+            [STATUS_RANGE, f"{column}{max(start - guess, 1)}:{column}"]))
+        self._offset = parse_status(status)[0]
+        if self._offset != guess:
+            cells = self._run(lambda ws: ws.get(f"{column}{max(start - self._offset, 1)}:{column}"))
+        return {row[0] for row in cells if row}
+
+    def _appended(self, response):
+        """Move ``_end`` past the rows reported by an ``append_rows`` response."""
+        updates = response.get("updates", {}) if isinstance(response, dict) else {}
+        match = _ROW_RE.search(updates.get("updatedRange", ""))
+        if match is None or not updates.get("updatedRows"):
+            self._end = None
+            return
+        self._end = (self._offset or 0) + int(match.group(1)) + updates["updatedRows"] - 1
+
+    def replay_batch(self):
+        """Send the oldest pending batch; return how many events were delivered."""
+        batch = self._outbox.pending(self._batch_size)
+        if not batch:
+            return 0
+        seqs = [seq for seq, _, _, _ in batch]
+        check_from = None if self._end is None else self._end + 1
+        try:
+            if any(attempts for _, _, _, attempts in batch):
+                # A previous attempt may have reached the sheet before it
+                # failed, so skip events whose key is already recorded.
+                present = self._present([seq for seq, _, _, attempts in batch if attempts])
+                done = [seq for seq, event_id, _, _ in batch if event_id in present]
+                if done:
+                    self._outbox.mark_sent(done)
+                batch = [item for item in batch if item[1] not in present]
+            rows = [row + [event_id] for _, event_id, row, _ in batch]
+            if rows:
+                self._appended(self._run(lambda ws: ws.append_rows(rows)))
+        except Exception as exc:
+            self._outbox.mark_failed(seqs, repr(exc), check_from)
+            raise
+        self._outbox.mark_sent([seq for seq, _, _, _ in batch])
+        return len(seqs)
+
+    def replay(self):
+        """Drain the outbox; return the number of events delivered.
+
+        Returns 0 without sending anything while another process drains it.
+        """
+        total = 0
+        with self._outbox.drain_lock() as acquired:
+            if not acquired:
+                return 0
+            while True:
+                sent = self.replay_batch()
+                if not sent:
+                    break
+                total += sent
+            now = self._clock()
+            if self._last_purge is None or now - self._last_purge >= self._purge_interval:
+                self._last_purge = now
+                self._outbox.purge(self._retention)
+        return total
+
+
+def _connect_sheets(args):
+    from sheets_connection import SheetsConnection, load_credentials
+
+    return SheetsConnection(load_credentials(args.credentials))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect and replay the progress outbox.")
+    parser.add_argument("--db", default=DEFAULT_PATH, help="outbox database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("status", help="show pending and sent counts")
+    list_cmd = sub.add_parser("list", help="print pending events")
+    list_cmd.add_argument("--limit", type=int, default=20)
+    replay_cmd = sub.add_parser("replay", help="send pending events to the sheet")
+    replay_cmd.add_argument("--credentials", help="service account JSON file (default: $GCP_CREDENTIALS)")
+    replay_cmd.add_argument("--batch-size", type=int, default=50)
+    purge_cmd = sub.add_parser("purge", help="delete events sent more than N days ago")
+    purge_cmd.add_argument("--days", type=float, default=RETENTION / 86400)
+    args = parser.parse_args(argv)
+
+    outbox = Outbox(args.db)
+    if args.command == "status":
+        print(json.dumps(outbox.stats(), indent=2))
+    elif args.command == "list":
+        for seq, event_id, row, attempts in outbox.pending(args.limit):
+            print(f"{seq}\t{event_id}\tattempts={attempts}\t{json.dumps(row)}")
+    elif args.command == "replay":
+        replayer = OutboxReplayer(outbox, _connect_sheets(args).run, args.batch_size)
+        with outbox.drain_lock() as free:
+            busy = not free
+        if busy:
+            print("another process is replaying this outbox", file=sys.stderr)
+            return 1
+        print(f"replayed {replayer.replay()} events")
+    elif args.command == "purge":
+        print(f"purged {outbox.purge(args.days * 86400)} events")
+    outbox.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+"""
+Pluggable storage for progress records.  ``ProgressStore`` is the interface
+the app uses for progress writes, latest-state reads and history queries;
+two backends ship with it:
+
+* ``SheetsProgressStore`` keeps the Google Sheets log as the system of
+  record.  Writes go through the ``ProgressWriter`` outbox; reads come from
+  a ``sheet_sync.SheetSync`` Parquet cache when one is given, kept current
+  by a background thread, and fetch rows from the worksheet otherwise.
+  With a ``LatestStateIndex``, ``latest`` is an indexed lookup by email
+  instead of a scan of the log.
+* ``SQLiteProgressStore`` keeps an indexed local log plus a latest-state
+  table per (email, role).  It sustains thousands of writes per second on a
+  single node and can optionally mirror every accepted record to Sheets
+  asynchronously through a ``ProgressWriter``.
+
+The app selects a backend with the ``PROGRESS_BACKEND`` setting.
+"""
+
+import abc
+import functools
+import sqlite3
+import threading
+from datetime import datetime
+
+import rerun_metrics
+from progress_log import TIMESTAMP_FORMAT, ProgressRecord, join_skills, split_skills
+
+BACKENDS = ("sqlite", "sheets")
+
+
+def _instrumented(method):
+    """Count calls and failures of a store method per backend."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        labels = {"backend": self.backend, "op": method.__name__}
+        rerun_metrics.inc("storage_calls_total", **labels)
+        try:
+            return method(self, *args, **kwargs)
+        except Exception:
+            rerun_metrics.inc("storage_failures_total", **labels)
+            raise
+    return wrapper
+
+
+class ProgressStore(abc.ABC):
+    """Interface implemented by every progress backend."""
+
+    @abc.abstractmethod
+    def record(self, record):
+        """Persist ``record``; return False if it repeats the latest state."""
+
+    @abc.abstractmethod
+    def latest(self, email):
+        """Return ``{role: ProgressRecord}`` with the newest record per role."""
+
+    @abc.abstractmethod
+    def history(self, email, role=None, since=None, limit=None):
+        """Return the user's records oldest first, optionally filtered."""
+
+    @abc.abstractmethod
+    def tail(self, cursor=0, limit=1000):
+        """Return ``(records, next_cursor)`` for the log after ``cursor``."""
+
+    def close(self):
+        pass
+
+
+class SheetsProgressStore(ProgressStore):
+    """Progress log kept in the Google Sheets worksheet."""
+
+    backend = "sheets"
+
+    def __init__(self, sheets, writer, sync=None, index=None, max_age=30.0, background=True):
+        """``sync`` is an optional ``SheetSync``.  With ``background`` a
+        daemon thread syncs it right away and then every ``max_age``
+        seconds, so reads never wait on the sheet; otherwise it is refreshed
+        at most every ``max_age`` seconds before a read.  ``index`` is an
+        optional ``LatestStateIndex`` kept current from writes and from
+        ``sync``."""
+        self._sheets = sheets
+        self._writer = writer
+        self._sync = sync
+        self._index = index
+        self._max_age = max_age
+        self._stop = threading.Event()
+        self._refresher = None
+        if sync is not None and background:
+            self._refresher = threading.Thread(target=self._refresh_loop, name="sheet-sync", daemon=True)
+            self._refresher.start()
+
+    def _catch_up(self):
+        self._sync.sync()
+        if self._index is not None:
+            self._index.catch_up(self._sync)
+
+    def _refresh_loop(self):
+        while True:
+            try:
+                self._catch_up()
+            except Exception:
+                rerun_metrics.inc("storage_failures_total", backend=self.backend, op="sync")
+            if self._stop.wait(self._max_age):
+                return
+
+    def _refresh(self):
+        """Bring the cache up to date on the caller's thread when no
+        background refresher keeps it current."""
+        if self._refresher is None:
+            self._sync.refresh(self._max_age)
+            if self._index is not None:
+                self._index.catch_up(self._sync)
+
+    @_instrumented
+    def record(self, record):
+        accepted = self._writer.submit(record)
+        if accepted and self._index is not None:
+            self._index.update([record])
+        return accepted
+
+    def _records(self, email):
+        if self._sync is not None:
+            self._refresh()
+            return _from_frame(self._sync.read(filters=[("email", "==", email)]))
+        rows = self._sheets.run(lambda ws: ws.get_all_values())
+        return [rec for rec in map(_parse_row, rows) if rec is not None and rec.email == email]
+
+    @_instrumented
+    def latest(self, email):
+        if self._index is not None:
+            if self._sync is not None:
+                self._refresh()
+            latest = self._index.get(email)
+        else:
+            latest = {rec.role: rec for rec in self._records(email)}
+        # The writer need not re-send state the sheet already holds.
+        for rec in latest.values():
+            self._writer.seed(rec)
+        return latest
+
+    @_instrumented
+    def history(self, email, role=None, since=None, limit=None):
+        records = [
+            rec for rec in self._records(email)
+            if (role is None or rec.role == role)
+            and (since is None or rec.timestamp >= since)
+        ]
+        return records[:limit] if limit is not None else records
+
+    @_instrumented
+    def tail(self, cursor=0, limit=1000):
+        if self._sync is not None:
+            # Cache positions stay valid when the hot sheet is compacted.
+            self._refresh()
+            frame = self._sync.read(filters=[("row", ">", cursor)]).head(limit)
+            records = _from_frame(frame)
+            return records, int(frame["row"].iloc[-1]) if len(frame) else cursor
+        rows = self._sheets.run(lambda ws: ws.get(f"A{cursor + 1}:E{cursor + limit}"))
+        records = [rec for rec in map(_parse_row, rows) if rec is not None]
+        return records, cursor + len(rows)
+
+    def close(self):
+        self._stop.set()
+        if self._refresher is not None:
+            self._refresher.join(10.0)
+        self._writer.close()
+        if self._index is not None:
+            self._index.close()
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts TEXT NOT NULL,
+    email TEXT NOT NULL,
+    role TEXT NOT NULL,
+    completed TEXT NOT NULL,
+    missing TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS progress_by_user ON progress (email, role, seq);
+CREATE TABLE IF NOT EXISTS latest (
+    email TEXT NOT NULL,
+    role TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (email, role)
+) WITHOUT ROWID;
+"""
+
+_COLUMNS = "seq, ts, email, role, completed, missing"
+
+
+class SQLiteProgressStore(ProgressStore):
+    """Indexed local progress log with optional asynchronous Sheets mirroring."""
+
+    backend = "sqlite"
+
+    def __init__(self, path, mirror=None):
+        self.path = path
+        self._mirror = mirror
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30.0,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @_instrumented
+    def record(self, record):
+        completed = join_skills(record.completed)
+        with self._lock:
+            current = self._conn.execute(
+                "SELECT p.completed FROM latest l JOIN progress p ON p.seq = l.seq "
+                "WHERE l.email = ? AND l.role = ?", (record.email, record.role)).fetchone()
+            if current is not None and frozenset(split_skills(current[0])) == frozenset(record.completed):
+                return False
+            self._conn.execute("BEGIN")
+            try:
+                seq = self._conn.execute(
+                    "INSERT INTO progress (ts, email, role, completed, missing) VALUES (?, ?, ?, ?, ?)",
+                    (record.timestamp.strftime(TIMESTAMP_FORMAT), record.email, record.role,
+                     completed, join_skills(record.missing))).lastrowid
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO latest (email, role, seq) VALUES (?, ?, ?)",
+                    (record.email, record.role, seq))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if self._mirror is not None:
+            self._mirror.submit(record)
+        return True
+
+    def _query(self, sql, params):
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_from_db(row) for row in rows]
+
+    @_instrumented
+    def latest(self, email):
+        records = self._query(
+            f"SELECT {_COLUMNS} FROM progress WHERE seq IN "
+            "(SELECT seq FROM latest WHERE email = ?)", (email,))
+        return {rec.role: rec for _, rec in records}
+
+    @_instrumented
+    def history(self, email, role=None, since=None, limit=None):
+        sql = f"SELECT {_COLUMNS} FROM progress WHERE email = ?"
+        params = [email]
+        if role is not None:
+            sql += " AND role = ?"
+            params.append(role)
+        if since is not None:
+            sql += " AND ts >= ?"
+            params.append(since.strftime(TIMESTAMP_FORMAT))
+        sql += " ORDER BY seq"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [rec for _, rec in self._query(sql, params)]
+
+    @_instrumented
+    def tail(self, cursor=0, limit=1000):
+        rows = self._query(
+            f"SELECT {_COLUMNS} FROM progress WHERE seq > ? ORDER BY seq LIMIT ?", (cursor, limit))
+        if not rows:
+            return [], cursor
+        return [rec for _, rec in rows], rows[-1][0]
+
+    def close(self):
+        if self._mirror is not None:
+            self._mirror.close()
+        with self._lock:
+            self._conn.close()
+
+
+def _from_db(row):
+    seq, ts, email, role, completed, missing = row
+    return seq, ProgressRecord(datetime.strptime(ts, TIMESTAMP_FORMAT), email, role,
+                               split_skills(completed), split_skills(missing))
+
+
+def _from_frame(frame):
+    """Records from a ``SheetSync`` cache frame."""
+    return [
+        ProgressRecord(ts.to_pydatetime(), email, role, tuple(completed), tuple(missing))
+        for ts, email, role, completed, missing in zip(
+            frame["timestamp"], frame["email"], frame["role"], frame["completed"], frame["missing"])
+    ]
+
+
+def _parse_row(row):
+    """Parse a worksheet row, skipping headers and malformed rows."""
+    try:
+        return ProgressRecord.from_row(row)
+    except (ValueError, IndexError):
+        return None
@@ -0,0 +1,177 @@
+"""
+Write-behind queue for progress rows.  ``app.py`` used to call
+``sheet.append_row`` synchronously on every rerun, including reruns caused by
+unrelated widgets.  ``ProgressWriter`` takes rows off the render path: the
+script submits a ``ProgressRecord``, which is appended to the durable local
+outbox (see ``progress_outbox``), and a background thread replays queued rows
+to the sheet in ``append_rows`` batches once enough rows are waiting or the
+oldest has waited long enough.
+
+Rows whose (email, role, completed set) matches the last row accepted for
+that user and role carry no new information and are dropped at submit time.
+The last accepted state is kept for the ``max_states`` most recently active
+users and roles.
+"""
+
+import collections
+import threading
+import time
+
+from progress_outbox import has_pending
+
+MAX_STATES = 10000
+
+
+class ProgressWriter:
+    """Queues progress records in an outbox and drains it in the background.
+
+    ``replayer`` is an ``OutboxReplayer`` over ``outbox``.  Failed batches
+    stay in the outbox and are retried with capped exponential backoff, so
+    rows queued before a restart are sent once the writer starts again.
+    """
+
+    def __init__(self, outbox, replayer, batch_size=50, flush_interval=2.0,
+                 max_backoff=60.0, max_states=MAX_STATES):
+        self._outbox = outbox
+        self._replayer = replayer
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_backoff = max_backoff
+        self._max_states = max_states
+        self._last_state = collections.OrderedDict()
+        self._cond = threading.Condition()
+        self._unsent = 0
+        self._wake = False
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name="progress-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, record, event_id=None):
+        """Queue ``record``; return False if it duplicates the last known state.
+
+        ``event_id`` is passed to ``Outbox.append`` as the row's idempotency key.
+        """
+        key = (record.email, record.role)
+        state = frozenset(record.completed)
+        with self._cond:
+            if self._last_state.get(key) == state:
+                self._last_state.move_to_end(key)
+                return False
+        # Remember the state only once it is in the outbox, so a failed
+        # append is retried by the next submit instead of being dropped.
+        self._outbox.append(record.to_row(), event_id)
+        with self._cond:
+            self._remember(key, state)
+            self._unsent += 1
+            if self._unsent >= self._batch_size:
+                self._wake = True
+                self._cond.notify_all()
+        return True
+
+    def seed(self, record):
+        """Remember ``record`` as already persisted without writing it."""
+        with self._cond:
+            self._remember((record.email, record.role), frozenset(record.completed))
+
+    def _remember(self, key, state):
+        self._last_state[key] = state
+        self._last_state.move_to_end(key)
+        if len(self._last_state) > self._max_states:
+            self._last_state.popitem(last=False)
+
+    def pending(self):
+        return self._outbox.pending_count()
+
+    def flush(self, timeout=None):
+        """Block until the outbox is drained or ``timeout`` passes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._wake = True
+            self._cond.notify_all()
+        while self._outbox.pending_count():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def close(self, timeout=10.0):
+        """Flush outstanding rows and stop the background thread.
+
+        Rows that cannot be sent in time remain in the outbox for the next
+        process or for ``python progress_outbox.py replay``.
+        """
+        self.flush(timeout)
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _run(self):
+        backoff = 0.0
+        while True:
+            with self._cond:
+                if backoff:
+                    # After a failure, wait out the backoff even when full
+                    # batches or a flush ask for an early replay.
+                    deadline = time.monotonic() + backoff
+                    while not self._closing and time.monotonic() < deadline:
+                        self._cond.wait(deadline - time.monotonic())
+                elif not self._wake and not self._closing:
+                    self._cond.wait(self._flush_interval)
+                if self._closing:
+                    return
+                self._wake = False
+                self._unsent = 0
+            try:
+                self._replayer.replay()
+            except Exception:
+                backoff = min(max(backoff * 2, 1.0), self._max_backoff)
+                continue
+            backoff = 0.0
+
+
+class LazyProgressWriter:
+    """``ProgressWriter`` built by ``factory`` on the first submitted record.
+
+    Processes that never write never open the outbox, start the replay
+    thread or connect to Sheets.  When ``outbox_path`` holds rows an earlier
+    process left unsent, the writer is built at once on a background thread
+    so they are replayed without waiting for this process to write.
+    """
+
+    def __init__(self, factory, outbox_path=None):
+        self._factory = factory
+        self._writer = None
+        self._seeds = []
+        self._lock = threading.Lock()
+        if outbox_path is not None and has_pending(outbox_path):
+            threading.Thread(target=self._get, name="progress-writer-start", daemon=True).start()
+
+    def _get(self):
+        with self._lock:
+            if self._writer is None:
+                self._writer = self._factory()
+                for record in self._seeds:
+                    self._writer.seed(record)
+                self._seeds = None
+            return self._writer
+
+    def submit(self, record, event_id=None):
+        return self._get().submit(record, event_id)
+
+    def seed(self, record):
+        with self._lock:
+            if self._writer is None:
+                self._seeds.append(record)
+                return
+        self._writer.seed(record)
+
+    def pending(self):
+        return self._writer.pending() if self._writer is not None else 0
+
+    def flush(self, timeout=None):
+        return self._writer.flush(timeout) if self._writer is not None else True
+
+    def close(self, timeout=10.0):
+        if self._writer is not None:
+            self._writer.close(timeout)
@@ -0,0 +1,304 @@
+"""
+Compiled interview question bank.  ``interview_questions_data`` is the
+editable source; importing it parses every question of every role.  The
+build step validates the source and compiles it into ``question_bank.bin``,
+and the app reads that artifact instead:
+
+    python question_bank.py check     # validate and print counts
+    python question_bank.py build     # validate and write the artifact
+
+Validation checks the entry schema, the ID format and uniqueness, that each
+question list uses one ID prefix of its own, duplicate question text within
+a role, that every catalog role has questions, and that each role and
+category has at least ``MIN_PER_CATEGORY`` questions.
+
+The artifact is a small JSON header followed by one zlib-compressed section
+per question list (the shared behavioural list and each role's technical
+list).  ``QuestionBank`` memory-maps the file, reads only the header up
+front and decodes a section the first time one of its questions is needed;
+at most ``CACHED_SECTIONS`` decoded sections are kept.  Startup time and
+resident memory therefore depend on the roles in use, not on the size of
+the bank.  ``get_bank()`` returns the process-wide bank and rebuilds the
+artifact first if it is missing or was built from a different source; when
+the artifact's directory is read-only it builds one per source version under
+``CACHE_DIR`` instead.
+"""
+
+import argparse
+import collections
+import functools
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+import zlib
+
+from role_catalog import CATALOG
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(_HERE, "interview_questions_data.py")
+ARTIFACT_PATH = os.path.join(_HERE, "question_bank.bin")
+MAGIC = b"QBANK1\n"
+_HEADER_LEN = struct.Struct("<I")
+
+BEHAVIORAL_SECTION = "behavioral"
+MIN_PER_CATEGORY = 50
+CACHED_SECTIONS = 4
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                         "brainyscout")
+_ID_RE = re.compile(r"^([a-z]+)-\d{3,}$")
+_FIELDS = ("id", "question", "answer")
+
+
+def source_digest(path=SOURCE_PATH):
+    with open(path, "rb") as fh:
+        return hashlib.sha1(fh.read()).hexdigest()
+
+
+def _prefix(qid):
+    return qid.rsplit("-", 1)[0]
+
+
+def validate(behavioral, technical, role_names=CATALOG.role_names):
+    """Return a list of problems in the question bank; empty if it is valid."""
+    problems = []
+    lists = {BEHAVIORAL_SECTION: behavioral, **technical}
+    seen_ids = {}
+    prefixes = {}
+    for section, entries in lists.items():
+        if not isinstance(entries, list):
+            problems.append(f"{section}: expected a list of questions, got {type(entries).__name__}")
+            continue
+        section_prefixes = set()
+        for position, entry in enumerate(entries, start=1):
+            where = f"{section}[{position}]"
+            if not isinstance(entry, dict) or set(entry) != set(_FIELDS):
+                problems.append(f"{where}: expected a dict with keys {', '.join(_FIELDS)}")
+                continue
+            if not all(isinstance(entry[f], str) and entry[f].strip() for f in _FIELDS):
+                problems.append(f"{where}: fields must be non-empty strings")
+                continue
+            qid = entry["id"]
+            match = _ID_RE.match(qid)
+            if not match:
+                problems.append(f"{where}: malformed ID {qid!r}")
+                continue
+            if qid in seen_ids:
+                problems.append(f"{where}: duplicate ID {qid} (also in {seen_ids[qid]})")
+            seen_ids[qid] = section
+            section_prefixes.add(match.group(1))
+        if len(section_prefixes) > 1:
+            problems.append(f"{section}: mixes ID prefixes {', '.join(sorted(section_prefixes))}")
+        for prefix in section_prefixes:
+            if prefixes.setdefault(prefix, section) != section:
+                problems.append(f"{section}: ID prefix {prefix!r} is also used by {prefixes[prefix]}")
+
+    missing = [role for role in role_names if role not in technical]
+    if missing:
+        problems.append(f"no technical questions for catalog roles: {', '.join(missing)}")
+    for role, entries in technical.items():
+        if role not in role_names:
+            problems.append(f"{role}: not a catalog role")
+        for category, q_list in (("Behavioral", behavioral), ("Technical", entries)):
+            if isinstance(q_list, list) and len(q_list) < MIN_PER_CATEGORY:
+                problems.append(f"{role}/{category}: {len(q_list)} questions, "
+                                f"expected at least {MIN_PER_CATEGORY}")
+        texts = collections.Counter(
+            " ".join(entry["question"].lower().split())
+            for q_list in (behavioral, entries) if isinstance(q_list, list)
+            for entry in q_list if isinstance(entry, dict) and isinstance(entry.get("question"), str)
+        )
+        for text, n in texts.items():
+            if n > 1:
+                problems.append(f"{role}: question asked {n} times: {text!r}")
+    return problems
+
+
+def _load_source():
+    import interview_questions_data
+
+    return interview_questions_data.behavioral_questions, interview_questions_data.technical_questions
+
+
+def build(path=ARTIFACT_PATH, source_path=SOURCE_PATH):
+    """Validate the source bank and write the artifact; return the header.
+
+    Raises ``ValueError`` listing every problem if the bank is invalid.
+    """
+    behavioral, technical = _load_source()
+    problems = validate(behavioral, technical)
+    if problems:
+        raise ValueError("invalid question bank:\n  " + "\n  ".join(problems))
+
+    sections, blobs, offset = {}, [], 0
+    prefixes = {}
+    for section, entries in {BEHAVIORAL_SECTION: behavioral, **technical}.items():
+        rows = [[e["id"], e["question"], e["answer"]] for e in entries]
+        blob = zlib.compress(json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 9)
+        sections[section] = [offset, len(blob), len(rows)]
+        prefixes[_prefix(entries[0]["id"])] = section
+        blobs.append(blob)
+        offset += len(blob)
+    header = {
+        "source": source_digest(source_path),
+        "sections": sections,
+        "prefixes": prefixes,
+        "roles": {role: {"Behavioral": BEHAVIORAL_SECTION, "Technical": role} for role in technical},
+    }
+    head = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".qbank-")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(MAGIC + _HEADER_LEN.pack(len(head)) + head)
+            for blob in blobs:
+                fh.write(blob)
+        # mkstemp creates the file 0600; the app may run as another user.
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return header
+
+
+class QuestionBank:
+    """Read-only view of a compiled question bank, decoded per section."""
+
+    def __init__(self, path=ARTIFACT_PATH):
+        self.path = path
+        with open(path, "rb") as fh:
+            self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path}: not a question bank artifact")
+        start = len(MAGIC) + _HEADER_LEN.size
+        (length,) = _HEADER_LEN.unpack_from(self._map, len(MAGIC))
+        header = json.loads(self._map[start:start + length])
+        self._base = start + length
+        self.source = header["source"]
+        self._sections = header["sections"]
+        self._prefixes = header["prefixes"]
+        self._roles = header["roles"]
+        self.role_names = tuple(self._roles)
+        self._section = functools.lru_cache(maxsize=CACHED_SECTIONS)(self._decode)
+
+    def _decode(self, section):
+        offset, length, _ = self._sections[section]
+        start = self._base + offset
+        rows = json.loads(zlib.decompress(self._map[start:start + length]))
+        ids = tuple(row[0] for row in rows)
+        by_id = {qid: {"id": qid, "question": q, "answer": a} for qid, q, a in rows}
+        return ids, by_id
+
+    def ids(self, role, category):
+        """Question IDs of ``role`` and ``category`` in display order."""
+        return self._section(self._roles[role][category])[0]
+
+    def count(self, role, category):
+        """Number of questions of ``role`` and ``category``, without decoding them."""
+        return self._sections[self._roles[role][category]][2]
+
+    def get(self, qid):
+        """The ``{"id", "question", "answer"}`` entry of ``qid``."""
+        section = self._prefixes.get(_prefix(qid))
+        if section is None:
+            raise KeyError(qid)
+        return self._section(section)[1][qid]
+
+    def section_of(self, qid):
+        """Name of the question list whose ID prefix ``qid`` has.
+
+        Does not decode the list, so ``qid`` itself may not exist in it.
+        """
+        name = self._prefixes.get(_prefix(qid))
+        if name is None:
+            raise KeyError(qid)
+        return name
+
+    def section(self, name):
+        """Every question of the list ``name`` by ID."""
+        return self._section(name)[1]
+
+    def scopes(self):
+        """Map every question ID to its set of ``(role, category)`` pairs."""
+        scopes = collections.defaultdict(set)
+        for role, categories in self._roles.items():
+            for category, section in categories.items():
+                for qid in self._decode(section)[0]:
+                    scopes[qid].add((role, category))
+        return scopes
+
+    def questions(self):
+        """Every question by ID.  Decodes the whole bank; meant for indexes
+        that cover all roles, not for per-request lookups."""
+        questions = {}
+        for section in self._sections:
+            questions.update(self._decode(section)[1])
+        return questions
+
+    def close(self):
+        self._section.cache_clear()
+        self._map.close()
+
+
+_bank = None
+_bank_lock = threading.Lock()
+
+
+def _current(path, source_path):
+    """The bank at ``path`` if it exists and matches the source, else None."""
+    if not os.path.exists(path):
+        return None
+    bank = QuestionBank(path)
+    # Without the source (a deployed artifact) the artifact is authoritative.
+    if os.path.exists(source_path) and bank.source != source_digest(source_path):
+        bank.close()
+        return None
+    return bank
+
+
+def get_bank(path=ARTIFACT_PATH, source_path=SOURCE_PATH):
+    """Return the process-wide bank, rebuilding a missing or stale artifact."""
+    global _bank
+    with _bank_lock:
+        if _bank is None:
+            bank = _current(path, source_path)
+            if bank is None and not os.access(os.path.dirname(os.path.abspath(path)), os.W_OK):
+                path = os.path.join(CACHE_DIR, f"question_bank-{source_digest(source_path)[:12]}.bin")
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                bank = _current(path, source_path)
+            if bank is None:
+                build(path, source_path)
+                bank = QuestionBank(path)
+            _bank = bank
+        return _bank
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate and compile the interview question bank.")
+    parser.add_argument("command", choices=("check", "build"))
+    parser.add_argument("--out", default=ARTIFACT_PATH, help="artifact path for build")
+    args = parser.parse_args(argv)
+
+    behavioral, technical = _load_source()
+    problems = validate(behavioral, technical)
+    for problem in problems:
+        print(f"error: {problem}", file=sys.stderr)
+    if problems:
+        return 1
+    print(f"{'role':28} {'Behavioral':>10} {'Technical':>10}")
+    for role, entries in technical.items():
+        print(f"{role:28} {len(behavioral):10} {len(entries):10}")
+    if args.command == "build":
+        header = build(args.out)
+        print(f"wrote {args.out} ({os.path.getsize(args.out)} bytes, {len(header['sections'])} sections)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+Full-text search over the interview question bank.  ``QuestionIndex`` is an
+inverted index over every question and sample answer in
+the compiled question bank (see ``question_bank``), ranked with BM25.  The last query term also
+matches as a prefix, so "sql jo" finds "SQL joins".  Results can be
+filtered by role and category.
+
+Building is incremental: per-question term frequencies are cached on disk
+keyed by a hash of the question's text, so a server start only tokenises
+questions that were added or edited since the cache was written.
+``get_index()`` returns the process-wide index.
+"""
+
+import bisect
+import collections
+import hashlib
+import json
+import math
+import os
+import re
+import tempfile
+import threading
+
+from question_bank import get_bank
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".question_index.json")
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[+#][+#]?)?")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this to what when "
+    "which with you your".split()
+)
+
+# BM25 parameters; question text is weighted above the sample answer.
+K1 = 1.2
+B = 0.75
+QUESTION_WEIGHT = 2
+
+
+def tokenize(text):
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+def _fingerprint(question):
+    text = question["question"] + "\0" + question["answer"]
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _term_frequencies(question):
+    tf = collections.Counter(tokenize(question["answer"]))
+    for term in tokenize(question["question"]):
+        tf[term] += QUESTION_WEIGHT
+    return dict(tf)
+
+
+class QuestionIndex:
+    """BM25-ranked inverted index over interview questions."""
+
+    def __init__(self, questions, scopes, cache_path=None):
+        """``questions`` maps ID → entry; ``scopes`` maps ID → {(role, category)}."""
+        self._scopes = scopes
+        cache = _load_cache(cache_path)
+        fresh = {}
+        self._postings = collections.defaultdict(dict)
+        self._lengths = {}
+        for qid, question in questions.items():
+            fp = _fingerprint(question)
+            cached = cache.get(qid)
+            tf = cached["tf"] if cached and cached["fp"] == fp else _term_frequencies(question)
+            fresh[qid] = {"fp": fp, "tf": tf}
+            self._lengths[qid] = sum(tf.values())
+            for term, freq in tf.items():
+                self._postings[term][qid] = freq
+        if cache_path and fresh != cache:
+            _save_cache(cache_path, fresh)
+        self._terms = sorted(self._postings)
+        self._avg_length = sum(self._lengths.values()) / max(len(self._lengths), 1)
+        n = len(self._lengths)
+        self._idf = {
+            term: math.log(1 + (n - len(docs) + 0.5) / (len(docs) + 0.5))
+            for term, docs in self._postings.items()
+        }
+
+    def _expand(self, term):
+        """Indexed terms starting with ``term``."""
+        start = bisect.bisect_left(self._terms, term)
+        end = bisect.bisect_left(self._terms, term + "\uffff")
+        return self._terms[start:end]
+
+    def search(self, query, role=None, category=None, limit=20):
+        """Return up to ``limit`` question IDs ranked by relevance."""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        scores = collections.defaultdict(float)
+        for position, term in enumerate(terms):
+            # Only the term being typed is treated as a prefix.
+            variants = self._expand(term) if position == len(terms) - 1 else [term]
+            for variant in variants:
+                idf = self._idf.get(variant)
+                if idf is None:
+                    continue
+                for qid, freq in self._postings[variant].items():
+                    norm = K1 * (1 - B + B * self._lengths[qid] / self._avg_length)
+                    scores[qid] += idf * freq * (K1 + 1) / (freq + norm)
+        if role is not None or category is not None:
+            scores = {
+                qid: score for qid, score in scores.items()
+                if any((role is None or r == role) and (category is None or c == category)
+                       for r, c in self._scopes[qid])
+            }
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [qid for qid, _ in ranked[:limit]]
+
+
+def _load_cache(path):
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(path, entries):
+    try:
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix=".qindex-")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(entries, fh, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError:
+        # The cache only speeds up the next start; a read-only checkout is fine.
+        pass
+
+
+def build_index(cache_path=CACHE_PATH):
+    bank = get_bank()
+    return QuestionIndex(bank.questions(), bank.scopes(), cache_path)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_index():
+    """Return the process-wide index, building it on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = build_index()
+        return _index
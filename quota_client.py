@@ -0,0 +1,159 @@
+"""
+Quota-aware access to Google Sheets.  The Sheets API allows a fixed number of
+read and write requests per minute; going over it returns 429 errors that
+used to surface as failed rows.  ``QuotaClient`` paces requests with one
+process-wide token bucket per request kind, sized so that no window of
+``window`` seconds ever carries more than the configured quota.  When tokens
+run out, callers queue by priority: interactive work (anything a rerun is
+waiting on) is served before background work such as outbox replays.
+
+Calls that still fail with 429, or with a 5xx on a read, are retried with
+capped exponential backoff and full jitter.  Writes are not retried after a
+5xx because they may have been applied; the outbox retries those with its
+idempotency check instead.
+
+``SheetsConnection`` routes every worksheet call through the client when one
+is configured, so callers keep using plain gspread methods.
+"""
+
+import heapq
+import itertools
+import random
+import threading
+import time
+
+import rerun_metrics
+
+INTERACTIVE = 0
+BACKGROUND = 1
+
+# Worksheet and spreadsheet methods that issue a request, by quota bucket.
+READ_METHODS = frozenset({
+    "get", "get_all_values", "get_all_records", "batch_get", "row_values", "col_values",
+    "acell", "cell", "range", "worksheets", "worksheet", "values_batch_get",
+})
+WRITE_METHODS = frozenset({
+    "append_row", "append_rows", "update", "update_cell", "update_acell", "batch_update",
+    "insert_row", "insert_rows", "delete_rows", "clear", "add_worksheet", "del_worksheet",
+    "values_update", "values_append", "values_clear",
+})
+# Methods whose result is another handle that must stay throttled.
+_HANDLE_METHODS = frozenset({"worksheet", "worksheets", "add_worksheet"})
+_HANDLE_ATTRIBUTES = frozenset({"spreadsheet", "sheet1"})
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def status_of(exc):
+    """HTTP status of a gspread ``APIError`` (or the fake's), else None."""
+    return getattr(getattr(exc, "response", None), "status_code", None)
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose waiters are served by priority."""
+
+    def __init__(self, quota, window=60.0, burst=None, clock=time.monotonic):
+        self.capacity = burst if burst is not None else max(1, quota // 10)
+        # Refilling at (quota - burst) per window keeps any window within
+        # quota even when it starts with a full bucket.
+        self.rate = max(quota - self.capacity, 1) / window
+        self._clock = clock
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._cond = threading.Condition()
+        self._waiters = []
+        self._tickets = itertools.count()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, priority=INTERACTIVE):
+        """Take one token, waiting behind higher-priority callers.
+
+        Returns the number of seconds spent waiting, 0.0 if none.
+        """
+        started, waited = self._clock(), False
+        with self._cond:
+            ticket = (priority, next(self._tickets))
+            heapq.heappush(self._waiters, ticket)
+            while True:
+                self._refill()
+                if self._waiters[0] == ticket and self._tokens >= 1:
+                    heapq.heappop(self._waiters)
+                    self._tokens -= 1
+                    self._cond.notify_all()
+                    return self._clock() - started if waited else 0.0
+                wait = (1 - self._tokens) / self.rate if self._waiters[0] == ticket else None
+                self._cond.wait(wait)
+                waited = True
+
+    @property
+    def waiting(self):
+        with self._cond:
+            return len(self._waiters)
+
+
+class QuotaClient:
+    """Paces and retries Sheets requests within per-minute quotas."""
+
+    def __init__(self, read_quota=60, write_quota=60, window=60.0, max_retries=5,
+                 base_delay=1.0, max_delay=32.0, clock=time.monotonic, sleep=time.sleep,
+                 rng=random.random):
+        self.buckets = {
+            "read": TokenBucket(read_quota, window, clock=clock),
+            "write": TokenBucket(write_quota, window, clock=clock),
+        }
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._sleep = sleep
+        self._rng = rng
+
+    def call(self, fn, kind="read", priority=INTERACTIVE):
+        """Call ``fn()`` as one ``kind`` request, retrying throttled attempts."""
+        bucket = self.buckets[kind]
+        for attempt in itertools.count():
+            if bucket.acquire(priority) > 0:
+                rerun_metrics.inc("sheets_throttled_total", kind=kind)
+            try:
+                return fn()
+            except Exception as exc:
+                status = status_of(exc)
+                retryable = status == 429 or (kind == "read" and status in RETRY_STATUSES)
+                if not retryable or attempt >= self._max_retries:
+                    raise
+                rerun_metrics.inc("sheets_retried_total", kind=kind, status=str(status))
+                delay = min(self._max_delay, self._base_delay * 2 ** attempt)
+                self._sleep(delay * self._rng())
+
+    def wrap(self, handle, priority=INTERACTIVE):
+        """Return ``handle`` (a worksheet or spreadsheet) with throttled methods."""
+        return _Throttled(handle, self, priority)
+
+
+class _Throttled:
+    """Proxy that sends a handle's request methods through a ``QuotaClient``."""
+
+    def __init__(self, target, client, priority):
+        self._target = target
+        self._client = client
+        self._priority = priority
+
+    def __getattr__(self, name):
+        value = getattr(self._target, name)
+        if name in _HANDLE_ATTRIBUTES:
+            return _Throttled(value, self._client, self._priority)
+        kind = "write" if name in WRITE_METHODS else "read" if name in READ_METHODS else None
+        if kind is None:
+            return value
+
+        def call(*args, **kwargs):
+            result = self._client.call(lambda: value(*args, **kwargs), kind, self._priority)
+            if name in _HANDLE_METHODS:
+                if isinstance(result, list):
+                    return [_Throttled(r, self._client, self._priority) for r in result]
+                return _Throttled(result, self._client, self._priority)
+            return result
+        return call
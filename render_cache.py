@@ -0,0 +1,104 @@
+"""
+Shared cache of rendered markdown fragments.  The Skill Checker, Learning
+Plan and Progress Tracker views turn a role and a completed-skill set into
+markdown lists and tables; the output depends on nothing else, so it is
+rendered once per (fragment, catalog version, role, completed mask) and
+shared by every session with the same gap.  ``RenderCache`` is a bounded
+LRU; requests and misses per fragment are counted in ``rerun_metrics`` and
+the number of cached fragments is published as a gauge.
+
+With a ``link_checker.LinkStatus``, course links the checker found dead are
+flagged or hidden, and fragments are re-rendered when its results change.
+"""
+
+import functools
+
+import rerun_metrics
+from role_catalog import CATALOG
+
+CACHE_SIZE = 4096
+
+
+def _plain_link(text, url):
+    return f"[{text}]({url})"
+
+
+def _skill_gaps(catalog, role, mask, link):
+    return "\n".join(
+        f"- **{skill}** -> {link('Course Link', url)}"
+        for skill, url in catalog.links(role, catalog.missing_mask(role, mask))
+    )
+
+
+def _learning_plan(catalog, role, mask, link):
+    rows = "".join(f"| {skill} | {link('Link', url)} |\n" for skill, url in catalog.links(role))
+    return "| Skill | Course |\n| --- | --- |\n" + rows
+
+
+def _learning_path(catalog, role, mask, link):
+    missing = catalog.links(role, catalog.missing_mask(role, mask))
+    rows = "".join(
+        f"| Step {step} | {skill} | {link('Link', url)} |\n"
+        for step, (skill, url) in enumerate(missing, start=1)
+    )
+    return "| Step | Skill | Course |\n| --- | --- | --- |\n" + rows
+
+
+def _progress_table(catalog, role, mask, link):
+    rows = "".join(
+        f"| {skill} | {'Completed' if catalog.has(mask, skill) else 'Pending'} |\n"
+        for skill in catalog.skill_names(role)
+    )
+    return "| Skill | Status |\n| --- | --- |\n" + rows
+
+
+_RENDERERS = {
+    "skill_gaps": _skill_gaps,
+    "learning_plan": _learning_plan,
+    "learning_path": _learning_path,
+    "progress_table": _progress_table,
+}
+# Fragments that do not depend on the completed skills.
+_MASK_FREE = frozenset({"learning_plan"})
+
+
+class RenderCache:
+    """Bounded LRU of markdown fragments keyed by role and completed mask."""
+
+    def __init__(self, catalog=CATALOG, maxsize=CACHE_SIZE, links=None):
+        self._catalog = catalog
+        self._links = links
+        self._render = functools.lru_cache(maxsize=maxsize)(self._build)
+
+    def _build(self, kind, version, role, mask, links_version):
+        rerun_metrics.inc("render_cache_misses_total", fragment=kind)
+        link = self._links.link if self._links is not None else _plain_link
+        return _RENDERERS[kind](self._catalog, role, mask, link)
+
+    def get(self, kind, role, mask=0):
+        """Markdown for fragment ``kind`` of ``role`` given the completed ``mask``."""
+        mask = 0 if kind in _MASK_FREE else mask & self._catalog.roles[role].mask
+        links_version = self._links.version() if self._links is not None else None
+        rerun_metrics.inc("render_cache_requests_total", fragment=kind)
+        text = self._render(kind, self._catalog.version, role, mask, links_version)
+        rerun_metrics.set_gauge("render_cache_entries", self._render.cache_info().currsize)
+        return text
+
+    def skill_gaps(self, role, mask):
+        return self.get("skill_gaps", role, mask)
+
+    def learning_plan(self, role):
+        return self.get("learning_plan", role)
+
+    def learning_path(self, role, mask):
+        return self.get("learning_path", role, mask)
+
+    def progress_table(self, role, mask):
+        return self.get("progress_table", role, mask)
+
+    def info(self):
+        return self._render.cache_info()
+
+    def clear(self):
+        self._render.cache_clear()
+
@@ -0,0 +1,220 @@
+"""
+Headless rerun-latency benchmark for ``app.py``.  Drives the app through
+Streamlit's ``AppTest`` runner with the Sheets emulator from ``fake_sheets``
+and a throwaway SQLite store, replaying realistic interaction scripts:
+entering an email, picking each role, toggling skill checkboxes, switching
+between dashboard views and the interview category and submitting answers.
+
+Every step is one rerun.  For each step kind the benchmark reports wall
+time, peak memory allocated during the rerun and the number of
+progress-store and (emulated) Sheets calls, as p50/p95/p99 over all samples.  Results can be
+saved as a baseline and later runs compared against it:
+
+    python rerun_benchmark.py --save-baseline bench_baseline.json
+    python rerun_benchmark.py --compare bench_baseline.json --tolerance 1.25
+"""
+
+import argparse
+import collections
+import functools
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+import fake_sheets
+import progress_store
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+VIEWS = ["Skill Checker", "Learning Plan", "Progress Tracker", "Analytics", "Interview Practice"]
+ROLES = [
+    "QA Analyst",
+    "QA Automation Engineer",
+    "Software Developer",
+    "Data Engineer",
+    "Data Analyst",
+    "Product Manager",
+    "Project Manager",
+]
+SAMPLE_ANSWER = (
+    "Situation: our release was blocked by flaky tests. Task: I had to make the "
+    "suite reliable before the deadline. Action: I isolated shared fixtures, added "
+    "retries around network calls and paired with the team on the worst offenders. "
+    "Result: failures dropped by ninety percent and we shipped on time."
+)
+STORE_METHODS = ("record", "latest", "history", "tail")
+METRICS = ("wall_ms", "alloc_kb", "store_calls", "sheets_calls")
+
+
+class _CallCounter:
+    """Counts progress-store calls made on the render path."""
+
+    def __init__(self):
+        self.count = 0
+        for cls in (progress_store.SQLiteProgressStore, progress_store.SheetsProgressStore):
+            for name in STORE_METHODS:
+                setattr(cls, name, self._wrap(getattr(cls, name)))
+
+    def _wrap(self, method):
+        @functools.wraps(method)
+        def counted(*args, **kwargs):
+            self.count += 1
+            return method(*args, **kwargs)
+        return counted
+
+
+class Bench:
+    """Runs interaction steps against one ``AppTest`` and records samples."""
+
+    def __init__(self, workdir, counter, tab_mode="active", track_allocations=True, timeout=30):
+        self.at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.at.secrets["SHEETS_EMULATOR"] = True
+        self.at.secrets["TAB_MODE"] = tab_mode
+        self.at.secrets["PROGRESS_DB_PATH"] = os.path.join(workdir, "progress.db")
+        self.at.secrets["PROGRESS_OUTBOX_PATH"] = os.path.join(workdir, "outbox.db")
+        self.at.secrets["ANSWER_SPILL_PATH"] = os.path.join(workdir, "answer_spill.db")
+        self.counter = counter
+        self.track_allocations = track_allocations
+        self.samples = collections.defaultdict(lambda: collections.defaultdict(list))
+
+    def step(self, name, action=None):
+        if action is not None:
+            action(self.at)
+        server = fake_sheets.default_server()
+        store_before = self.counter.count
+        sheets_before = server.stats["reads"] + server.stats["writes"]
+        if self.track_allocations:
+            tracemalloc.start()
+        start = time.perf_counter()
+        self.at.run()
+        wall = time.perf_counter() - start
+        alloc = 0
+        if self.track_allocations:
+            _, alloc = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        if self.at.exception:
+            raise RuntimeError(f"{name}: {self.at.exception[0].message}")
+        sample = self.samples[name]
+        sample["wall_ms"].append(wall * 1000)
+        sample["alloc_kb"].append(alloc / 1024)
+        sample["store_calls"].append(self.counter.count - store_before)
+        sample["sheets_calls"].append(server.stats["reads"] + server.stats["writes"] - sheets_before)
+
+
+def _button(at, label):
+    return next(b for b in at.button if b.label == label)
+
+
+def _selectbox(at, label):
+    return next(s for s in at.selectbox if s.label == label)
+
+
+def _switch_view(bench, view):
+    """Select ``view`` when the app renders one view at a time."""
+    if any(r.key == "active_view" for r in bench.at.radio):
+        bench.step("switch_view", lambda at: at.radio(key="active_view").set_value(view))
+
+
+def run_session(bench, email):
+    """One user session: log in, visit every role and practise interviews."""
+    bench.step("first_paint")
+    bench.step("enter_email", lambda at: at.sidebar.text_input[0].input(email))
+    for role in ROLES:
+        bench.step("select_role", lambda at, role=role: at.sidebar.selectbox[0].select(role))
+        for index in range(len(bench.at.sidebar.checkbox)):
+            bench.step("toggle_skill", lambda at, i=index: at.sidebar.checkbox[i].check())
+        for view in VIEWS:
+            _switch_view(bench, view)
+        for category in ("Technical", "Behavioral"):
+            bench.step("switch_category",
+                       lambda at, c=category: _selectbox(at, "Interview Question Type").select(c))
+            bench.step("pick_question",
+                       lambda at: _selectbox(at, "Select a question to practise").select_index(1))
+            bench.step("type_answer", lambda at: at.text_area[0].input(SAMPLE_ANSWER))
+            bench.step("submit_answer", lambda at: _button(at, "Submit Answer").click())
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def summarise(samples):
+    summary = {}
+    for step, metrics in samples.items():
+        summary[step] = {"n": len(metrics["wall_ms"])}
+        for metric in METRICS:
+            values = metrics[metric]
+            summary[step][metric] = {f"p{p}": percentile(values, p) for p in (50, 95, 99)}
+    return summary
+
+
+def print_summary(summary, out=sys.stdout):
+    header = f"{'step':<16}{'n':>5}" + "".join(f"{m + ' p50/p95/p99':>34}" for m in METRICS)
+    print(header, file=out)
+    for step, row in summary.items():
+        cells = "".join(
+            f"{'{:.1f}/{:.1f}/{:.1f}'.format(*row[m].values()):>34}" for m in METRICS)
+        print(f"{step:<16}{row['n']:>5}{cells}", file=out)
+
+
+def compare(summary, baseline, tolerance):
+    """Return regressions where p95 wall time exceeds baseline * tolerance."""
+    regressions = []
+    for step, row in summary.items():
+        if step not in baseline:
+            continue
+        now, before = row["wall_ms"]["p95"], baseline[step]["wall_ms"]["p95"]
+        if now > before * tolerance:
+            regressions.append(f"{step}: p95 {now:.1f} ms vs baseline {before:.1f} ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark app.py reruns headlessly.")
+    parser.add_argument("--sessions", type=int, default=3, help="user sessions to replay")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="emulated Sheets latency per call in seconds")
+    parser.add_argument("--tab-mode", choices=("active", "all"), default="active",
+                        help="TAB_MODE passed to the app")
+    parser.add_argument("--no-alloc", action="store_true",
+                        help="skip tracemalloc, which inflates wall times")
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="allowed p95 slowdown factor against the baseline")
+    args = parser.parse_args(argv)
+
+    fake_sheets.default_server().configure(latency=args.latency, read_quota=None, write_quota=None)
+    counter = _CallCounter()
+    with tempfile.TemporaryDirectory() as workdir:
+        samples = collections.defaultdict(lambda: collections.defaultdict(list))
+        for n in range(args.sessions):
+            bench = Bench(workdir, counter, tab_mode=args.tab_mode,
+                          track_allocations=not args.no_alloc)
+            run_session(bench, f"bench-{n}@example.com")
+            for step, metrics in bench.samples.items():
+                for metric, values in metrics.items():
+                    samples[step][metric].extend(values)
+    summary = summarise(samples)
+    print_summary(summary)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as fh:
+            json.dump(summary, fh, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            regressions = compare(summary, json.load(fh), args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Lightweight per-rerun instrumentation.  ``span(name)`` times a section of
+``app.py`` and records the duration in a histogram; ``inc`` and
+``set_gauge`` maintain counters and gauges such as storage calls and
+failures.  Everything lives in one process-wide ``MetricsRegistry`` that can
+be rendered in the Prometheus text exposition format, served over HTTP or
+dumped to a local file.
+"""
+
+import bisect
+import contextlib
+import http.server
+import os
+import tempfile
+import threading
+import time
+
+# Interface the metrics endpoint listens on unless told otherwise.
+DEFAULT_HOST = "127.0.0.1"
+# Histogram bucket upper bounds in seconds.
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class _Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Thread-safe store of histograms, counters and gauges."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+        self._gauges = {}
+        self._help = {}
+
+    def describe(self, name, text):
+        self._help[name] = text
+
+    def observe(self, name, value, **labels):
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            series.setdefault(_label_key(labels), _Histogram()).observe(value)
+
+    def inc(self, name, value=1, **labels):
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            key = _label_key(labels)
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        with self._lock:
+            self._gauges.setdefault(name, {})[_label_key(labels)] = value
+
+    def remove_gauge(self, name, **labels):
+        with self._lock:
+            self._gauges.get(name, {}).pop(_label_key(labels), None)
+
+    @contextlib.contextmanager
+    def span(self, section):
+        """Time the enclosed block as ``rerun_section_seconds{section=...}``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe("rerun_section_seconds", time.perf_counter() - start, section=section)
+
+    def snapshot(self):
+        """Return ``{section: (count, total_seconds)}`` for timed sections."""
+        with self._lock:
+            series = self._histograms.get("rerun_section_seconds", {})
+            return {dict(key)["section"]: (h.count, h.sum) for key, h in series.items()}
+
+    def render_prometheus(self):
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# HELP {name} {self._help.get(name, name)}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, hist in sorted(series.items()):
+                    cumulative = 0
+                    for bound, count in zip(BUCKETS + (float("inf"),), hist.counts):
+                        cumulative += count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f"{name}_bucket{_format_labels(key, [('le', le)])} {cumulative}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {hist.sum}")
+                    lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+            for kind, metrics in (("counter", self._counters), ("gauge", self._gauges)):
+                for name, series in sorted(metrics.items()):
+                    lines.append(f"# HELP {name} {self._help.get(name, name)}")
+                    lines.append(f"# TYPE {name} {kind}")
+                    for key, value in sorted(series.items()):
+                        lines.append(f"{name}{_format_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path):
+        """Atomically write the Prometheus text to ``path``."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(self.render_prometheus())
+        os.replace(tmp, path)
+
+
+metrics = MetricsRegistry()
+metrics.describe("rerun_section_seconds", "Wall time of app.py sections per rerun.")
+metrics.describe("storage_calls_total", "Progress store calls by backend and operation.")
+metrics.describe("storage_failures_total", "Progress store calls that raised.")
+metrics.describe("sheets_requests_total", "Google Sheets requests issued.")
+metrics.describe("sheets_failures_total", "Google Sheets requests that raised.")
+metrics.describe("sheets_throttled_total", "Google Sheets requests delayed by the local quota.")
+metrics.describe("sheets_retried_total", "Google Sheets requests retried after 429 or 5xx.")
+metrics.describe("aggregator_events_total", "Progress events received by the write aggregator.")
+metrics.describe("answer_memory_bytes", "Interview answer text held in memory by all sessions.")
+metrics.describe("answer_sessions", "Sessions holding interview answers.")
+metrics.describe("answer_evictions_total", "Interview answers moved from session memory to disk.")
+metrics.describe("aggregator_fallbacks_total", "Progress events written locally while the aggregator was unreachable.")
+metrics.describe("aggregator_unconfirmed_total", "Progress events sent to the aggregator whose reply timed out.")
+metrics.describe("render_cache_requests_total", "Rendered markdown fragments requested, by fragment.")
+metrics.describe("render_cache_misses_total", "Rendered markdown fragments built because they were not cached.")
+metrics.describe("render_cache_entries", "Markdown fragments held in the render cache.")
+span = metrics.span
+inc = metrics.inc
+set_gauge = metrics.set_gauge
+
+
+def serve(port, registry=metrics, host=DEFAULT_HOST):
+    """Serve ``/metrics`` from a daemon thread and return the server.
+
+    Listens on localhost by default; pass another ``host`` to expose the
+    endpoint beyond this machine.
+    """
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
+
+
+def dump_periodically(path, interval=15.0, registry=metrics):
+    """Rewrite ``path`` every ``interval`` seconds from a daemon thread."""
+
+    def loop():
+        while True:
+            time.sleep(interval)
+            try:
+                registry.dump(path)
+            except OSError:
+                pass
+
+    thread = threading.Thread(target=loop, name="metrics-dump", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,120 @@
+"""
+Compiled role catalog.  ``roles_data.roles`` is a nested dict that used to be
+rebuilt on every rerun, with missing skills found by scanning lists.
+``compile_catalog`` turns it once per process into an immutable
+``RoleCatalog``: every distinct skill name gets a canonical integer ID, each
+role a bitmask of its skills, and every skill a bitmask of the roles that
+need it.  A user's completed skills become a single int, so gaps, progress
+and counts are bit operations regardless of catalog size.
+
+``CATALOG`` is the compiled ``roles_data`` catalog shared by the app.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from roles_data import roles
+
+
+def _digest(value):
+    canonical = json.dumps(value, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:12]
+
+
+@dataclass(frozen=True)
+class RoleEntry:
+    name: str
+    index: int
+    skill_ids: tuple  # skill IDs in display order
+    urls: tuple       # course URL per entry of ``skill_ids``
+    mask: int
+
+
+class RoleCatalog:
+    """Immutable, indexed view of a role → skills → course link catalog."""
+
+    def __init__(self, role_skills):
+        skill_ids = {}
+        entries = {}
+        for index, (role, spec) in enumerate(role_skills.items()):
+            ids, urls, mask = [], [], 0
+            for skill, url in spec["skills"].items():
+                skill_id = skill_ids.setdefault(skill, len(skill_ids))
+                ids.append(skill_id)
+                urls.append(url)
+                mask |= 1 << skill_id
+            entries[role] = RoleEntry(role, index, tuple(ids), tuple(urls), mask)
+
+        skill_roles = [0] * len(skill_ids)
+        for entry in entries.values():
+            for skill_id in entry.skill_ids:
+                skill_roles[skill_id] |= 1 << entry.index
+
+        # The version identifies the ordered skill names of every role, which
+        # is all a compact progress row depends on; editing a course link
+        # keeps it.  ``links_version`` also covers the links.
+        skills_only = {role: list(spec["skills"]) for role, spec in role_skills.items()}
+        self.version = _digest(skills_only)
+        self.links_version = _digest(role_skills)
+        self.role_names = tuple(entries)
+        self.skills = tuple(skill_ids)
+        self.skill_ids = MappingProxyType(skill_ids)
+        self.roles = MappingProxyType(entries)
+        self.skill_roles = tuple(skill_roles)
+
+    def skill_names(self, role):
+        """Skill names of ``role`` in display order."""
+        return [self.skills[i] for i in self.roles[role].skill_ids]
+
+    def links(self, role, mask=None):
+        """``(skill, url)`` pairs of ``role`` in display order.
+
+        With ``mask``, only skills whose bit is set are returned.
+        """
+        entry = self.roles[role]
+        return [
+            (self.skills[i], url) for i, url in zip(entry.skill_ids, entry.urls)
+            if mask is None or mask >> i & 1
+        ]
+
+    def mask_of(self, skills, role=None):
+        """Bitmask of the named skills, limited to ``role`` when given.
+
+        Unknown names are ignored.
+        """
+        mask = 0
+        for skill in skills:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is not None:
+                mask |= 1 << skill_id
+        return mask if role is None else mask & self.roles[role].mask
+
+    def names_of(self, role, mask):
+        """Names of the skills of ``role`` set in ``mask``, in display order."""
+        return [self.skills[i] for i in self.roles[role].skill_ids if mask >> i & 1]
+
+    def missing_mask(self, role, completed_mask):
+        """Skills of ``role`` not set in ``completed_mask``."""
+        return self.roles[role].mask & ~completed_mask
+
+    def has(self, mask, skill):
+        return bool(mask >> self.skill_ids[skill] & 1)
+
+    def roles_with_skill(self, skill):
+        """Names of the roles that require ``skill``."""
+        role_mask = self.skill_roles[self.skill_ids[skill]]
+        return [name for name in self.role_names if role_mask >> self.roles[name].index & 1]
+
+
+def count(mask):
+    """Number of skills in ``mask``."""
+    return mask.bit_count()
+
+
+def compile_catalog(role_skills=roles):
+    return RoleCatalog(role_skills)
+
+
+CATALOG = compile_catalog()
@@ -0,0 +1,92 @@
+"""
+Data module containing the role catalog: for every role, the skills it
+requires and a recommended course link for each skill.  The catalog is
+compiled into integer skill IDs and bitmasks by ``role_catalog``.  After
+adding, removing, renaming or reordering a role's skills, run
+``python progress_codec.py freeze`` so progress rows written with the new
+catalog version can be decoded; until then rows are written in plain form.
+Editing course links does not change the version.
+"""
+
+# Role → Skills → Course links
+roles = {
+    "QA Analyst": {
+        "skills": {
+            "Test case design": "https://imp.i384100.net/EEdv6e",
+            "Manual testing": "https://www.udemy.com/course/learn-manual-software-testing-with-live-project-jira-tool/?couponCode=MT80825B",
+            "Bug reporting (JIRA)": "https://www.udemy.com/course/learn-manual-software-testing-with-live-project-jira-tool/?couponCode=MT80825B",
+            "SQL for data validation": "https://imp.i384100.net/APMX1K",
+            "Functional testing": "https://www.udemy.com/course/functional-software-testing-interview-bootcamp-land-the-job/?couponCode=MT80825B",
+            "Regression testing": "https://www.youtube.com/watch?v=0wHKVXbsppw&pp=ygUTcmVncmVzc2lvbiB0ZXN0aW5nIA%3D%3D",
+            "SDLC knowledge": "https://www.youtube.com/watch?v=xNwtCtxfSuM",
+            "Communication skills": "https://imp.i384100.net/JKdyNr"
+        }
+    },
+    "QA Automation Engineer": {
+        "skills": {
+            "Python": "https://imp.i384100.net/K0d3v7",
+            "Selenium/WebDriver": "https://www.udemy.com/course/selenium-real-time-examplesinterview-questions/",
+            "API Testing (Postman)": "https://imp.i384100.net/dOJjYK",
+            "TestNG/PyTest": "https://www.udemy.com/course/python-automation-pytest/",
+            "CI/CD with Jenkins": "https://imp.i384100.net/raNoqj",
+            "Version Control (Git)": "https://www.codecademy.com/learn/learn-git",
+            "BDD (Cucumber/Gherkin)": "https://www.udemy.com/course/python-automation-pytest/?couponCode=MT80825B",
+            
+        }
+    },
+    "Software Developer": {
+        "skills": {
+            "Data Structures & Algorithms": "https://imp.i384100.net/e1ZP21",
+            "OOP (Java/Python/C#)": "https://www.youtube.com/watch?v=iLRZi0Gu8Go&pp=ygUUT09QIChKYXZhL1B5dGhvbi9DIyk%3D",
+            "HTML/CSS/JavaScript": "https://www.freecodecamp.org/learn/",
+            "SQL/NoSQL": "https://www.youtube.com/watch?v=sDtnlPdqwWI&pp=ygUcU1FML05vU1FMIHNvZnR3YXJlIGRldmVsb3Blcg%3D%3D",
+            "REST APIs": "https://www.udacity.com/course/api-development-and-documentation--ud805",
+            "Git/GitHub": "https://imp.i384100.net/POdN5Q",
+            "Unit Testing": "https://www.youtube.com/watch?v=vZm0lHciFsQ&pp=ygUUdW5pdCB0ZXN0aW5nIGluIGphdmE%3D",
+            "Agile Development": "https://imp.i384100.net/6yM51Q"
+        }
+    },
+    "Data Engineer": {
+        "skills": {
+            "SQL & NoSQL": "https://mode.com/sql-tutorial/",
+            "ETL pipelines": "https://www.youtube.com/watch?v=T23Bs75F7ZQ&pp=ygUjZXRsLWFuZC1kYXRhLXBpcGVsaW5lcy13aXRoLXB5dGhvbi8%3D",
+            "Python/Scala": "https://imp.i384100.net/2a09e0",
+            "Big Data (Spark, Hadoop)": "https://www.youtube.com/watch?v=ouGO3Up7aWE&pp=ygUYQmlnIERhdGEgKFNwYXJrLCBIYWRvb3Ap",
+            "Data Warehousing": "https://www.youtube.com/watch?v=HKcEyHF1U00&pp=ygUQRGF0YSBXYXJlaG91c2luZw%3D%3D",
+            "Cloud (AWS/GCP/Azure)": "https://www.udemy.com/course/the-complete-introduction-to-cloud-with-aws-azure-and-gcp/?couponCode=MT80825B",
+            "Apache Airflow": "https://www.udemy.com/course/the-complete-hands-on-course-to-master-apache-airflow/",
+            "Data Modeling": "https://www.udemy.com/course/data-warehouse-the-ultimate-guide/"
+        }
+    },
+    "Data Analyst": {
+        "skills": {
+            "SQL": "https://www.udemy.com/course/sql-for-data-analytics/",
+            "Excel & Google Sheets": "https://imp.i384100.net/xL6Dvx",
+            "Tableau/Power BI": "https://imp.i384100.net/9LdaZ4",
+            "Python (Pandas, Numpy)": "https://imp.i384100.net/550P0b",
+            "A/B Testing": "https://www.youtube.com/watch?v=KZe0C0Qq4p0&pp=ygULQS9CIFRlc3RpbmfSBwkJrQkBhyohjO8%3D",
+            "Statistics": "https://www.youtube.com/watch?v=npgbI8KYvN8&pp=ygUXc3RhdGlzdGljcyBkYXRhIGFuYWx5c3Q%3D",
+            "Business Communication": "https://imp.i384100.net/kO2G20"
+        }
+    },
+    "Product Manager": {
+        "skills": {
+            "Strategic thinking": "https://imp.i384100.net/Dydzdb",
+            "Market research": "https://imp.i384100.net/9LdadE",
+            "User-centric design": "https://imp.i384100.net/raNoND",
+            "Technical documentation": "https://www.udemy.com/course/technical-writing/",
+            "Data analysis": "https://imp.i384100.net/550P0b",
+            "Agile product development": "https://www.youtube.com/watch?v=bQdwNN6i8aA&pp=ygUpQWdpbGUgcHJvZHVjdCBkZXZlbG9wbWVudCBwcm9kdWN0IG1hbmFnZXI%3D"
+        }
+    },
+    "Project Manager": {
+        "skills": {
+            "Project planning": "https://imp.i384100.net/aOGQGY",
+            "Agile methodology": "https://imp.i384100.net/GKd3d2",
+            "Risk management": "https://imp.i384100.net/Z6j3jz",
+            "Team communication": "https://www.youtube.com/watch?v=CJr1e2Lp5dI&pp=ygUiVGVhbSBjb21tdW5pY2F0aW9uIHByb2plY3QgbWFuYWdlcg%3D%3D",
+            "Budgeting and cost control": "https://www.youtube.com/watch?v=2H59thd0W2k&pp=ygUfL3Byb2plY3QtYnVkZ2V0aW5nLWNvc3QtY29udHJvbA%3D%3D",
+            "Project scheduling tools": "https://www.youtube.com/watch?v=nIFEaS2xmvg"
+        }
+    }
+}
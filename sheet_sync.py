@@ -0,0 +1,300 @@
+"""
+Incremental sync of the progress worksheet into a local columnar cache.
+Reading the log back with ``get_all_values()`` gets slower and costs more
+quota as the sheet grows by a row per progress event.  ``SheetSync`` keeps a
+row cursor, fetches only rows appended since the last sync with ranged
+``batch_get`` reads, and appends them to Parquet part files with parsed
+timestamps and split skill lists.  Readers load the cache with
+``SheetSync.read()`` in milliseconds instead of touching the sheet.
+
+Every sync that finds new rows adds a part file, so once more than
+``COMPACT_AFTER`` parts exist a sync merges them into one.  The merged part
+gets the next number and the state file records it as the ``base``; readers
+ignore parts below the base, so they see either the old parts or the merged
+one, never both.
+
+    python sheet_sync.py --dir progress_cache          # sync once
+    python sheet_sync.py --dir progress_cache --compact
+"""
+
+import argparse
+import glob
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+from log_compaction import STATUS_RANGE, parse_status, read_snapshots
+from progress_log import TIMESTAMP_FORMAT, decode_skills
+
+DEFAULT_DIR = "progress_cache"
+COMPACT_AFTER = 32
+COLUMNS = ["row", "timestamp", "email", "role", "completed", "missing", "event_id"]
+_STATE_FILE = "_state.json"
+
+
+class SheetSync:
+    """Row-cursor sync from a worksheet into Parquet part files.
+
+    ``run`` is a callable taking ``fn(worksheet)``, such as
+    ``SheetsConnection.run``.  Each sync issues ``batch_get`` calls of
+    ``ranges_per_call`` ranges of ``batch_rows`` rows until the sheet is
+    exhausted, then compacts if more than ``compact_after`` parts exist.
+    """
+
+    def __init__(self, run, directory=DEFAULT_DIR, batch_rows=5000, ranges_per_call=4,
+                 compact_after=COMPACT_AFTER, clock=time.monotonic):
+        self._run = run
+        self.directory = directory
+        self._batch_rows = batch_rows
+        self._ranges_per_call = ranges_per_call
+        self._compact_after = compact_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_sync = None
+        os.makedirs(directory, exist_ok=True)
+        self._state = self._load_state()
+        merged = self._part_path(self._state["base"])
+        if self._state["base"] and os.path.exists(merged + ".tmp"):
+            # A compaction stopped between saving its base and publishing it.
+            os.replace(merged + ".tmp", merged)
+
+    @property
+    def cursor(self):
+        """Log position of the last synced row."""
+        return self._state["cursor"]
+
+    def _load_state(self):
+        path = os.path.join(self.directory, _STATE_FILE)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as fh:
+                return {"offset": 0, "base": 0, **json.load(fh)}
+        return {"cursor": 0, "offset": 0, "parts": 0, "base": 0}
+
+    def _save_state(self):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".state-")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(self._state, fh)
+        os.replace(tmp, os.path.join(self.directory, _STATE_FILE))
+
+    def _fetch(self, first):
+        """Fetch rows from sheet row ``first`` on.
+
+        Returns ``(offset, busy, rows, done)``.  The compaction status is read
+        in the same request as the rows so the two are consistent.
+        """
+        ranges = [STATUS_RANGE] + [
+            f"A{first + i * self._batch_rows}:F{first + (i + 1) * self._batch_rows - 1}"
+            for i in range(self._ranges_per_call)
+        ]
+        status, *chunks = self._run(lambda ws: ws.batch_get(ranges))
+        offset, busy = parse_status(status)
+        rows = []
+        for values in chunks:
+            rows.extend(values)
+            if len(values) < self._batch_rows:
+                return offset, busy, rows, True
+        return offset, busy, rows, False
+
+    def _write_part(self, frame):
+        if len(frame):
+            self._state["parts"] += 1
+            # Readers list part files while a sync runs; publish complete files only.
+            path = self._part_path(self._state["parts"])
+            frame.to_parquet(path + ".tmp", index=False)
+            os.replace(path + ".tmp", path)
+
+    def sync(self):
+        """Pull new rows into the cache; return how many rows were added.
+
+        Cache positions are stable across ``log_compaction``: row 1 of the hot
+        sheet is position 1 and any later row ``r`` is ``offset + r``.  Rows
+        compacted away before this cache saw them are replaced by the
+        snapshot sheet, so every user's latest state is still present.
+        """
+        with self._lock:
+            added = 0
+            while True:
+                cursor, offset = self._state["cursor"], self._state["offset"]
+                if cursor < offset + 1 and offset:
+                    rows = self._run(lambda ws: read_snapshots(ws.spreadsheet))
+                    positions = [offset + 1] * len(rows)
+                    if cursor == 0:
+                        rows.insert(0, self._run(lambda ws: ws.row_values(1)))
+                        positions.insert(0, 1)
+                    self._write_part(parse_rows(rows, positions))
+                    self._state["cursor"] = offset + 1
+                    self._save_state()
+                    continue
+                first = 1 if cursor == 0 else cursor + 1 - offset
+                current, busy, rows, done = self._fetch(first)
+                if busy:
+                    # A compaction is deleting rows; pick up after it finishes.
+                    return added
+                if current != offset:
+                    self._state["offset"] = current
+                    self._save_state()
+                    continue
+                if rows:
+                    positions = [1 if first + i == 1 else offset + first + i for i in range(len(rows))]
+                    self._write_part(parse_rows(rows, positions))
+                    self._state["cursor"] = positions[-1]
+                    self._save_state()
+                    added += len(rows)
+                if done or not rows:
+                    self._last_sync = self._clock()
+                    if len(self._parts()) > self._compact_after:
+                        self._compact()
+                    return added
+
+    def refresh(self, max_age):
+        """Sync unless the last sync happened less than ``max_age`` seconds ago."""
+        if self._last_sync is None or self._clock() - self._last_sync >= max_age:
+            self.sync()
+
+    def _part_path(self, number):
+        return os.path.join(self.directory, f"part-{number:06d}.parquet")
+
+    def _parts(self):
+        """Paths of the live part files, in order.
+
+        The base is read from the state file after listing, so readers in
+        other processes honour compactions too.  ``_compact`` saves a new
+        base before its merged part appears; while the listing lacks the
+        base part the listing is retried.
+        """
+        while True:
+            paths = sorted(glob.glob(os.path.join(self.directory, "part-*.parquet")))
+            base = self._load_state()["base"]
+            if base and self._part_path(base) not in paths:
+                time.sleep(0.001)
+                continue
+            return [path for path in paths if int(os.path.basename(path)[5:11]) >= base]
+
+    def _open_parts(self):
+        """Open the live part files for reading.
+
+        An open file stays readable after a compaction deletes it, so the
+        list is retried only if a part vanished before it could be opened.
+        """
+        while True:
+            handles = []
+            try:
+                for path in self._parts():
+                    handles.append(open(path, "rb"))
+            except FileNotFoundError:
+                for fh in handles:
+                    fh.close()
+                continue
+            return handles
+
+    def read(self, columns=None, filters=None):
+        """Load the cached log as a DataFrame ordered by sheet row."""
+        handles = self._open_parts()
+        if not handles:
+            return _empty_frame(columns)
+        try:
+            frame = pd.concat([pd.read_parquet(fh, columns=columns, filters=filters)
+                               for fh in handles], ignore_index=True)
+        finally:
+            for fh in handles:
+                fh.close()
+        return frame.sort_values("row", kind="stable").reset_index(drop=True) if "row" in frame else frame
+
+    def iter_batches(self, columns=None, batch_size=65536):
+        """Yield the cached log as lists of row dicts, one part file at a time.
+
+        Unlike ``read`` this never holds more than ``batch_size`` rows in
+        memory; rows come in part order, which is sheet row order except
+        for rows bootstrapped from snapshots.
+        """
+        import pyarrow.parquet as pq
+
+        handles = self._open_parts()
+        try:
+            for fh in handles:
+                for batch in pq.ParquetFile(fh).iter_batches(batch_size=batch_size, columns=columns):
+                    yield batch.to_pylist()
+        finally:
+            for fh in handles:
+                fh.close()
+
+    def compact(self):
+        """Merge all part files into one; return the number of parts merged."""
+        with self._lock:
+            return self._compact()
+
+    def _compact(self):
+        parts = self._parts()
+        if len(parts) < 2:
+            return len(parts)
+        number = self._state["parts"] + 1
+        path = self._part_path(number)
+        pd.read_parquet(parts).to_parquet(path + ".tmp", index=False)
+        # Save the new base before the merged part appears, so no reader
+        # lists the merged part alongside the parts it replaces.
+        self._state["parts"] = self._state["base"] = number
+        self._save_state()
+        os.replace(path + ".tmp", path)
+        for path in parts:
+            os.remove(path)
+        return len(parts)
+
+
+def _empty_frame(columns=None):
+    dtypes = {"row": "int64", "timestamp": "datetime64[ns]"}
+    return pd.DataFrame({
+        name: pd.Series(dtype=dtypes.get(name, "object")) for name in columns or COLUMNS
+    })
+
+
+def parse_rows(rows, positions):
+    """Parse raw worksheet rows at log ``positions`` into the cache schema,
+    dropping headers."""
+    padded = [list(r[:6]) + [""] * (6 - len(r[:6])) for r in rows]
+    raw = pd.DataFrame(padded, columns=["ts", "email", "role", "completed", "missing", "event_id"])
+    timestamps = pd.to_datetime(raw["ts"], format=TIMESTAMP_FORMAT, errors="coerce")
+    completed, missing = [], []
+    for role, c, m in zip(raw["role"], raw["completed"], raw["missing"]):
+        try:
+            skills = decode_skills(role, c, m)
+        except ValueError:
+            # Compact row from a catalog version this checkout does not know.
+            skills = (), ()
+        completed.append(list(skills[0]))
+        missing.append(list(skills[1]))
+    frame = pd.DataFrame({
+        "row": pd.array(positions, dtype="int64"),
+        "timestamp": timestamps,
+        "email": raw["email"],
+        "role": raw["role"],
+        "completed": completed,
+        "missing": missing,
+        # The outbox writes its idempotency key in column F.
+        "event_id": raw["event_id"],
+    })
+    return frame[frame["timestamp"].notna()].reset_index(drop=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sync the progress sheet into a local Parquet cache.")
+    parser.add_argument("--dir", default=DEFAULT_DIR)
+    parser.add_argument("--credentials", help="service account JSON file (default: $GCP_CREDENTIALS)")
+    parser.add_argument("--compact", action="store_true", help="merge part files after syncing")
+    args = parser.parse_args(argv)
+
+    from sheets_connection import SheetsConnection, load_credentials
+
+    sync = SheetSync(SheetsConnection(load_credentials(args.credentials)).run, args.dir)
+    print(f"synced {sync.sync()} rows; cursor at {sync.cursor}")
+    if args.compact:
+        print(f"compacted {sync.compact()} parts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Process-wide Google Sheets connection.  Streamlit re-executes ``app.py`` on
+every widget interaction, so authorising gspread and opening the progress
+spreadsheet at the top of the script cost an OAuth token exchange and a
+metadata fetch per click.  ``SheetsConnection`` builds the authorised client
+and worksheet handle once, shares them between sessions behind a lock,
+re-authorises shortly before the access token expires and reconnects lazily
+after a call fails on authentication or transport.  With a
+``quota_client.QuotaClient`` every request made through ``run`` is paced to
+the Sheets quota and retried when throttled.
+"""
+
+import json
+import os
+import threading
+import time
+
+import rerun_metrics
+from quota_client import INTERACTIVE, status_of
+
+# Scopes and spreadsheet used by the app for progress records.
+SCOPE = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
+SHEET_URL = "https://docs.google.com/spreadsheets/d/13W17_W3rSIvWCSuYDLo-RX__y365UA7SECB5vOTZ9xs/edit?usp=sharing"
+
+# Re-authorise this many seconds before the access token expires so that no
+# request is ever sent with a token that lapses mid-flight.
+REFRESH_MARGIN = 300
+
+
+def load_credentials(path=None):
+    """Return the service account info as a dict.
+
+    Command line tools run outside Streamlit, so credentials come from a JSON
+    key file or from the ``GCP_CREDENTIALS`` environment variable holding the
+    same JSON string that the app keeps in ``st.secrets``.
+    """
+    if path:
+        with open(path, encoding="utf-8") as fh:
+            return json.load(fh)
+    raw = os.environ.get("GCP_CREDENTIALS")
+    if not raw:
+        raise RuntimeError("Pass a credentials file or set GCP_CREDENTIALS.")
+    return json.loads(raw)
+
+
+def authorize(creds_dict):
+    """Authorise a gspread client and return ``(client, expires_in)``."""
+    from oauth2client.service_account import ServiceAccountCredentials
+    import gspread
+
+    creds = ServiceAccountCredentials.from_json_keyfile_dict(creds_dict, SCOPE)
+    # Fetch the token eagerly so its lifetime is known up front.
+    token = creds.get_access_token()
+    return gspread.authorize(creds), token.expires_in
+
+
+def needs_reconnect(exc):
+    """Whether ``exc`` may have left the cached handle unusable.
+
+    That is a rejected or expired token (401, a failed token refresh) or a
+    broken connection.  Quota errors (429) and other API errors leave the
+    handle intact.
+    """
+    status = status_of(exc)
+    if status is not None:
+        return status == 401
+    # oauth2client's AccessTokenRefreshError, google-auth's RefreshError.
+    if type(exc).__name__.endswith("RefreshError"):
+        return True
+    # Resets, timeouts and requests' ConnectionError are all OSErrors.
+    return isinstance(exc, OSError)
+
+
+class SheetsConnection:
+    """Shared, thread-safe handle on the progress worksheet.
+
+    ``authorize`` is any callable returning ``(client, expires_in)``; it
+    defaults to the service account flow above and can be swapped for an
+    offline client.  ``worksheet()`` returns the cached handle, rebuilding it
+    when the token is about to expire or after ``invalidate()``.
+    """
+
+    def __init__(self, creds_dict, url=SHEET_URL, authorize=authorize,
+                 refresh_margin=REFRESH_MARGIN, clock=time.monotonic, quota=None):
+        self._creds_dict = creds_dict
+        self._quota = quota
+        self._url = url
+        self._authorize = authorize
+        self._refresh_margin = refresh_margin
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._client = None
+        self._spreadsheet = None
+        self._worksheet = None
+        self._expires_at = 0.0
+
+    def _stale(self):
+        return self._worksheet is None or self._clock() >= self._expires_at - self._refresh_margin
+
+    def _connect(self):
+        client, expires_in = self._authorize(self._creds_dict)
+        spreadsheet = client.open_by_url(self._url)
+        self._client = client
+        self._spreadsheet = spreadsheet
+        self._worksheet = spreadsheet.sheet1
+        # Tokens without an expiry (offline clients) never need refreshing.
+        lifetime = expires_in if expires_in is not None else float("inf")
+        self._expires_at = self._clock() + lifetime
+
+    def spreadsheet(self):
+        """Return the spreadsheet, connecting or refreshing if required."""
+        with self._lock:
+            if self._stale():
+                self._connect()
+            return self._spreadsheet
+
+    def worksheet(self):
+        """Return the progress worksheet, connecting or refreshing if required."""
+        with self._lock:
+            if self._stale():
+                self._connect()
+            return self._worksheet
+
+    def invalidate(self):
+        """Drop the cached handle so the next call reconnects."""
+        with self._lock:
+            self._client = None
+            self._spreadsheet = None
+            self._worksheet = None
+            self._expires_at = 0.0
+
+    def run(self, fn, priority=INTERACTIVE):
+        """Call ``fn(worksheet)``; on failure re-raise, dropping the handle
+        first if ``needs_reconnect`` says the failure may have broken it.
+
+        ``priority`` orders the call's requests when the quota is exhausted;
+        background work passes ``quota_client.BACKGROUND``.
+        """
+        rerun_metrics.inc("sheets_requests_total")
+        try:
+            ws = self.worksheet()
+            return fn(ws if self._quota is None else self._quota.wrap(ws, priority))
+        except Exception as exc:
+            rerun_metrics.inc("sheets_failures_total")
+            if needs_reconnect(exc):
+                self.invalidate()
+            raise
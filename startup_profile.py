@@ -0,0 +1,107 @@
+"""
+Cold-start profile of ``app.py``.  Starts a fresh interpreter with
+``python -X importtime``, drives the first reruns of a new session through
+Streamlit's ``AppTest`` runner (the email prompt, entering an email, picking a
+role) against the Sheets emulator, and reports:
+
+* the slowest top-level imports, by cumulative import time;
+* wall time of each of the first reruns;
+* the ``rerun_metrics`` section timings recorded during those reruns.
+
+Imports made by the ``AppTest`` harness itself show up as ``streamlit.*``
+entries.  Use it to check that a replica becomes ready quickly:
+
+    python startup_profile.py --top 15
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+_IMPORTTIME_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def parse_importtime(text):
+    """Return ``[(cumulative_us, self_us, depth, module)]`` from ``-X importtime`` output."""
+    entries = []
+    for line in text.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((int(cumulative_us), int(self_us), (len(indent) - 1) // 2, module))
+    return entries
+
+
+def _profile_reruns(workdir):
+    """Run the first reruns of a session; return step timings and sections."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=60)
+    at.secrets["SHEETS_EMULATOR"] = True
+    at.secrets["PROGRESS_DB_PATH"] = os.path.join(workdir, "progress.db")
+    at.secrets["PROGRESS_OUTBOX_PATH"] = os.path.join(workdir, "outbox.db")
+    at.secrets["ANSWER_SPILL_PATH"] = os.path.join(workdir, "answer_spill.db")
+
+    steps = {}
+    for name, action in (
+        ("first_paint", lambda: at.run()),
+        ("enter_email", lambda: at.sidebar.text_input[0].input("profile@example.com").run()),
+        ("select_role", lambda: at.sidebar.selectbox[0].select("Data Analyst").run()),
+    ):
+        start = time.perf_counter()
+        action()
+        steps[name] = (time.perf_counter() - start) * 1000
+        if at.exception:
+            raise RuntimeError(f"{name} raised: {at.exception[0].message}")
+
+    import rerun_metrics
+
+    sections = {name: total * 1000 for name, (_, total) in rerun_metrics.metrics.snapshot().items()}
+    return {"steps": steps, "sections": sections}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile imports and first reruns of app.py.")
+    parser.add_argument("--top", type=int, default=15, help="number of imports to list")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        with tempfile.TemporaryDirectory() as workdir:
+            print(json.dumps(_profile_reruns(workdir)))
+        return 0
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child"],
+        capture_output=True, text=True, cwd=os.path.dirname(APP_PATH))
+    elapsed = (time.perf_counter() - started) * 1000
+    if proc.returncode:
+        sys.stderr.write(proc.stderr[-4000:])
+        return proc.returncode
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+
+    top_level = sorted((e for e in parse_importtime(proc.stderr) if e[2] == 0), reverse=True)
+    total_imports = sum(e[0] for e in top_level)
+    print(f"process wall time  {elapsed:9.1f} ms")
+    print(f"imports            {total_imports / 1000:9.1f} ms")
+    print(f"\n{'top-level import':40} {'cumulative_ms':>14} {'self_ms':>9}")
+    for cumulative, self_us, _, module in top_level[:args.top]:
+        print(f"{module:40} {cumulative / 1000:14.1f} {self_us / 1000:9.1f}")
+    print(f"\n{'rerun':40} {'wall_ms':>14}")
+    for name, ms in result["steps"].items():
+        print(f"{name:40} {ms:14.1f}")
+    print(f"\n{'section (all reruns)':40} {'total_ms':>14}")
+    for name, ms in sorted(result["sections"].items(), key=lambda item: -item[1]):
+        print(f"{name:40} {ms:14.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from fake_links import ETAG, LAST_MODIFIED, FakeLinkServer
+from link_checker import DEAD_AFTER, LinkChecker
+
+
+def check(paths, rounds=1, slow=0.5, latency=0.0, **options):
+    """Check ``paths`` on a fresh stub server ``rounds`` times, each round
+    seeded with the previous one's results.
+
+    Returns ``(server, [{path: result}, ...])``.
+    """
+    options.setdefault("timeout", 0.2)
+
+    async def run():
+        server = await FakeLinkServer(slow=slow, latency=latency).start()
+        checker = LinkChecker(**options)
+        urls = [server.base + path for path in paths]
+        results, previous = [], None
+        try:
+            for _ in range(rounds):
+                previous = await checker.check(urls, previous)
+                results.append({url[len(server.base):]: entry for url, entry in previous.items()})
+        finally:
+            await server.close()
+        return server, results
+
+    return asyncio.run(run())
+
+
+def test_ok_records_validators_and_304_keeps_them():
+    server, (first, second) = check(["/ok/a"], rounds=2)
+    assert first["/ok/a"]["state"] == "ok"
+    assert first["/ok/a"]["status"] == 200
+    assert (first["/ok/a"]["etag"], first["/ok/a"]["last_modified"]) == (ETAG, LAST_MODIFIED)
+    assert second["/ok/a"]["status"] == 304
+    assert second["/ok/a"]["state"] == "ok" and not second["/ok/a"]["dead"]
+    assert (second["/ok/a"]["etag"], second["/ok/a"]["last_modified"]) == (ETAG, LAST_MODIFIED)
+
+
+@pytest.mark.parametrize("path, status", [("/missing/a", 404), ("/gone/a", 410)])
+def test_not_found_and_gone_are_dead_at_once(path, status):
+    _, (result,) = check([path])
+    assert result[path]["status"] == status
+    assert result[path]["state"] == "dead" and result[path]["dead"]
+
+
+def test_forbidden_is_blocked_not_dead():
+    _, results = check(["/forbidden/a"], rounds=DEAD_AFTER + 1)
+    for result in results:
+        assert result["/forbidden/a"]["state"] == "blocked"
+        assert not result["/forbidden/a"]["dead"]
+        assert result["/forbidden/a"]["failures"] == 0
+
+
+@pytest.mark.parametrize("path", ["/error/a", "/slow/a"])
+def test_server_errors_and_timeouts_are_dead_after_repeated_failures(path):
+    _, results = check([path], rounds=DEAD_AFTER)
+    for number, result in enumerate(results, start=1):
+        assert result[path]["state"] == "error"
+        assert result[path]["failures"] == number
+        assert result[path]["dead"] == (number >= DEAD_AFTER)
+
+
+def test_redirects_are_followed_up_to_the_cap():
+    server, (result,) = check(["/redirect/3/a", "/redirect/6/b"], max_redirects=5)
+    assert result["/redirect/3/a"]["state"] == "ok"
+    assert result["/redirect/3/a"]["final_url"] == server.base + "/ok/a"
+    assert result["/redirect/6/b"]["state"] == "error"
+    assert server.requests["/ok/b"] == 0
+
+
+def test_per_host_limit_bounds_requests_in_flight():
+    paths = [f"/ok/{i}" for i in range(40)]
+    server, (result,) = check(paths, latency=0.02, per_host=3, concurrency=50, timeout=5.0)
+    assert all(entry["state"] == "ok" for entry in result.values())
+    assert server.max_in_flight == 3
@@ -0,0 +1,120 @@
+import pytest
+
+import fake_sheets
+from progress_outbox import Outbox, OutboxReplayer
+from sheets_connection import SheetsConnection
+
+
+@pytest.fixture
+def server():
+    return fake_sheets.FakeSheetsServer(read_quota=None, write_quota=None)
+
+
+@pytest.fixture
+def sheets(server):
+    return SheetsConnection({}, authorize=lambda creds: (fake_sheets.FakeClient(server), None))
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    yield outbox
+    outbox.close()
+
+
+class LostReply:
+    """``run`` whose next ``lose`` calls reach the sheet and then raise."""
+
+    def __init__(self, sheets):
+        self.sheets = sheets
+        self.lose = 0
+
+    def __call__(self, fn):
+        def call(ws):
+            result = fn(ws)
+            if self.lose:
+                self.lose -= 1
+                raise TimeoutError("reply lost")
+            return result
+        return self.sheets.run(call)
+
+
+def row(number):
+    return ["2025-01-01 00:00:00", f"user{number}@example.com", "Tester", "", ""]
+
+
+def event_ids(sheets):
+    return sheets.run(lambda ws: ws.col_values(6))
+
+
+def test_replay_after_partial_append_reads_only_new_rows(server, sheets, outbox):
+    run = LostReply(sheets)
+    replayer = OutboxReplayer(outbox, run, batch_size=3)
+    for number in range(3):
+        outbox.append(row(number))
+    assert replayer.replay_batch() == 3
+
+    for number in range(3, 6):
+        outbox.append(row(number))
+    run.lose = 1
+    with pytest.raises(TimeoutError):
+        replayer.replay_batch()
+    assert outbox.pending_count() == 3
+
+    server.reset_stats()
+    assert replayer.replay_batch() == 3
+    assert server.stats["calls"]["col_values"] == 0
+    assert server.stats["calls"]["batch_get"] == 1
+    assert server.stats["calls"]["append_rows"] == 0
+    assert outbox.pending_count() == 0
+    ids = event_ids(sheets)
+    assert len(ids) == len(set(ids)) == 6
+
+
+def test_replay_without_a_known_position_checks_the_whole_column(server, sheets, outbox):
+    run = LostReply(sheets)
+    replayer = OutboxReplayer(outbox, run)
+    outbox.append(row(0))
+    run.lose = 1
+    with pytest.raises(TimeoutError):
+        replayer.replay_batch()
+
+    server.reset_stats()
+    assert replayer.replay_batch() == 1
+    assert server.stats["calls"]["col_values"] == 1
+    assert len(event_ids(sheets)) == 1
+
+
+def test_replay_after_compaction_moved_the_rows(sheets, outbox):
+    run = LostReply(sheets)
+    replayer = OutboxReplayer(outbox, run, batch_size=3)
+    for number in range(3):
+        outbox.append(row(number))
+    replayer.replay_batch()
+    for number in range(3, 6):
+        outbox.append(row(number))
+    run.lose = 1
+    with pytest.raises(TimeoutError):
+        replayer.replay_batch()
+
+    # Compaction deletes two rows and records them in H1.
+    sheets.run(lambda ws: ws.delete_rows(1, 2))
+    sheets.run(lambda ws: ws.update(range_name="H1:I1", values=[["2", ""]]))
+    assert replayer.replay_batch() == 3
+    ids = event_ids(sheets)
+    assert len(ids) == len(set(ids)) == 4
+
+
+def test_rate_limited_batch_is_retried(server, sheets, outbox):
+    replayer = OutboxReplayer(outbox, sheets.run)
+    for number in range(4):
+        outbox.append(row(number))
+    server.fail_next(429, count=2)
+    for _ in range(2):
+        with pytest.raises(Exception) as info:
+            replayer.replay_batch()
+        assert info.value.response.status_code == 429
+    assert outbox.pending_count() == 4
+    assert replayer.replay_batch() == 4
+    assert outbox.pending_count() == 0
+    assert len(event_ids(sheets)) == 4
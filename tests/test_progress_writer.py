@@ -0,0 +1,111 @@
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+import fake_sheets
+from progress_log import ProgressRecord
+from progress_outbox import Outbox, OutboxReplayer
+from progress_writer import ProgressWriter
+from sheets_connection import SheetsConnection
+
+
+def record(email, *completed):
+    return ProgressRecord(datetime(2025, 1, 1), email, "Tester", completed, ())
+
+
+@pytest.fixture
+def outbox(tmp_path):
+    outbox = Outbox(str(tmp_path / "outbox.db"))
+    yield outbox
+    outbox.close()
+
+
+class FlakyReplayer:
+    """Replayer stand-in that fails ``failures`` times, recording each call."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = []
+
+    def replay(self):
+        self.calls.append(time.monotonic())
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("sheet unavailable")
+
+
+def test_rate_limited_replays_are_retried_until_delivered(outbox):
+    server = fake_sheets.FakeSheetsServer(read_quota=None, write_quota=None)
+    sheets = SheetsConnection({}, authorize=lambda creds: (fake_sheets.FakeClient(server), None))
+    sheets.run(lambda ws: ws)
+    server.fail_next(429, count=2)
+    writer = ProgressWriter(outbox, OutboxReplayer(outbox, sheets.run), batch_size=3,
+                            flush_interval=0.05, max_backoff=0.05)
+    try:
+        for number in range(3):
+            assert writer.submit(record(f"user{number}@example.com", "python"))
+        assert writer.flush(timeout=5.0)
+    finally:
+        writer.close()
+    assert server.stats["errors"][429] == 2
+    ids = sheets.run(lambda ws: ws.col_values(6))
+    assert len(ids) == len(set(ids)) == 3
+
+
+def test_backoff_is_kept_when_full_batches_wake_the_writer(outbox):
+    replayer = FlakyReplayer(failures=1)
+    writer = ProgressWriter(outbox, replayer, batch_size=1, flush_interval=10.0, max_backoff=0.3)
+    try:
+        writer.submit(record("a@example.com", "python"))
+        deadline = time.monotonic() + 2.0
+        while not replayer.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        for number in range(5):
+            writer.submit(record(f"user{number}@example.com", "python"))
+        while len(replayer.calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        writer.close(timeout=0.1)
+    assert len(replayer.calls) >= 2
+    assert replayer.calls[1] - replayer.calls[0] >= 0.3
+
+
+def test_duplicate_states_are_dropped_for_recent_users_only(outbox):
+    writer = ProgressWriter(outbox, FlakyReplayer(), flush_interval=10.0, max_states=2)
+    try:
+        assert writer.submit(record("a@example.com", "python"))
+        assert not writer.submit(record("a@example.com", "python"))
+        assert writer.submit(record("a@example.com", "python", "sql"))
+        assert writer.submit(record("b@example.com", "python"))
+        # Touching "a" keeps it; "b" is now the least recently active.
+        assert not writer.submit(record("a@example.com", "sql", "python"))
+        assert writer.submit(record("c@example.com", "python"))
+        assert writer.submit(record("b@example.com", "python"))
+        assert not writer.submit(record("c@example.com", "python"))
+    finally:
+        writer.close(timeout=0.1)
+    assert outbox.pending_count() == 5
+
+
+def test_failed_outbox_append_is_not_remembered(outbox):
+    writer = ProgressWriter(outbox, FlakyReplayer(), flush_interval=10.0)
+    append = outbox.append
+    failing = threading.Event()
+    failing.set()
+
+    def flaky_append(row, event_id=None):
+        if failing.is_set():
+            failing.clear()
+            raise OSError("disk full")
+        return append(row, event_id)
+
+    outbox.append = flaky_append
+    try:
+        with pytest.raises(OSError):
+            writer.submit(record("a@example.com", "python"))
+        assert writer.submit(record("a@example.com", "python"))
+    finally:
+        writer.close(timeout=0.1)
+    assert outbox.pending_count() == 1
@@ -0,0 +1,283 @@
+"""
+Shared write aggregator for deployments running several app processes.  When
+each Streamlit process replays its own outbox, the processes compete for the
+same sheet quota and their batches interleave.  The aggregator is a small
+local daemon that owns the only ``ProgressWriter`` (and so the only outbox,
+dedupe map and ``QuotaClient``) for the host; app processes send it progress
+events over a Unix socket or localhost TCP instead.  Batching, ordering and
+rate limiting then happen in one place, and adding app processes adds
+throughput instead of 429s.
+
+The protocol is newline-delimited JSON, one request and one reply per line:
+
+    {"op": "submit", "record": {...}, "event_id": "..."}
+                                       ->  {"ok": true, "accepted": true}
+    {"op": "seed", "record": {...}}    ->  {"ok": true}
+    {"op": "stats"}                    ->  {"ok": true, "pending": 0, ...}
+
+An event is acknowledged once it is in the daemon's outbox.  The client picks
+each event's idempotency key, so an event sent twice is stored once.  When
+the daemon cannot be reached, ``AggregatorClient`` falls back to a
+process-local writer so no event is lost, and tries the daemon again after
+``retry_after`` seconds.  An event whose reply times out after it was sent
+may already be queued by the daemon, so it is not written locally as well.  Start the daemon with
+
+    python write_aggregator.py --listen unix:/run/progress.sock
+
+and point the app at it with ``PROGRESS_AGGREGATOR = "unix:/run/progress.sock"``.
+"""
+
+import argparse
+import functools
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import rerun_metrics
+from progress_log import TIMESTAMP_FORMAT, ProgressRecord
+
+DEFAULT_ADDRESS = "unix:progress_aggregator.sock"
+# Reply of ``AggregatorClient._request`` for a request sent but not answered.
+UNCONFIRMED = {"ok": True}
+
+
+def parse_address(text):
+    """Return ``(family, address)`` for "unix:PATH", "tcp:HOST:PORT" or "HOST:PORT"."""
+    if text.startswith("unix:"):
+        return socket.AF_UNIX, text[len("unix:"):]
+    host, _, port = text[len("tcp:"):].rpartition(":") if text.startswith("tcp:") else text.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f"invalid aggregator address {text!r}")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+def _encode(record):
+    return {
+        "timestamp": record.timestamp.strftime(TIMESTAMP_FORMAT),
+        "email": record.email,
+        "role": record.role,
+        "completed": list(record.completed),
+        "missing": list(record.missing),
+    }
+
+
+def _decode(data):
+    return ProgressRecord(datetime.strptime(data["timestamp"], TIMESTAMP_FORMAT), data["email"],
+                          data["role"], tuple(data["completed"]), tuple(data["missing"]))
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            try:
+                reply = self.server.dispatch(json.loads(line))
+            except Exception as exc:
+                reply = {"ok": False, "error": repr(exc)}
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _ServerMixin(socketserver.ThreadingMixIn):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def dispatch(self, message):
+        op = message.get("op")
+        if op == "submit":
+            accepted = self.writer.submit(_decode(message["record"]), message.get("event_id"))
+            rerun_metrics.inc("aggregator_events_total", result="accepted" if accepted else "duplicate")
+            return {"ok": True, "accepted": accepted}
+        if op == "seed":
+            self.writer.seed(_decode(message["record"]))
+            return {"ok": True}
+        if op == "stats":
+            return {"ok": True, "pending": self.writer.pending()}
+        raise ValueError(f"unknown op {op!r}")
+
+
+class _UnixServer(_ServerMixin, socketserver.UnixStreamServer):
+    pass
+
+
+class _TCPServer(_ServerMixin, socketserver.TCPServer):
+    pass
+
+
+def make_server(address, writer):
+    """Bind the aggregator to ``address``; call ``serve_forever()`` to run it."""
+    family, addr = parse_address(address)
+    if family == socket.AF_UNIX and os.path.exists(addr):
+        os.unlink(addr)
+    server = (_UnixServer if family == socket.AF_UNIX else _TCPServer)(addr, _Handler)
+    server.writer = writer
+    return server
+
+
+class AggregatorClient:
+    """``ProgressWriter`` stand-in that forwards events to the aggregator.
+
+    ``fallback`` is a zero-argument callable returning a local
+    ``ProgressWriter``; it is only called once the daemon is unreachable.
+    Requests run on the render path, so a daemon that does not answer
+    within ``timeout`` seconds is treated as unreachable at once.
+    """
+
+    def __init__(self, address, fallback, timeout=0.25, retry_after=5.0, clock=time.monotonic):
+        self._family, self._address = parse_address(address)
+        self._fallback_factory = fallback
+        self._fallback = None
+        self._timeout = timeout
+        self._retry_after = retry_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sock = None
+        self._reader = None
+        self._down_until = 0.0
+
+    def _connect(self):
+        sock = socket.socket(self._family, socket.SOCK_STREAM)
+        sock.settimeout(self._timeout)
+        try:
+            sock.connect(self._address)
+        except OSError:
+            sock.close()
+            raise
+        self._sock, self._reader = sock, sock.makefile("rb")
+
+    def _disconnect(self):
+        if self._sock is not None:
+            self._reader.close()
+            self._sock.close()
+        self._sock = self._reader = None
+
+    def _request(self, message):
+        """Send ``message`` and return the reply, or None if the daemon is down.
+
+        Returns ``UNCONFIRMED`` if the message was sent but the reply timed out.
+        """
+        with self._lock:
+            if self._clock() < self._down_until:
+                return None
+            sent = False
+            # A kept-alive connection may have been closed by a daemon
+            # restart, so a request that fails on one is retried once on a
+            # new connection.  A timeout is never retried.
+            for _ in range(2):
+                reused = self._sock is not None
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    self._sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+                    sent = True
+                    line = self._reader.readline()
+                    if not line:
+                        raise ConnectionError("aggregator closed the connection")
+                    reply = json.loads(line)
+                    if not reply.get("ok"):
+                        raise RuntimeError(reply.get("error"))
+                    return reply
+                except TimeoutError:
+                    self._disconnect()
+                    if sent:
+                        # The daemon may have queued the event; its outcome is unknown.
+                        self._down_until = self._clock() + self._retry_after
+                        return UNCONFIRMED
+                    break
+                except (OSError, ValueError, RuntimeError):
+                    self._disconnect()
+                    if not reused:
+                        break
+            self._down_until = self._clock() + self._retry_after
+            return None
+
+    def _local(self):
+        with self._lock:
+            if self._fallback is None:
+                self._fallback = self._fallback_factory()
+            return self._fallback
+
+    def submit(self, record):
+        event_id = uuid.uuid4().hex
+        reply = self._request({"op": "submit", "record": _encode(record), "event_id": event_id})
+        if reply is UNCONFIRMED:
+            rerun_metrics.inc("aggregator_unconfirmed_total")
+            return True
+        if reply is not None:
+            return reply["accepted"]
+        rerun_metrics.inc("aggregator_fallbacks_total")
+        return self._local().submit(record, event_id)
+
+    def seed(self, record):
+        self._request({"op": "seed", "record": _encode(record)})
+        if self._fallback is not None:
+            self._fallback.seed(record)
+
+    def pending(self):
+        return self._fallback.pending() if self._fallback is not None else 0
+
+    def flush(self, timeout=None):
+        return self._fallback.flush(timeout) if self._fallback is not None else True
+
+    def close(self, timeout=10.0):
+        with self._lock:
+            self._disconnect()
+        if self._fallback is not None:
+            self._fallback.close(timeout)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the shared progress write aggregator.")
+    parser.add_argument("--listen", default=DEFAULT_ADDRESS,
+                        help="unix:PATH or [tcp:]HOST:PORT (default: %(default)s)")
+    parser.add_argument("--outbox", default="aggregator_outbox.db")
+    parser.add_argument("--credentials", help="service account JSON file (default: $GCP_CREDENTIALS)")
+    parser.add_argument("--emulator", action="store_true", help="write to the in-process fake sheet")
+    parser.add_argument("--read-quota", type=int, default=60, help="read requests per minute")
+    parser.add_argument("--write-quota", type=int, default=60, help="write requests per minute")
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--flush-interval", type=float, default=2.0)
+    parser.add_argument("--metrics-port", type=int)
+    parser.add_argument("--metrics-host", default=rerun_metrics.DEFAULT_HOST,
+                        help="interface for the metrics endpoint (default: localhost only)")
+    args = parser.parse_args(argv)
+
+    from progress_outbox import Outbox, OutboxReplayer
+    from progress_writer import ProgressWriter
+    from quota_client import BACKGROUND, QuotaClient
+    from sheets_connection import SheetsConnection, load_credentials
+
+    quota = QuotaClient(read_quota=args.read_quota, write_quota=args.write_quota)
+    if args.emulator:
+        import fake_sheets
+
+        sheets = SheetsConnection({}, authorize=fake_sheets.authorize, quota=quota)
+    else:
+        sheets = SheetsConnection(load_credentials(args.credentials), quota=quota)
+    outbox = Outbox(args.outbox)
+    replayer = OutboxReplayer(outbox, functools.partial(sheets.run, priority=BACKGROUND),
+                              batch_size=args.batch_size)
+    writer = ProgressWriter(outbox, replayer, batch_size=args.batch_size,
+                            flush_interval=args.flush_interval)
+    if args.metrics_port:
+        rerun_metrics.serve(args.metrics_port, host=args.metrics_host)
+
+    server = make_server(args.listen, writer)
+    print(f"aggregator listening on {args.listen}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        writer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())